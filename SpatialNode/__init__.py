@@ -6,6 +6,8 @@
 
 __version__ = "0.0.1"
 
+import importlib
+
 from .definitions import (
     NodeRole,
     NodeFlag,
@@ -35,24 +37,85 @@ from .connection_id_utils import (
     fromJson,
 )
 
-from .abstract_graph_model import AbstractGraphModel
-from .abstract_node_geometry import AbstractNodeGeometry
-from .abstract_node_painter import AbstractNodePainter
-
-from .basic_graphics_scene import BasicGraphicsScene
-from .connection_graphics_object import ConnectionGraphicsObject
-from .connection_state import ConnectionState
-from .connection_style import ConnectionStyle
-from .data_flow_graph_model import DataFlowGraphModel, NodeGeometryData
-from .data_flow_graphics_scene import DataFlowGraphicsScene
-from .default_node_painter import DefaultNodePainter
-from .graphics_view import GraphicsView
-from .graphics_view_style import GraphicsViewStyle
-from .locate_node import locateNodeAt
-from .node_data import NodeData, NodeDataType
-from .node_delegate_model import NodeDelegateModel
-from .node_delegate_model_registry import NodeDelegateModelRegistry
-from .node_graphics_object import NodeGraphicsObject
-from .node_state import NodeState
-from .node_style import NodeStyle
-from .style_collection import StyleCollection
+# everything else is imported on first access, so that scripts which only
+# need the models do not load the widgets, the painters and the resources
+_LAZY_ATTRIBUTES = {
+    "AbstractGraphModel": ".abstract_graph_model",
+    "AbstractNodeGeometry": ".abstract_node_geometry",
+    "AbstractNodePainter": ".abstract_node_painter",
+    "AsyncNodeDelegateModel": ".async_node_delegate_model",
+    "BasicGraphicsScene": ".basic_graphics_scene",
+    "BatchColumn": ".batch_column",
+    "BinaryScene": ".scene_binary_format",
+    "ConnectionGraphicsObject": ".connection_graphics_object",
+    "ConnectionLayer": ".connection_layer",
+    "ConnectionState": ".connection_state",
+    "ConnectionStyle": ".connection_style",
+    "CoreGraphModel": ".core_graph_model",
+    "CoreGraphModelAdapter": ".core_graph_model_adapter",
+    "CoreNodeDelegate": ".core_node_delegate",
+    "CoreSignal": ".core_signal",
+    "DataFlowGraphModel": ".data_flow_graph_model",
+    "NodeGeometryData": ".data_flow_graph_model",
+    "DataFlowGraphicsScene": ".data_flow_graphics_scene",
+    "DefaultNodePainter": ".default_node_painter",
+    "ExecutionPlan": ".execution_plan",
+    "GraphChangeSet": ".graph_change_set",
+    "GraphicsView": ".graphics_view",
+    "GraphicsViewStyle": ".graphics_view_style",
+    "LazyNodeDelegate": ".lazy_node_delegate",
+    "locateNodeAt": ".locate_node",
+    "NodeData": ".node_data",
+    "NodeDataType": ".node_data",
+    "NodeDelegateModel": ".node_delegate_model",
+    "NodeDelegateModelRegistry": ".node_delegate_model_registry",
+    "NodeGraphicsObject": ".node_graphics_object",
+    "NodeState": ".node_state",
+    "NodeStyle": ".node_style",
+    "ProcessPoolGraphExecutor": ".process_pool_graph_executor",
+    "PropagationScheduler": ".propagation_scheduler",
+    "SceneStreamReader": ".scene_stream_reader",
+    "StyleCollection": ".style_collection",
+    "TopologicalOrder": ".topological_order",
+}
+
+__all__ = [
+    "NodeRole",
+    "NodeFlag",
+    "PortRole",
+    "ConnectionPolicy",
+    "PortType",
+    "PortCount",
+    "PortIndex",
+    "NodeId",
+    "InvalidPortIndex",
+    "InvalidNodeId",
+    "ConnectionId",
+    "invertConnection",
+    "QJsonObject",
+    "getNodeId",
+    "getPortIndex",
+    "oppositePort",
+    "isPortIndexValid",
+    "isPortTypeValid",
+    "makeIncompleteConnectionId",
+    "makeIncompleteConnectionIdFromComplete",
+    "makeCompleteConnectionId",
+    "toJson",
+    "fromJson",
+    *_LAZY_ATTRIBUTES,
+]
+
+
+def __getattr__(name):
+    moduleName = _LAZY_ATTRIBUTES.get(name)
+    if moduleName is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(moduleName, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -5,9 +5,12 @@
 #  property of any third parties.
 
 from abc import abstractmethod
+from contextlib import contextmanager
 
 from PySide6 import QtCore
 
+_StyleCollection = None
+
 
 class AbstractGraphModel(QtCore.QObject):
     def __init__(self):
@@ -15,6 +18,13 @@ class AbstractGraphModel(QtCore.QObject):
 
         super().__init__()
         self._shiftedByDynamicPortsConnections: list[ConnectionId] = []
+        self._batchDepth = 0
+        self._pendingChanges = None
+        self._nodeStyles = {}
+
+        self.nodeUpdated.connect(self._forgetNodeStyle)
+        self.nodeDeleted.connect(self._forgetNodeStyle)
+        self.modelReset.connect(self._nodeStyles.clear)
 
     @abstractmethod
     def newNodeId(self): ...
@@ -49,6 +59,33 @@ class AbstractGraphModel(QtCore.QObject):
     @abstractmethod
     def nodeData(self, nodeId, role): ...
 
+    def isMaterialized(self, nodeId) -> bool:
+        return True
+
+    def nodeStyle(self, nodeId):
+        global _StyleCollection
+
+        if _StyleCollection is None:
+            from SpatialNode.style_collection import StyleCollection
+
+            _StyleCollection = StyleCollection
+
+        # the style json is only resolved again after the node is updated or
+        # the collection style changes
+        version = _StyleCollection.nodeStyleVersion()
+        cached = self._nodeStyles.get(nodeId)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        from SpatialNode.definitions import NodeRole
+
+        style = _StyleCollection.resolveNodeStyle(self.nodeData(nodeId, NodeRole.Style))
+        self._nodeStyles[nodeId] = (version, style)
+        return style
+
+    def _forgetNodeStyle(self, nodeId):
+        self._nodeStyles.pop(nodeId, None)
+
     def nodeFlags(self, node_id):
         from SpatialNode.definitions import NodeFlag
 
@@ -156,6 +193,73 @@ class AbstractGraphModel(QtCore.QObject):
             self.addConnection(connectionId)
         self._shiftedByDynamicPortsConnections.clear()
 
+    def beginBatch(self):
+        from SpatialNode.graph_change_set import GraphChangeSet
+
+        if self._batchDepth == 0:
+            self._pendingChanges = GraphChangeSet()
+        self._batchDepth += 1
+
+    def endBatch(self):
+        if self._batchDepth == 0:
+            return
+
+        self._batchDepth -= 1
+        if self._batchDepth == 0:
+            changes = self._pendingChanges
+            self._pendingChanges = None
+            if not changes.isEmpty():
+                self.graphChanged.emit(changes)
+
+    @contextmanager
+    def batch(self):
+        self.beginBatch()
+        try:
+            yield self
+        finally:
+            self.endBatch()
+
+    def isBatching(self):
+        return self._batchDepth > 0
+
+    def notifyNodeCreated(self, nodeId):
+        if self._pendingChanges is None:
+            self.nodeCreated.emit(nodeId)
+        else:
+            self._pendingChanges.addNode(nodeId)
+
+    def notifyNodeDeleted(self, nodeId):
+        self._forgetNodeStyle(nodeId)
+        if self._pendingChanges is None:
+            self.nodeDeleted.emit(nodeId)
+        else:
+            self._pendingChanges.removeNode(nodeId)
+
+    def notifyNodeUpdated(self, nodeId):
+        self._forgetNodeStyle(nodeId)
+        if self._pendingChanges is None:
+            self.nodeUpdated.emit(nodeId)
+        else:
+            self._pendingChanges.updateNode(nodeId)
+
+    def notifyNodePositionUpdated(self, nodeId):
+        if self._pendingChanges is None:
+            self.nodePositionUpdated.emit(nodeId)
+        else:
+            self._pendingChanges.moveNode(nodeId)
+
+    def notifyConnectionCreated(self, connectionId):
+        if self._pendingChanges is None:
+            self.connectionCreated.emit(connectionId)
+        else:
+            self._pendingChanges.addConnection(connectionId)
+
+    def notifyConnectionDeleted(self, connectionId):
+        if self._pendingChanges is None:
+            self.connectionDeleted.emit(connectionId)
+        else:
+            self._pendingChanges.removeConnection(connectionId)
+
     from SpatialNode.definitions import ConnectionId, NodeId
 
     connectionCreated = QtCore.Signal(ConnectionId)
@@ -173,3 +277,5 @@ class AbstractGraphModel(QtCore.QObject):
     nodePositionUpdated = QtCore.Signal(NodeId)
 
     modelReset = QtCore.Signal()
+
+    graphChanged = QtCore.Signal(object)
@@ -5,7 +5,8 @@
 #  property of any third parties.
 
 from abc import abstractmethod, ABC
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -19,6 +20,8 @@ from SpatialNode.definitions import (
     PortRole,
     QJsonObject,
 )
+from SpatialNode.graph_change_set import GraphChangeSet
+from SpatialNode.node_style import NodeStyle
 
 class AbstractGraphModel(QtCore.QObject, ABC):
     """
@@ -34,6 +37,9 @@ class AbstractGraphModel(QtCore.QObject, ABC):
 
     def __init__(self):
         self._shiftedByDynamicPortsConnections: list[ConnectionId] = []
+        self._batchDepth: int = None
+        self._pendingChanges: GraphChangeSet | None = None
+        self._nodeStyles: dict[NodeId, tuple[int, NodeStyle]] = None
         ...
 
     @abstractmethod
@@ -91,6 +97,14 @@ class AbstractGraphModel(QtCore.QObject, ABC):
         """
         ...
 
+    def isMaterialized(self, nodeId: NodeId) -> bool:
+        """
+        False while the delegate of `nodeId` is a stand-in, as for lazily
+        loaded nodes. `NodeRole.Widget` then only sizes the node and is not
+        embedded; `nodeUpdated` announces the real delegate.
+        """
+        ...
+
     @abstractmethod
     def addConnection(self, connectionId: ConnectionId) -> None:
         """
@@ -112,6 +126,22 @@ class AbstractGraphModel(QtCore.QObject, ABC):
         """
         ...
 
+    def nodeStyle(self, nodeId: NodeId) -> NodeStyle:
+        """
+        The resolved style of the node, for the painters. Resolves
+        `NodeRole.Style` through `StyleCollection.resolveNodeStyle`, so that
+        nodes with the same style share one read-only object; models which
+        hold `NodeStyle` objects return them directly.
+
+        The resolved style is kept per node until it is announced updated or
+        deleted, through `notifyNodeUpdated` and `notifyNodeDeleted`, batched
+        or not, or by emitting `nodeUpdated` and `nodeDeleted` directly. It is
+        also dropped when `StyleCollection.nodeStyleVersion` changes. A model
+        changing the style of a node must announce it.
+        """
+        ...
+
+    def _forgetNodeStyle(self, nodeId: NodeId) -> None: ...
     def nodeFlags(self, nodeId: NodeId) -> NodeFlag: ...
     @abstractmethod
     def setNodeData(self, nodeId: NodeId, role: NodeRole, value: Any) -> bool:
@@ -225,6 +255,50 @@ class AbstractGraphModel(QtCore.QObject, ABC):
         insertion. After that the node is updated.
         """
         ...
+
+    def beginBatch(self) -> None:
+        """
+        Opens a batch. Until the matching `endBatch()`, structural
+        notifications are accumulated in a `GraphChangeSet` instead of being
+        emitted one by one. Batches nest.
+        """
+        ...
+
+    def endBatch(self) -> None:
+        """
+        Closes a batch. Closing the outermost one emits `graphChanged` once
+        with the net changes, unless nothing changed.
+        """
+        ...
+
+    @contextmanager
+    def batch(self) -> Iterator["AbstractGraphModel"]:
+        """
+        Context manager wrapping `beginBatch()`/`endBatch()`:
+
+        ```
+        with model.batch():
+            for i in range(5000):
+                model.addNode("Source")
+        ```
+        """
+        ...
+
+    def isBatching(self) -> bool: ...
+    def notifyNodeCreated(self, nodeId: NodeId) -> None:
+        """
+        Emits `nodeCreated`, or records the creation if a batch is open. Derived
+        models should report structural changes through the `notify*` functions
+        so that they take part in batching.
+        """
+        ...
+
+    def notifyNodeDeleted(self, nodeId: NodeId) -> None: ...
+    def notifyNodeUpdated(self, nodeId: NodeId) -> None: ...
+    def notifyNodePositionUpdated(self, nodeId: NodeId) -> None: ...
+    def notifyConnectionCreated(self, connectionId: ConnectionId) -> None: ...
+    def notifyConnectionDeleted(self, connectionId: ConnectionId) -> None: ...
+
     connectionCreated: QtCore.Signal(ConnectionId)
 
     connectionDeleted: QtCore.Signal(ConnectionId)
@@ -240,3 +314,6 @@ class AbstractGraphModel(QtCore.QObject, ABC):
     nodePositionUpdated: QtCore.Signal(NodeId)
 
     modelReset: QtCore.Signal()
+
+    graphChanged: QtCore.Signal(GraphChangeSet)
+    """Emitted once per outermost batch with the accumulated changes."""
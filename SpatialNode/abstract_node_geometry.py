@@ -10,10 +10,56 @@ from abc import ABC, abstractmethod
 from PySide6 import QtCore
 
 
+class PortGrid:
+    __slots__ = ("x", "y", "dx", "dy", "count")
+
+    def __init__(self, x, y, dx, dy, count):
+        self.x = x
+        self.y = y
+        self.dx = dx
+        self.dy = dy
+        self.count = count
+
+    def portAt(self, point, tolerance):
+        from SpatialNode.definitions import InvalidPortIndex
+
+        if self.count == 0:
+            return InvalidPortIndex
+
+        px = point.x() - self.x
+        py = point.y() - self.y
+        stepSquared = self.dx * self.dx + self.dy * self.dy
+        portIndex = 0
+        if stepSquared > 0.0:
+            portIndex = round((px * self.dx + py * self.dy) / stepSquared)
+            portIndex = min(max(portIndex, 0), self.count - 1)
+
+        ex = px - portIndex * self.dx
+        ey = py - portIndex * self.dy
+        if ex * ex + ey * ey < tolerance * tolerance:
+            return portIndex
+        return InvalidPortIndex
+
+
+class NodeLayout:
+    def __init__(self, size, captionRect):
+        self.size = size
+        self.captionRect = captionRect
+        self.captionPosition = QtCore.QPointF()
+        self.portPositions = {}
+        self.portTextPositions = {}
+        self.portGrids = {}
+        self.widgetPosition = QtCore.QPointF()
+        self.resizeHandleRect = QtCore.QRect()
+
+
 class AbstractNodeGeometry(ABC):
     def __init__(self, graphModel):
         self._graphModel = graphModel
 
+    def invalidateLayout(self, nodeId):
+        pass
+
     def boundingRect(self, node_id):
         s = self.size(node_id)
         ratio = 0.20
@@ -52,10 +98,9 @@ class AbstractNodeGeometry(ABC):
     def widgetPosition(self, node_id): ...
 
     def checkPortHit(self, node_id, port_type, node_point):
-        from SpatialNode.style_collection import StyleCollection
         from SpatialNode.definitions import InvalidPortIndex, NodeRole, PortType
 
-        nodeStyle = StyleCollection.nodeStyle()
+        nodeStyle = self._graphModel.nodeStyle(node_id)
 
         result = InvalidPortIndex
 
@@ -63,6 +108,10 @@ class AbstractNodeGeometry(ABC):
             return result
 
         tolerance = 2.0 * nodeStyle.ConnectionPointDiameter
+        grid = self.portGrid(node_id, port_type)
+        if grid is not None:
+            return grid.portAt(node_point, tolerance)
+
         n = self._graphModel.nodeData(
             node_id,
             (
@@ -84,3 +133,66 @@ class AbstractNodeGeometry(ABC):
 
     @abstractmethod
     def resizeHandleRect(self, node_id): ...
+
+    def portGrid(self, node_id, port_type):
+        return None
+
+
+class CachedNodeLayout:
+    def __init__(self, graphModel):
+        super().__init__(graphModel)
+        self._layouts = {}
+
+    def layout(self, nodeId):
+        layout = self._layouts.get(nodeId)
+        if layout is None:
+            layout = self._layouts[nodeId] = self._computeLayout(nodeId)
+        return layout
+
+    def invalidateLayout(self, nodeId):
+        self._layouts.pop(nodeId, None)
+
+    def portPosition(self, nodeId, portType, portIndex):
+        return self._portLayout(nodeId, portType, portIndex).portPositions[portType][
+            portIndex
+        ]
+
+    def portTextPosition(self, nodeId, portType, portIndex):
+        return self._portLayout(nodeId, portType, portIndex).portTextPositions[
+            portType
+        ][portIndex]
+
+    def captionPosition(self, nodeId):
+        return self.layout(nodeId).captionPosition
+
+    def captionRect(self, nodeId):
+        return self.layout(nodeId).captionRect
+
+    def widgetPosition(self, nodeId):
+        return self.layout(nodeId).widgetPosition
+
+    def resizeHandleRect(self, nodeId):
+        return self.layout(nodeId).resizeHandleRect
+
+    def portGrid(self, nodeId, portType):
+        return self.layout(nodeId).portGrids[portType]
+
+    def _computeLayout(self, nodeId):
+        from SpatialNode.definitions import NodeRole
+
+        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
+        return self._layoutNode(size, *self._measure(nodeId))
+
+    def _portLayout(self, nodeId, portType, portIndex):
+        layout = self.layout(nodeId)
+        # ports inserted before the node is updated
+        if portIndex >= len(layout.portPositions[portType]):
+            self.invalidateLayout(nodeId)
+            layout = self.layout(nodeId)
+        return layout
+
+    @abstractmethod
+    def _layoutNode(self, size, *measures): ...
+
+    @abstractmethod
+    def _measure(self, nodeId): ...
@@ -5,16 +5,61 @@
 #  property of any third parties.
 
 from abc import ABC, abstractmethod
+from typing import Any
 
 from PySide6 import QtCore, QtGui
 
 from SpatialNode.abstract_graph_model import AbstractGraphModel
 from SpatialNode.definitions import NodeId, PortType, PortIndex
 
+class PortGrid:
+    """
+    The anchors of the ports of one type, evenly spaced on a line: port `i`
+    is at `(x + i * dx, y + i * dy)`.
+    """
+
+    def __init__(self, x: float, y: float, dx: float, dy: float, count: int):
+        self.x: float = None
+        self.y: float = None
+        self.dx: float = None
+        self.dy: float = None
+        self.count: int = None
+
+    def portAt(self, point: QtCore.QPointF, tolerance: float) -> PortIndex:
+        """
+        The port whose anchor is closer than `tolerance` to `point`, else
+        `InvalidPortIndex`. Constant time: the nearest port along the line is
+        computed, then its distance checked.
+        """
+        ...
+
+class NodeLayout:
+    """
+    Everything a geometry places inside a node, in node coordinates. The
+    port lists hold one entry per port of each `PortType`.
+    """
+
+    def __init__(self, size: QtCore.QSize, captionRect: QtCore.QRectF):
+        self.size: QtCore.QSize = None
+        self.captionRect: QtCore.QRectF = None
+        self.captionPosition: QtCore.QPointF = None
+        self.portPositions: dict[PortType, list[QtCore.QPointF]] = None
+        self.portTextPositions: dict[PortType, list[QtCore.QPointF]] = None
+        self.portGrids: dict[PortType, PortGrid] = None
+        self.widgetPosition: QtCore.QPointF = None
+        self.resizeHandleRect: QtCore.QRect = None
+
 class AbstractNodeGeometry(ABC):
     def __init__(self, graphModel: AbstractGraphModel):
         self._graphModel = graphModel
 
+    def invalidateLayout(self, nodeId: NodeId) -> None:
+        """
+        Called by the scene when the node is deleted or changed, for
+        geometries which cache anything per node. Does nothing by default.
+        """
+        ...
+
     def boundingRect(self, nodeId: NodeId) -> QtCore.QRectF: ...
     @abstractmethod
     def size(self, nodeId: NodeId) -> QtCore.QSize:
@@ -78,6 +123,68 @@ class AbstractNodeGeometry(ABC):
 
     def checkPortHit(
         self, nodeId: NodeId, portType: PortType | None, nodePoint: QtCore.QPointF
-    ) -> PortIndex: ...
+    ) -> PortIndex:
+        """
+        The port of `portType` under `nodePoint`, through `portGrid` when the
+        geometry has one, else by testing every port.
+        """
+        ...
+
     @abstractmethod
     def resizeHandleRect(self, nodeId: NodeId) -> QtCore.QRect: ...
+    def portGrid(self, nodeId: NodeId, portType: PortType) -> PortGrid | None:
+        """None unless the ports of `portType` are evenly spaced on a line."""
+        ...
+
+class CachedNodeLayout:
+    """
+    Mixin keeping one `NodeLayout` per node for a geometry, listed before
+    `AbstractNodeGeometry` among its bases. It answers the port, caption,
+    widget and resize handle queries from `layout()`; the geometry measures
+    the node in `_measure` and places its content in `_layoutNode`.
+    """
+
+    def __init__(self, graphModel: AbstractGraphModel):
+        self._layouts: dict[NodeId, NodeLayout] = None
+
+    def layout(self, nodeId: NodeId) -> NodeLayout:
+        """
+        The cached layout of the node, computed on first use. `recomputeSize`
+        replaces it; the returned objects are shared, do not modify them.
+        """
+        ...
+
+    def invalidateLayout(self, nodeId: NodeId) -> None:
+        """Drops the cached layout, when the node is deleted or changed."""
+        ...
+
+    def portPosition(
+        self, nodeId: NodeId, portType: PortType, portIndex: PortIndex
+    ) -> QtCore.QPointF: ...
+    def portTextPosition(
+        self, nodeId: NodeId, portType: PortType, portIndex: PortIndex
+    ) -> QtCore.QPointF: ...
+    def captionPosition(self, nodeId: NodeId) -> QtCore.QPointF: ...
+    def captionRect(self, nodeId: NodeId) -> QtCore.QRectF: ...
+    def widgetPosition(self, nodeId: NodeId) -> QtCore.QPointF: ...
+    def resizeHandleRect(self, nodeId: NodeId) -> QtCore.QRect: ...
+    def portGrid(self, nodeId: NodeId, portType: PortType) -> PortGrid: ...
+    def _computeLayout(self, nodeId: NodeId) -> NodeLayout:
+        """Lays the node out at its current size, from `_measure`."""
+        ...
+
+    def _portLayout(
+        self, nodeId: NodeId, portType: PortType, portIndex: PortIndex
+    ) -> NodeLayout:
+        """The layout, recomputed if the port was inserted since it was built."""
+        ...
+
+    @abstractmethod
+    def _layoutNode(self, size: QtCore.QSize, *measures: Any) -> NodeLayout:
+        """Places the content of a node of `size`, from `_measure(nodeId)`."""
+        ...
+
+    @abstractmethod
+    def _measure(self, nodeId: NodeId) -> tuple[Any, ...]:
+        """What the layout depends on besides the size, as `_layoutNode` takes it."""
+        ...
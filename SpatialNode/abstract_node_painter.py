@@ -8,5 +8,7 @@ from abc import ABC, abstractmethod
 
 
 class AbstractNodePainter(ABC):
+    widgetLevelOfDetail = 0.0
+
     @abstractmethod
     def paint(self, painter, ngo): ...
@@ -13,6 +13,12 @@ class AbstractNodePainter(ABC):
     Class enables custom painting.
     """
 
+    widgetLevelOfDetail: float
+    """
+    Level of detail of the views below which the scene hides the embedded
+    widgets, 0.0 unless overridden. See `BasicGraphicsScene.updateLevelOfDetail`.
+    """
+
     @abstractmethod
     def paint(self, painter: QtGui.QPainter, ngo) -> None:
         """
@@ -0,0 +1,104 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from abc import abstractmethod
+from typing import override
+
+from PySide6 import QtCore
+
+from SpatialNode.node_delegate_model import NodeDelegateModel
+
+
+class _ComputeTask(QtCore.QRunnable):
+    def __init__(self, delegate, generation, inputs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self._delegate = delegate
+        self._generation = generation
+        self._inputs = inputs
+
+    @override
+    def run(self):
+        try:
+            outputs = self._delegate.compute(self._inputs)
+            error = None
+        except Exception as e:
+            outputs = None
+            error = e
+        self._delegate._computeFinished.emit(self._generation, outputs, error)
+
+
+class AsyncNodeDelegateModel(NodeDelegateModel):
+    computesAsynchronously = True
+
+    def __init__(self):
+        super().__init__()
+        self._inputs = {}
+        self._outputs = {}
+        self._error = None
+        self._generation = 0
+        self._task = None
+        self._threadPool = None
+        self._computeFinished.connect(self._onComputeFinished)
+
+    def threadPool(self):
+        if self._threadPool is None:
+            return QtCore.QThreadPool.globalInstance()
+        return self._threadPool
+
+    def setThreadPool(self, pool):
+        self._threadPool = pool
+
+    def isComputing(self):
+        return self._task is not None
+
+    def computeError(self):
+        return self._error
+
+    @override
+    def setInData(self, nodeData, portIndex):
+        self._inputs[portIndex] = nodeData
+        self.requestCompute()
+
+    @override
+    def setInDataMany(self, inputs):
+        self._inputs.update(inputs)
+        self.requestCompute()
+
+    @override
+    def outData(self, port):
+        return self._outputs.get(port)
+
+    @abstractmethod
+    def compute(self, inputs): ...
+
+    def requestCompute(self):
+        pool = self.threadPool()
+        if self._task is None:
+            self.computingStarted.emit()
+        else:
+            # a superseded task which has not started yet never runs
+            pool.tryTake(self._task)
+
+        self._generation += 1
+        self._task = _ComputeTask(self, self._generation, dict(self._inputs))
+        pool.start(self._task)
+
+    def _onComputeFinished(self, generation, outputs, error):
+        from SpatialNode.definitions import PortType
+
+        if generation != self._generation:
+            return
+
+        self._task = None
+        self._outputs = outputs or {}
+        self._error = error
+        self.computingFinished.emit()
+
+        for port in range(self.nPorts(PortType.Out)):
+            self.dataUpdated.emit(port)
+
+    _computeFinished = QtCore.Signal(int, object, object)
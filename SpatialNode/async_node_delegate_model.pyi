@@ -0,0 +1,91 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from abc import abstractmethod
+from typing import override
+
+from PySide6 import QtCore
+
+from SpatialNode.definitions import PortIndex
+from SpatialNode.node_data import NodeData
+from SpatialNode.node_delegate_model import NodeDelegateModel
+
+class _ComputeTask(QtCore.QRunnable):
+    def __init__(
+        self,
+        delegate: AsyncNodeDelegateModel,
+        generation: int,
+        inputs: dict[PortIndex, NodeData | None],
+    ):
+        self._delegate: AsyncNodeDelegateModel = None
+        self._generation: int = None
+        self._inputs: dict[PortIndex, NodeData | None] = None
+
+    @override
+    def run(self) -> None: ...
+
+class AsyncNodeDelegateModel(NodeDelegateModel):
+    """
+    Delegate whose computation runs on a `QThreadPool` worker instead of the
+    GUI thread.
+
+    Subclasses implement `compute()`, which receives a snapshot of the inputs
+    and returns the outputs. Every input change requests a new compute;
+    `computingStarted` is emitted when the node becomes busy and
+    `computingFinished` followed by `dataUpdated` on every output port when
+    the result of the latest request arrives on the GUI thread. Results of
+    superseded requests are dropped.
+    """
+
+    computesAsynchronously: bool = True
+
+    def __init__(self):
+        self._inputs: dict[PortIndex, NodeData | None] = None
+        self._outputs: dict[PortIndex, NodeData] = None
+        self._error: Exception | None = None
+        self._generation: int = None
+        self._task: _ComputeTask | None = None
+        self._threadPool: QtCore.QThreadPool | None = None
+
+    def threadPool(self) -> QtCore.QThreadPool:
+        """The pool computes run on, `QThreadPool.globalInstance()` by default."""
+        ...
+
+    def setThreadPool(self, pool: QtCore.QThreadPool | None) -> None: ...
+    def isComputing(self) -> bool: ...
+    def computeError(self) -> Exception | None:
+        """Exception raised by the latest `compute()`, if any."""
+        ...
+
+    @override
+    def setInData(self, nodeData: NodeData | None, portIndex: PortIndex) -> None: ...
+    @override
+    def setInDataMany(self, inputs: dict[PortIndex, NodeData | None]) -> None: ...
+    @override
+    def outData(self, port: PortIndex) -> NodeData | None: ...
+    @abstractmethod
+    def compute(
+        self, inputs: dict[PortIndex, NodeData | None]
+    ) -> dict[PortIndex, NodeData]:
+        """
+        Runs on a worker thread: it must not touch widgets or the graph model,
+        only `inputs` and immutable state of the delegate.
+        """
+        ...
+
+    def requestCompute(self) -> None:
+        """Schedules a compute on the current inputs."""
+        ...
+
+    def _onComputeFinished(
+        self,
+        generation: int,
+        outputs: dict[PortIndex, NodeData] | None,
+        error: Exception | None,
+    ) -> None: ...
+
+    _computeFinished: QtCore.Signal(int, object, object)
+    """Emitted by the worker; queued to the GUI thread."""
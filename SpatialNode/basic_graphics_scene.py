@@ -4,6 +4,8 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
+import math
+
 from PySide6 import QtWidgets, QtCore, QtGui
 
 
@@ -24,6 +26,11 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
         self._draftConnection = None
         self._nodeGraphicsObjects = {}
         self._connectionGraphicsObjects = {}
+        self._itemIndexThreshold = 1000
+        self._widgetsVisible = True
+        self._connectionLayerEnabled = False
+        self._connectionLayer = None
+        self._demotionPending = False
 
         self.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
 
@@ -33,8 +40,12 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
         self._graphModel.nodeDeleted.connect(self.onNodeDeleted)
         self._graphModel.nodePositionUpdated.connect(self.onNodePositionUpdated)
         self._graphModel.nodeUpdated.connect(self.onNodeUpdated)
+        self._graphModel.nodeFlagsUpdated.connect(self.onNodeFlagsUpdated)
         self.nodeClicked.connect(self.onNodeClicked)
+        self.connectionHoverLeft.connect(self._scheduleDemotion)
+        self.selectionChanged.connect(self._scheduleDemotion)
         self._graphModel.modelReset.connect(self.onModelReset)
+        self._graphModel.graphChanged.connect(self.onGraphChanged)
         self._traverseGraphAndPopulateGraphicsObjects()
 
     @property
@@ -80,6 +91,43 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
     def connectionGraphicsObject(self, connectionId):
         return self._connectionGraphicsObjects.get(connectionId)
 
+    def promoteConnection(self, connectionId):
+        from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
+
+        cgo = self._connectionGraphicsObjects.get(connectionId)
+        if (
+            cgo is None
+            and self._connectionLayer is not None
+            and self._connectionLayer.removeConnection(connectionId)
+        ):
+            cgo = ConnectionGraphicsObject(self, connectionId)
+            self._connectionGraphicsObjects[connectionId] = cgo
+        return cgo
+
+    def demoteConnection(self, connectionId):
+        if (
+            self._connectionLayer is None
+            or connectionId not in self._connectionGraphicsObjects
+        ):
+            return
+
+        self.removeItem(self._connectionGraphicsObjects.pop(connectionId))
+        self._connectionLayer.addConnection(connectionId)
+
+    @property
+    def connectionLayer(self):
+        return self._connectionLayer
+
+    @property
+    def connectionLayerEnabled(self):
+        return self._connectionLayerEnabled
+
+    @connectionLayerEnabled.setter
+    def connectionLayerEnabled(self, enabled):
+        if self._connectionLayerEnabled != enabled:
+            self._connectionLayerEnabled = enabled
+            self.onModelReset()
+
     @property
     def orientation(self):
         return self._orientation
@@ -103,14 +151,57 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
                     self._nodeGeometry = DefaultVerticalNodeGeometry(self._graphModel)
             self.onModelReset()
 
+    @property
+    def itemIndexThreshold(self):
+        return self._itemIndexThreshold
+
+    @itemIndexThreshold.setter
+    def itemIndexThreshold(self, threshold):
+        self._itemIndexThreshold = threshold
+        self._updateItemIndex()
+
+    def widgetsVisible(self):
+        return self._widgetsVisible
+
+    def updateLevelOfDetail(self, levelOfDetail):
+        visible = levelOfDetail >= self._nodePainter.widgetLevelOfDetail
+        if visible == self._widgetsVisible:
+            return
+
+        self._widgetsVisible = visible
+        for ngo in self._nodeGraphicsObjects.values():
+            ngo.setWidgetVisible(visible)
+
     def createSceneMenu(self, scenePos):
         return None
 
+    def _updateItemIndex(self):
+        ItemIndexMethod = QtWidgets.QGraphicsScene.ItemIndexMethod
+
+        count = len(self._nodeGraphicsObjects) + len(self._connectionGraphicsObjects)
+        if self.itemIndexMethod() == ItemIndexMethod.BspTreeIndex:
+            # the index is kept once built, whatever the threshold: a BSP
+            # tree switched off and on again no longer narrows the queries
+            depth = self._bspTreeDepth(count)
+            if depth > self.bspTreeDepth():
+                self.setBspTreeDepth(depth)
+        elif self._itemIndexThreshold is not None and count >= self._itemIndexThreshold:
+            self.setItemIndexMethod(ItemIndexMethod.BspTreeIndex)
+            self.setBspTreeDepth(self._bspTreeDepth(count))
+
+    @staticmethod
+    def _bspTreeDepth(count):
+        # about 16 items per leaf
+        return min(max(int(math.log2(max(count, 1) / 16)), 4), 16)
+
     def _traverseGraphAndPopulateGraphicsObjects(self):
-        from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
+        from SpatialNode.connection_layer import ConnectionLayer
         from SpatialNode.node_graphics_object import NodeGraphicsObject
         from SpatialNode.definitions import NodeRole, PortType
 
+        if self._connectionLayerEnabled:
+            self._connectionLayer = ConnectionLayer(self)
+
         allNodeIds = self._graphModel.allNodeIds()
 
         for nodeId in allNodeIds:
@@ -125,9 +216,53 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
                 )
 
                 for cid in outConnectionIds:
-                    self._connectionGraphicsObjects[cid] = ConnectionGraphicsObject(
-                        self, cid
-                    )
+                    self._addConnectionItem(cid)
+
+        self._updateItemIndex()
+
+    def _addConnectionItem(self, connectionId):
+        from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
+
+        if self._connectionLayer is not None:
+            self._connectionLayer.addConnection(connectionId)
+        else:
+            self._connectionGraphicsObjects[connectionId] = ConnectionGraphicsObject(
+                self, connectionId
+            )
+
+    def _removeConnectionItem(self, connectionId):
+        obj = self._connectionGraphicsObjects.pop(connectionId, None)
+        if obj is not None:
+            self.removeItem(obj)
+        elif self._connectionLayer is not None:
+            self._connectionLayer.removeConnection(connectionId)
+
+    def _scheduleDemotion(self):
+        if self._connectionLayer is not None and not self._demotionPending:
+            self._demotionPending = True
+            QtCore.QTimer.singleShot(0, self._demoteIdleConnections)
+
+    def _restyleLayerConnections(self, nodeId):
+        # the port data types, and so the colors, may have changed
+        if self._connectionLayer is not None:
+            self._connectionLayer.restyleConnections(
+                self._graphModel.allConnectionIds(nodeId)
+            )
+
+    def _demoteIdleConnections(self):
+        self._demotionPending = False
+        if self._connectionLayer is None:
+            return
+
+        grabber = self.mouseGrabberItem()
+        for connectionId, cgo in list(self._connectionGraphicsObjects.items()):
+            if not (
+                cgo.isSelected()
+                or cgo.connectionState.hovered
+                or cgo.isUnderMouse()
+                or cgo is grabber
+            ):
+                self.demoteConnection(connectionId)
 
     def _updateAttachedNodes(self, connectionId, portType):
         from SpatialNode.connection_id_utils import getNodeId
@@ -160,12 +295,12 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
     def onConnectionDeleted(self, connectionId):
         from SpatialNode.definitions import PortType
 
-        obj = self._connectionGraphicsObjects.pop(connectionId)
-        self.removeItem(obj)
+        self._removeConnectionItem(connectionId)
+        self._updateItemIndex()
 
         if (
             self._draftConnection is not None
-            and self._draftConnection.connectionId() == connectionId
+            and self._draftConnection.connectionId == connectionId
         ):
             self.removeItem(self._draftConnection)
             self._draftConnection = None
@@ -175,11 +310,9 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
 
     def onConnectionCreated(self, connectionId):
         from SpatialNode.definitions import PortType
-        from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
 
-        self._connectionGraphicsObjects[connectionId] = ConnectionGraphicsObject(
-            self, connectionId
-        )
+        self._addConnectionItem(connectionId)
+        self._updateItemIndex()
 
         self._updateAttachedNodes(connectionId, PortType.Out)
         self._updateAttachedNodes(connectionId, PortType.In)
@@ -187,11 +320,14 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
     def onNodeDeleted(self, nodeId):
         obj = self._nodeGraphicsObjects.pop(nodeId)
         self.removeItem(obj)
+        self._nodeGeometry.invalidateLayout(nodeId)
+        self._updateItemIndex()
 
     def onNodeCreated(self, nodeId):
         from SpatialNode.node_graphics_object import NodeGraphicsObject
 
         self._nodeGraphicsObjects[nodeId] = NodeGraphicsObject(self, nodeId)
+        self._updateItemIndex()
 
     def onNodePositionUpdated(self, nodeId):
         from SpatialNode.definitions import NodeRole
@@ -207,10 +343,20 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
 
         if node is not None:
             node.setGeometryChanged()
+            node.updateEmbeddedWidget()
             self._nodeGeometry.recomputeSize(nodeId)
 
             node.update()
             node.moveConnections()
+            self._restyleLayerConnections(nodeId)
+
+    def onNodeFlagsUpdated(self, nodeId):
+        node = self.nodeGraphicsObject(nodeId)
+        if node is not None:
+            node.updateLockedState()
+
+    def onNodeShown(self, nodeId):
+        pass
 
     def onNodeClicked(self, nodeId):
         from SpatialNode.definitions import NodeRole
@@ -221,13 +367,76 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
             )
             self._nodeDrag = False
 
+    def onGraphChanged(self, changes):
+        from SpatialNode.node_graphics_object import NodeGraphicsObject
+        from SpatialNode.definitions import NodeRole
+
+        touchedNodes = set()
+
+        for connectionId in changes.connectionsRemoved:
+            self._removeConnectionItem(connectionId)
+
+            if (
+                self._draftConnection is not None
+                and self._draftConnection.connectionId == connectionId
+            ):
+                self.removeItem(self._draftConnection)
+                self._draftConnection = None
+
+            touchedNodes.add(connectionId.outNodeId)
+            touchedNodes.add(connectionId.inNodeId)
+
+        for nodeId in changes.nodesRemoved:
+            obj = self._nodeGraphicsObjects.pop(nodeId, None)
+            if obj is not None:
+                self.removeItem(obj)
+            self._nodeGeometry.invalidateLayout(nodeId)
+
+        for nodeId in changes.nodesAdded:
+            self._nodeGraphicsObjects[nodeId] = NodeGraphicsObject(self, nodeId)
+
+        for connectionId in changes.connectionsAdded:
+            self._addConnectionItem(connectionId)
+            touchedNodes.add(connectionId.outNodeId)
+            touchedNodes.add(connectionId.inNodeId)
+
+        # moving a node moves its connections through `itemChange`
+        for nodeId in changes.nodesMoved:
+            node = self.nodeGraphicsObject(nodeId)
+            if node is not None:
+                node.setPos(self._graphModel.nodeData(nodeId, NodeRole.Position))
+
+        for nodeId in changes.nodesUpdated:
+            node = self.nodeGraphicsObject(nodeId)
+            if node is not None:
+                node.setGeometryChanged()
+                self._nodeGeometry.recomputeSize(nodeId)
+                node.moveConnections()
+                self._restyleLayerConnections(nodeId)
+        touchedNodes |= changes.nodesUpdated
+
+        self._updateItemIndex()
+
+        # connections which survived a re-created node follow its new item
+        for nodeId in changes.nodesAdded & changes.nodesRemoved:
+            self._nodeGraphicsObjects[nodeId].moveConnections()
+
+        for nodeId in touchedNodes:
+            node = self.nodeGraphicsObject(nodeId)
+            if node is not None:
+                node.update()
+
     def onModelReset(self):
         for obj in self._connectionGraphicsObjects.values():
             self.removeItem(obj)
         self._connectionGraphicsObjects.clear()
-        for obj in self._nodeGraphicsObjects.values():
+        for nodeId, obj in self._nodeGraphicsObjects.items():
             self.removeItem(obj)
+            self._nodeGeometry.invalidateLayout(nodeId)
         self._nodeGraphicsObjects.clear()
+        if self._connectionLayer is not None:
+            self.removeItem(self._connectionLayer)
+            self._connectionLayer = None
 
         self.clear()
         self._traverseGraphAndPopulateGraphicsObjects()
@@ -10,7 +10,9 @@ from SpatialNode.abstract_graph_model import AbstractGraphModel
 from SpatialNode.abstract_node_geometry import AbstractNodeGeometry
 from SpatialNode.abstract_node_painter import AbstractNodePainter
 from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
+from SpatialNode.connection_layer import ConnectionLayer
 from SpatialNode.definitions import ConnectionId, NodeId, PortType
+from SpatialNode.graph_change_set import GraphChangeSet
 from SpatialNode.node_graphics_object import NodeGraphicsObject
 
 class BasicGraphicsScene(QtWidgets.QGraphicsScene):
@@ -30,6 +32,11 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
         self._connectionGraphicsObjects: dict[
             ConnectionId, ConnectionGraphicsObject
         ] = None
+        self._itemIndexThreshold: int | None = None
+        self._widgetsVisible: bool = None
+        self._connectionLayerEnabled: bool = None
+        self._connectionLayer: ConnectionLayer | None = None
+        self._demotionPending: bool = None
 
     @property
     def graphModel(self) -> AbstractGraphModel: ...
@@ -69,14 +76,72 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
         self, connectionId: ConnectionId
     ) -> ConnectionGraphicsObject:
         """
-        ConnectionGraphicsObject corresponding to `connectionId`.
+        ConnectionGraphicsObject corresponding to `connectionId`. None while
+        the connection layer draws the connection.
         """
         ...
 
+    def promoteConnection(
+        self, connectionId: ConnectionId
+    ) -> ConnectionGraphicsObject | None:
+        """
+        ConnectionGraphicsObject of `connectionId`, taken out of the
+        connection layer if the layer draws it.
+        """
+        ...
+
+    def demoteConnection(self, connectionId: ConnectionId) -> None:
+        """Hands the connection back to the connection layer, if enabled."""
+        ...
+
+    @property
+    def connectionLayer(self) -> ConnectionLayer | None: ...
+    @property
+    def connectionLayerEnabled(self) -> bool:
+        """
+        Draws connections through one ConnectionLayer instead of a
+        ConnectionGraphicsObject each, False by default. A connection gets
+        its own item while it is hovered, selected or dragged, and goes back
+        to the layer after. Changing it rebuilds the scene items.
+        """
+        ...
+
+    @connectionLayerEnabled.setter
+    def connectionLayerEnabled(self, enabled: bool): ...
     @property
     def orientation(self) -> QtCore.Qt.Orientation: ...
     @orientation.setter
     def orientation(self, orientation: QtCore.Qt.Orientation): ...
+    @property
+    def itemIndexThreshold(self) -> int | None:
+        """
+        Item count from which the scene keeps a BSP tree index of its items,
+        1000 by default. Below it, `NoIndex` is cheaper: moving an item costs
+        nothing, and a linear scan of a small scene is fast. `None` never
+        builds an index, 0 always does.
+
+        Once built, the index is kept: when the scene shrinks, and when the
+        threshold is raised or set to `None`. Its tree only deepens. Qt does
+        not recover a BSP tree index that was switched off, and every query
+        then scans all the items.
+        """
+        ...
+
+    @itemIndexThreshold.setter
+    def itemIndexThreshold(self, threshold: int | None): ...
+    def widgetsVisible(self) -> bool:
+        """Whether embedded widgets are shown, see `updateLevelOfDetail`."""
+        ...
+
+    def updateLevelOfDetail(self, levelOfDetail: float) -> None:
+        """
+        Shows the embedded widgets at or above the `widgetLevelOfDetail` of the
+        node painter, and hides them below it. `GraphicsView` calls it when its
+        scale changes, outside of painting; only crossing the threshold touches
+        the nodes. Widgets embedded later get the current visibility.
+        """
+        ...
+
     def createSceneMenu(self, scenePos: QtCore.QPointF) -> QtWidgets.QMenu:
         """
         return an instance of the scene context menu in subclass.
@@ -89,6 +154,29 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
         """
         ...
 
+    def _updateItemIndex(self) -> None:
+        """Switches the item index for the current item count."""
+        ...
+
+    @staticmethod
+    def _bspTreeDepth(count: int) -> int:
+        """Depth for about 16 items per leaf, from 4 to 16."""
+        ...
+
+    def _addConnectionItem(self, connectionId: ConnectionId) -> None: ...
+    def _removeConnectionItem(self, connectionId: ConnectionId) -> None: ...
+    def _scheduleDemotion(self) -> None: ...
+    def _restyleLayerConnections(self, nodeId: NodeId) -> None:
+        """Lets the connection layer recolor the connections of an updated node."""
+        ...
+
+    def _demoteIdleConnections(self) -> None:
+        """
+        Demotes the connections which are neither hovered, selected nor
+        grabbing the mouse.
+        """
+        ...
+
     def _updateAttachedNodes(
         self, connectionId: ConnectionId, portType: PortType | None
     ) -> None:
@@ -129,5 +217,18 @@ class BasicGraphicsScene(QtWidgets.QGraphicsScene):
     def onNodeCreated(self, nodeId: NodeId) -> None: ...
     def onNodePositionUpdated(self, nodeId: NodeId) -> None: ...
     def onNodeUpdated(self, nodeId: NodeId) -> None: ...
+    def onNodeFlagsUpdated(self, nodeId: NodeId) -> None: ...
+    def onNodeShown(self, nodeId: NodeId) -> None:
+        """Called when the item of `nodeId` becomes visible."""
+        ...
+
     def onNodeClicked(self, nodeId: NodeId) -> None: ...
+    def onGraphChanged(self, changes: GraphChangeSet) -> None:
+        """
+        Slot called once at the end of a model batch. Applies the whole change
+        set in one pass: removals first, then creations, moves and updates,
+        repainting every touched node once.
+        """
+        ...
+
     def onModelReset(self) -> None: ...
@@ -0,0 +1,40 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+
+class BatchColumn:
+    __slots__ = ("values", "dataClass")
+
+    def __init__(self, values, dataClass):
+        self.values = values
+        self.dataClass = dataClass
+
+    def __len__(self):
+        return len(self.values)
+
+    def rows(self):
+        if self.dataClass is None:
+            return list(self.values)
+
+        fromBatchValue = self.dataClass.fromBatchValue
+        return [fromBatchValue(value) for value in self.values]
+
+    @staticmethod
+    def fromRows(rows):
+        dataClass = next((type(row) for row in rows if row is not None), None)
+        if dataClass is None:
+            return None
+
+        empty = dataClass.emptyBatchValue()
+        values = []
+        for row in rows:
+            if row is None:
+                values.append(empty)
+            elif type(row) is dataClass:
+                values.append(row.batchValue())
+            else:
+                return None
+        return BatchColumn(values, dataClass)
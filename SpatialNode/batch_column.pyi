@@ -0,0 +1,36 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Any, Sequence
+
+from SpatialNode.node_data import NodeData
+
+class BatchColumn:
+    """
+    The data of one port over all the rows of a batch: the `batchValue()`
+    of every row, and the `NodeData` class which turns them back into data.
+    `values` is any sequence, typically a NumPy array for numeric data.
+    Without a data class, `values` are the rows themselves; such columns are
+    never handed to `computeBatch`.
+
+    ```python
+    column = sNode.BatchColumn(numpy.linspace(0, 1, 1_000_000), DecimalData)
+    ```
+    """
+
+    def __init__(self, values: Sequence[Any], dataClass: type[NodeData] | None):
+        self.values: Sequence[Any] = None
+        self.dataClass: type[NodeData] | None = None
+
+    def __len__(self) -> int: ...
+    def rows(self) -> list[NodeData | None]: ...
+    @staticmethod
+    def fromRows(rows: Sequence[NodeData | None]) -> BatchColumn | None:
+        """
+        `None` when the rows do not share one data class, or carry no data at
+        all.
+        """
+        ...
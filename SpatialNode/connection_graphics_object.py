@@ -20,6 +20,9 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
         self._connectionState = ConnectionState(weakref.proxy(self))
         self._out = QtCore.QPointF()
         self._in = QtCore.QPointF()
+        self._path = None
+        self._shape = None
+        self._boundingRect = None
 
         scene.addItem(self)
 
@@ -46,6 +49,9 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
     def boundingRect(self):
         from SpatialNode.style_collection import StyleCollection
 
+        if self._boundingRect is not None:
+            return self._boundingRect
+
         c1, c2 = self.pointsC1C2()
         basicRect = QtCore.QRectF(self._out, self._in).normalized()
         c1c2Rect = QtCore.QRectF(c1, c2).normalized()
@@ -57,13 +63,23 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
         # Expand rect by port circle diameter
         commonRect.setTopLeft(commonRect.topLeft() - cornerOffset)
         commonRect.setBottomRight(commonRect.bottomRight() + cornerOffset * 2)
+        self._boundingRect = commonRect
         return commonRect
 
     @override
     def shape(self):
         from SpatialNode.connection_painter import ConnectionPainter
 
-        return ConnectionPainter.getPainterStroke(self)
+        if self._shape is None:
+            self._shape = ConnectionPainter.getPainterStroke(self)
+        return self._shape
+
+    def path(self):
+        from SpatialNode.connection_painter import cubicPath
+
+        if self._path is None:
+            self._path = cubicPath(self)
+        return self._path
 
     def endPoint(self, portType):
         from SpatialNode.definitions import PortType
@@ -77,20 +93,32 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
         return self._in
 
     def pointsC1C2(self):
-        match self.nodeScene.orientation:
+        return self.controlPoints(self._out, self._in, self.nodeScene.orientation)
+
+    @staticmethod
+    def controlPoints(outSlot, inSlot, orientation):
+        match orientation:
             case QtCore.Qt.Orientation.Horizontal:
-                return self._pointsC1C2Horizontal()
+                return ConnectionGraphicsObject._pointsC1C2Horizontal(outSlot, inSlot)
             case QtCore.Qt.Orientation.Vertical:
-                return self._pointsC1C2Vertical()
+                return ConnectionGraphicsObject._pointsC1C2Vertical(outSlot, inSlot)
 
     def setEndPoint(self, portType, point):
         from SpatialNode.definitions import PortType
 
+        if point == self.endPoint(portType):
+            return
+
+        self.prepareGeometryChange()
         if portType == PortType.In:
             self._in = point
         else:
             self._out = point
 
+        self._path = None
+        self._shape = None
+        self._boundingRect = None
+
     # Updates the position of both ends
     def move(self):
         from SpatialNode.definitions import ConnectionId, PortType, InvalidNodeId
@@ -115,7 +143,6 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
 
         moveEnd(self._connectionId, PortType.Out)
         moveEnd(self._connectionId, PortType.In)
-        self.prepareGeometryChange()
         self.update()
 
     @property
@@ -140,8 +167,6 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
     def mouseMoveEvent(self, event):
         from SpatialNode.locate_node import locateNodeAt
 
-        self.prepareGeometryChange()
-
         view = QtWidgets.QGraphicsView(event.widget())
         ngo = locateNodeAt(event.scenePos(), self.nodeScene, view.transform())
         if ngo is not None:
@@ -224,46 +249,44 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
         effect.setBlurRadius(5)
         self.setGraphicsEffect(effect)
 
-    def _pointsC1C2Horizontal(self):
+    @staticmethod
+    def _pointsC1C2Horizontal(outSlot, inSlot):
         defaultOffset = 200.0
-        xDistance = self._in.x() - self._out.x()
+        xDistance = inSlot.x() - outSlot.x()
         horizontalOffset = min(defaultOffset, abs(xDistance))
         verticalOffset = 0
         ratioX = 0.5
 
         if xDistance <= 0:
-            yDistance = self._in.y() - self._out.y() + 20
+            yDistance = inSlot.y() - outSlot.y() + 20
             vector = -1.0 if yDistance < 0 else 1.0
             verticalOffset = min(defaultOffset, abs(yDistance)) * vector
             ratioX = 1.0
 
         horizontalOffset *= ratioX
         c1 = QtCore.QPointF(
-            self._out.x() + horizontalOffset, self._out.y() + verticalOffset
-        )
-        c2 = QtCore.QPointF(
-            self._in.x() - horizontalOffset, self._in.y() - verticalOffset
+            outSlot.x() + horizontalOffset, outSlot.y() + verticalOffset
         )
+        c2 = QtCore.QPointF(inSlot.x() - horizontalOffset, inSlot.y() - verticalOffset)
         return c1, c2
 
-    def _pointsC1C2Vertical(self):
+    @staticmethod
+    def _pointsC1C2Vertical(outSlot, inSlot):
         defaultOffset = 200.0
-        yDistance = self._in.y() - self._out.y()
+        yDistance = inSlot.y() - outSlot.y()
         verticalOffset = min(defaultOffset, abs(yDistance))
         horizontalOffset = 0
         ratioY = 0.5
 
         if yDistance <= 0:
-            xDistance = self._in.x() - self._out.x() + 20
+            xDistance = inSlot.x() - outSlot.x() + 20
             vector = -1.0 if xDistance < 0 else 1.0
             horizontalOffset = min(defaultOffset, abs(xDistance)) * vector
             ratioY = 1.0
 
         verticalOffset *= ratioY
         c1 = QtCore.QPointF(
-            self._out.x() + horizontalOffset, self._out.y() + verticalOffset
-        )
-        c2 = QtCore.QPointF(
-            self._in.x() - horizontalOffset, self._in.y() - verticalOffset
+            outSlot.x() + horizontalOffset, outSlot.y() + verticalOffset
         )
+        c2 = QtCore.QPointF(inSlot.x() - horizontalOffset, inSlot.y() - verticalOffset)
         return c1, c2
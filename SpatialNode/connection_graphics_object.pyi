@@ -6,7 +6,7 @@
 
 from typing import override
 
-from PySide6 import QtWidgets, QtCore
+from PySide6 import QtWidgets, QtCore, QtGui
 
 from SpatialNode.abstract_graph_model import AbstractGraphModel
 from SpatialNode.basic_graphics_scene import BasicGraphicsScene
@@ -22,6 +22,9 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
         self._connectionState: ConnectionState = None
         self._out: QtCore.QPointF = None
         self._in: QtCore.QPointF = None
+        self._path: QtGui.QPainterPath | None = None
+        self._shape: QtGui.QPainterPath | None = None
+        self._boundingRect: QtCore.QRectF | None = None
 
     @property
     def graphModel(self) -> AbstractGraphModel: ...
@@ -33,10 +36,26 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
     def boundingRect(self): ...
     @override
     def shape(self): ...
+    def path(self) -> QtGui.QPainterPath:
+        """
+        Cubic path between the two end points. The path, the shape and the
+        bounding rect are cached until `setEndPoint` moves an end.
+        """
+        ...
+
     def endPoint(self, portType: PortType | None) -> QtCore.QPointF: ...
     def outSlot(self) -> QtCore.QPointF: ...
     def inSlot(self) -> QtCore.QPointF: ...
     def pointsC1C2(self) -> tuple[QtCore.QPointF, QtCore.QPointF]: ...
+    @staticmethod
+    def controlPoints(
+        outSlot: QtCore.QPointF,
+        inSlot: QtCore.QPointF,
+        orientation: QtCore.Qt.Orientation,
+    ) -> tuple[QtCore.QPointF, QtCore.QPointF]:
+        """Control points of the cubic between `outSlot` and `inSlot`."""
+        ...
+
     def setEndPoint(self, portType: PortType | None, point: QtCore.QPointF) -> None: ...
     def move(self) -> None: ...
     @property
@@ -55,5 +74,11 @@ class ConnectionGraphicsObject(QtWidgets.QGraphicsObject):
     def hoverLeaveEvent(self, event): ...
     def _initializePosition(self) -> None: ...
     def _addGraphicsEffect(self) -> None: ...
-    def _pointsC1C2Horizontal(self) -> tuple[QtCore.QPointF, QtCore.QPointF]: ...
-    def _pointsC1C2Vertical(self) -> tuple[QtCore.QPointF, QtCore.QPointF]: ...
+    @staticmethod
+    def _pointsC1C2Horizontal(
+        outSlot: QtCore.QPointF, inSlot: QtCore.QPointF
+    ) -> tuple[QtCore.QPointF, QtCore.QPointF]: ...
+    @staticmethod
+    def _pointsC1C2Vertical(
+        outSlot: QtCore.QPointF, inSlot: QtCore.QPointF
+    ) -> tuple[QtCore.QPointF, QtCore.QPointF]: ...
@@ -3,7 +3,6 @@
 #  I am making my contributions/submissions to this project solely in my
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
-import copy
 
 from SpatialNode.definitions import QJsonObject, ConnectionId
 
@@ -82,28 +81,37 @@ def makeIncompleteConnectionId(connectedNodeId, connectedPort, connectedPortInde
 def makeIncompleteConnectionIdFromComplete(connectionId, portToDisconnect):
     from SpatialNode.definitions import InvalidPortIndex, InvalidNodeId, PortType
 
-    newConnectionId = copy.deepcopy(connectionId)
     if portToDisconnect == PortType.Out:
-        newConnectionId.outNodeId = InvalidNodeId
-        newConnectionId.outPortIndex = InvalidPortIndex
-    else:
-        newConnectionId.inNodeId = InvalidNodeId
-        newConnectionId.inPortIndex = InvalidPortIndex
-    return newConnectionId
+        return ConnectionId(
+            InvalidNodeId,
+            InvalidPortIndex,
+            connectionId.inNodeId,
+            connectionId.inPortIndex,
+        )
+    return ConnectionId(
+        connectionId.outNodeId,
+        connectionId.outPortIndex,
+        InvalidNodeId,
+        InvalidPortIndex,
+    )
 
 
 def makeCompleteConnectionId(incompleteConnectionId, nodeId, portIndex):
     from SpatialNode.definitions import InvalidNodeId
 
-    newConnectionId = copy.deepcopy(incompleteConnectionId)
-    if newConnectionId.outNodeId == InvalidNodeId:
-        newConnectionId.outNodeId = nodeId
-        newConnectionId.outPortIndex = portIndex
-    else:
-        newConnectionId.inNodeId = nodeId
-        newConnectionId.inPortIndex = portIndex
-
-    return newConnectionId
+    if incompleteConnectionId.outNodeId == InvalidNodeId:
+        return ConnectionId(
+            nodeId,
+            portIndex,
+            incompleteConnectionId.inNodeId,
+            incompleteConnectionId.inPortIndex,
+        )
+    return ConnectionId(
+        incompleteConnectionId.outNodeId,
+        incompleteConnectionId.outPortIndex,
+        nodeId,
+        portIndex,
+    )
 
 
 def toJson(connId):
@@ -0,0 +1,332 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import math
+from typing import override
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+
+class _LayerConnection:
+    __slots__ = ("connectionId", "_out", "_in", "_orientation", "_path", "_shape")
+
+    def __init__(self, connectionId, outSlot, inSlot, orientation):
+        self.connectionId = connectionId
+        self._out = outSlot
+        self._in = inSlot
+        self._orientation = orientation
+        self._path = None
+        self._shape = None
+
+    def endPoint(self, portType):
+        from SpatialNode.definitions import PortType
+
+        return self._out if portType == PortType.Out else self._in
+
+    def pointsC1C2(self):
+        from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
+
+        return ConnectionGraphicsObject.controlPoints(
+            self._out, self._in, self._orientation
+        )
+
+    def path(self):
+        from SpatialNode.connection_painter import cubicPath
+
+        if self._path is None:
+            self._path = cubicPath(self)
+        return self._path
+
+    def shape(self):
+        from SpatialNode.connection_painter import ConnectionPainter
+
+        if self._shape is None:
+            self._shape = ConnectionPainter.getPainterStroke(self)
+        return self._shape
+
+    def rect(self, pointDiameter):
+        c1, c2 = self.pointsC1C2()
+        rect = QtCore.QRectF(self._out, self._in).normalized()
+        rect = rect.united(QtCore.QRectF(c1, c2).normalized())
+        return rect.adjusted(
+            -pointDiameter, -pointDiameter, 2 * pointDiameter, 2 * pointDiameter
+        )
+
+
+class _Batch:
+    __slots__ = ("paths", "points", "middles")
+
+    def __init__(self):
+        self.paths = {}
+        self.points = QtGui.QPainterPath()
+        self.middles = []
+
+
+class ConnectionLayer(QtWidgets.QGraphicsItem):
+    def __init__(self, scene, cellSize=512.0):
+        super().__init__()
+        self._cellSize = cellSize
+        self._connections = {}
+        self._rects = {}
+        self._cells = {}
+        self._tiles = {}
+        self._tileBounds = {}
+        self._batches = {}
+        self._bounds = QtCore.QRectF()
+
+        scene.addItem(self)
+
+        self.setZValue(-2.0)
+        self.setAcceptHoverEvents(True)
+
+    def nodeScene(self):
+        return self.scene()
+
+    def hasConnection(self, connectionId):
+        return connectionId in self._connections
+
+    def connectionIds(self):
+        return self._connections.keys()
+
+    def addConnection(self, connectionId):
+        from SpatialNode.definitions import PortType
+
+        connection = _LayerConnection(
+            connectionId,
+            self._portScenePosition(connectionId, PortType.Out),
+            self._portScenePosition(connectionId, PortType.In),
+            self.nodeScene().orientation,
+        )
+        self._connections[connectionId] = connection
+        self._insert(connection)
+
+    def removeConnection(self, connectionId):
+        connection = self._connections.pop(connectionId, None)
+        if connection is None:
+            return False
+
+        self._erase(connection)
+        return True
+
+    def moveConnection(self, connectionId):
+        from SpatialNode.definitions import PortType
+
+        connection = self._connections.get(connectionId)
+        if connection is None:
+            return
+
+        outSlot = self._portScenePosition(connectionId, PortType.Out)
+        inSlot = self._portScenePosition(connectionId, PortType.In)
+        if outSlot == connection.endPoint(PortType.Out) and inSlot == (
+            connection.endPoint(PortType.In)
+        ):
+            return
+
+        self._erase(connection)
+        connection = _LayerConnection(
+            connectionId, outSlot, inSlot, self.nodeScene().orientation
+        )
+        self._connections[connectionId] = connection
+        self._insert(connection)
+
+    def restyleConnections(self, connectionIds):
+        for connectionId in connectionIds:
+            rect = self._rects.get(connectionId)
+            if rect is not None:
+                self._batches.pop(self._cell(rect.center()), None)
+                self.update(rect)
+
+    def connectionAt(self, point):
+        for connectionId in self._cells.get(self._cell(point), ()):
+            if self._rects[connectionId].contains(point) and (
+                self._connections[connectionId].shape().contains(point)
+            ):
+                return connectionId
+        return None
+
+    @override
+    def boundingRect(self):
+        return self._bounds
+
+    @override
+    def contains(self, point):
+        return self.connectionAt(point) is not None
+
+    @override
+    def paint(self, painter, option, widget=...):
+        from SpatialNode.connection_painter import convertPixmap
+        from SpatialNode.style_collection import StyleCollection
+
+        connectionStyle = StyleCollection.connectionStyle()
+        exposedRect = option.exposedRect
+
+        batches = [
+            self._batch(tile)
+            for tile, bounds in self._tileBounds.items()
+            if bounds.intersects(exposedRect)
+        ]
+
+        pen = QtGui.QPen()
+        pen.setWidth(connectionStyle.LineWidth)
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        for batch in batches:
+            for color, path in batch.paths.values():
+                pen.setColor(color)
+                painter.setPen(pen)
+                painter.drawPath(path)
+
+        painter.setPen(connectionStyle.ConstructionColor)
+        painter.setBrush(connectionStyle.ConstructionColor)
+        for batch in batches:
+            painter.drawPath(batch.points)
+
+        pixmap = convertPixmap() if any(batch.middles for batch in batches) else None
+        for batch in batches:
+            for middle in batch.middles:
+                painter.drawPixmap(
+                    middle - QtCore.QPointF(pixmap.width() / 2, pixmap.height() / 2),
+                    pixmap,
+                )
+
+    @override
+    def hoverEnterEvent(self, event):
+        self._promoteAt(event.scenePos())
+
+    @override
+    def hoverMoveEvent(self, event):
+        self._promoteAt(event.scenePos())
+
+    def _promoteAt(self, scenePoint):
+        connectionId = self.connectionAt(scenePoint)
+        if connectionId is not None:
+            self.nodeScene().promoteConnection(connectionId)
+
+    def _portScenePosition(self, connectionId, portType):
+        from SpatialNode.connection_id_utils import getNodeId, getPortIndex
+
+        scene = self.nodeScene()
+        nodeId = getNodeId(portType, connectionId)
+        ngo = scene.nodeGraphicsObject(nodeId)
+        if ngo is None:
+            return QtCore.QPointF()
+
+        return scene.nodeGeometry.portScenePosition(
+            nodeId,
+            portType,
+            getPortIndex(portType, connectionId),
+            ngo.sceneTransform(),
+        )
+
+    def _cell(self, point):
+        return (
+            math.floor(point.x() / self._cellSize),
+            math.floor(point.y() / self._cellSize),
+        )
+
+    def _cellsOf(self, rect):
+        left, top = self._cell(rect.topLeft())
+        right, bottom = self._cell(rect.bottomRight())
+        return [(i, j) for i in range(left, right + 1) for j in range(top, bottom + 1)]
+
+    def _insert(self, connection):
+        from SpatialNode.style_collection import StyleCollection
+
+        connectionId = connection.connectionId
+        rect = connection.rect(StyleCollection.connectionStyle().PointDiameter)
+        self._rects[connectionId] = rect
+
+        for cell in self._cellsOf(rect):
+            self._cells.setdefault(cell, set()).add(connectionId)
+
+        tile = self._cell(rect.center())
+        self._tiles.setdefault(tile, set()).add(connectionId)
+        self._tileBounds[tile] = self._tileBounds.get(tile, rect).united(rect)
+        self._batches.pop(tile, None)
+
+        if not self._bounds.contains(rect):
+            self.prepareGeometryChange()
+            self._bounds = self._bounds.united(rect)
+        self.update(rect)
+
+    def _erase(self, connection):
+        connectionId = connection.connectionId
+        rect = self._rects.pop(connectionId)
+
+        for cell in self._cellsOf(rect):
+            cellIds = self._cells[cell]
+            cellIds.discard(connectionId)
+            if not cellIds:
+                del self._cells[cell]
+
+        tile = self._cell(rect.center())
+        tileIds = self._tiles[tile]
+        tileIds.discard(connectionId)
+        if not tileIds:
+            del self._tiles[tile]
+            del self._tileBounds[tile]
+        self._batches.pop(tile, None)
+
+        self.update(rect)
+
+    def _batch(self, tile):
+        batch = self._batches.get(tile)
+        if batch is None:
+            batch = self._buildBatch(self._tiles[tile])
+            self._batches[tile] = batch
+        return batch
+
+    def _buildBatch(self, connectionIds):
+        from SpatialNode.connection_painter import halfCubicPaths
+        from SpatialNode.definitions import PortType, PortRole
+        from SpatialNode.style_collection import StyleCollection
+
+        connectionStyle = StyleCollection.connectionStyle()
+        graphModel = self.nodeScene().graphModel
+        pointRadius = connectionStyle.PointDiameter / 2.0
+
+        def addPath(color, path):
+            entry = batch.paths.get(color.rgba())
+            if entry is None:
+                entry = batch.paths[color.rgba()] = (color, QtGui.QPainterPath())
+            entry[1].addPath(path)
+
+        batch = _Batch()
+        for connectionId in connectionIds:
+            connection = self._connections[connectionId]
+
+            if connectionStyle.UseDataDefinedColors:
+                dataTypeOut = graphModel.portData(
+                    connectionId.outNodeId,
+                    PortType.Out,
+                    connectionId.outPortIndex,
+                    PortRole.DataType,
+                )
+                dataTypeIn = graphModel.portData(
+                    connectionId.inNodeId,
+                    PortType.In,
+                    connectionId.inPortIndex,
+                    PortRole.DataType,
+                )
+                colorOut = connectionStyle.normalColor(dataTypeOut.id)
+
+                if dataTypeOut.id != dataTypeIn.id:
+                    first, second, middle = halfCubicPaths(connection)
+                    addPath(colorOut, first)
+                    addPath(connectionStyle.normalColor(dataTypeIn.id), second)
+                    batch.middles.append(middle)
+                else:
+                    addPath(colorOut, connection.path())
+            else:
+                addPath(connectionStyle.NormalColor, connection.path())
+
+            batch.points.addEllipse(
+                connection.endPoint(PortType.Out), pointRadius, pointRadius
+            )
+            batch.points.addEllipse(
+                connection.endPoint(PortType.In), pointRadius, pointRadius
+            )
+
+        return batch
@@ -0,0 +1,123 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Iterable, override
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from SpatialNode.basic_graphics_scene import BasicGraphicsScene
+from SpatialNode.definitions import ConnectionId, PortType
+
+class _LayerConnection:
+    """
+    End points of a connection drawn by the layer, in scene coordinates,
+    with the same path and hit shape as its ConnectionGraphicsObject.
+    """
+
+    def __init__(
+        self,
+        connectionId: ConnectionId,
+        outSlot: QtCore.QPointF,
+        inSlot: QtCore.QPointF,
+        orientation: QtCore.Qt.Orientation,
+    ):
+        self.connectionId: ConnectionId = None
+        self._out: QtCore.QPointF = None
+        self._in: QtCore.QPointF = None
+        self._orientation: QtCore.Qt.Orientation = None
+        self._path: QtGui.QPainterPath | None = None
+        self._shape: QtGui.QPainterPath | None = None
+
+    def endPoint(self, portType: PortType | None) -> QtCore.QPointF: ...
+    def pointsC1C2(self) -> tuple[QtCore.QPointF, QtCore.QPointF]: ...
+    def path(self) -> QtGui.QPainterPath: ...
+    def shape(self) -> QtGui.QPainterPath: ...
+    def rect(self, pointDiameter: float) -> QtCore.QRectF: ...
+
+class _Batch:
+    """
+    The paths of one tile: a path per pen color, the end points, and the
+    middles of the connections between different data types.
+    """
+
+    def __init__(self):
+        self.paths: dict[int, tuple[QtGui.QColor, QtGui.QPainterPath]] = None
+        self.points: QtGui.QPainterPath = None
+        self.middles: list[QtCore.QPointF] = None
+
+class ConnectionLayer(QtWidgets.QGraphicsItem):
+    """
+    A single item drawing the connections of a scene that nobody interacts
+    with, for graphs too dense for one ConnectionGraphicsObject per edge.
+
+    Connections are grouped in square tiles of `cellSize`; the paths of a
+    tile are merged per pen color and rebuilt only when one of its
+    connections changes, so that a frame draws a few paths per visible tile.
+    A grid of the same cells indexes the connections for picking. Hovering
+    a connection promotes it to a ConnectionGraphicsObject through
+    `BasicGraphicsScene.promoteConnection`.
+    """
+
+    def __init__(self, scene: BasicGraphicsScene, cellSize: float = 512.0):
+        self._cellSize: float = None
+        self._connections: dict[ConnectionId, _LayerConnection] = None
+        self._rects: dict[ConnectionId, QtCore.QRectF] = None
+        self._cells: dict[tuple[int, int], set[ConnectionId]] = None
+        self._tiles: dict[tuple[int, int], set[ConnectionId]] = None
+        self._tileBounds: dict[tuple[int, int], QtCore.QRectF] = None
+        self._batches: dict[tuple[int, int], _Batch] = None
+        self._bounds: QtCore.QRectF = None
+
+    def nodeScene(self) -> BasicGraphicsScene: ...
+    def hasConnection(self, connectionId: ConnectionId) -> bool: ...
+    def connectionIds(self) -> Iterable[ConnectionId]: ...
+    def addConnection(self, connectionId: ConnectionId) -> None: ...
+    def removeConnection(self, connectionId: ConnectionId) -> bool:
+        """Returns False if the layer does not draw `connectionId`."""
+        ...
+
+    def moveConnection(self, connectionId: ConnectionId) -> None:
+        """Follows the ports of `connectionId` after a node moved."""
+        ...
+
+    def restyleConnections(self, connectionIds: Iterable[ConnectionId]) -> None:
+        """
+        Rebuilds the colors and convert icons of the connections the layer
+        draws among `connectionIds`, after the data types of their ports
+        changed. Others are ignored.
+        """
+        ...
+
+    def connectionAt(self, point: QtCore.QPointF) -> ConnectionId | None:
+        """The connection whose hit shape contains the scene `point`."""
+        ...
+
+    @override
+    def boundingRect(self) -> QtCore.QRectF:
+        """Grows with the connections, and does not shrink when they go."""
+        ...
+
+    @override
+    def contains(self, point: QtCore.QPointF) -> bool:
+        """Only a point on a connection hits the layer."""
+        ...
+
+    @override
+    def paint(self, painter, option, widget=...): ...
+    @override
+    def hoverEnterEvent(self, event): ...
+    @override
+    def hoverMoveEvent(self, event): ...
+    def _promoteAt(self, scenePoint: QtCore.QPointF) -> None: ...
+    def _portScenePosition(
+        self, connectionId: ConnectionId, portType: PortType
+    ) -> QtCore.QPointF: ...
+    def _cell(self, point: QtCore.QPointF) -> tuple[int, int]: ...
+    def _cellsOf(self, rect: QtCore.QRectF) -> list[tuple[int, int]]: ...
+    def _insert(self, connection: _LayerConnection) -> None: ...
+    def _erase(self, connection: _LayerConnection) -> None: ...
+    def _batch(self, tile: tuple[int, int]) -> _Batch: ...
+    def _buildBatch(self, connectionIds: Iterable[ConnectionId]) -> _Batch: ...
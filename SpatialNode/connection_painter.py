@@ -6,6 +6,16 @@
 
 from PySide6 import QtGui, QtCore
 
+_convertPixmap = None
+
+
+def convertPixmap():
+    global _convertPixmap
+
+    if _convertPixmap is None:
+        _convertPixmap = QtGui.QIcon(":convert.png").pixmap(QtCore.QSize(22, 22))
+    return _convertPixmap
+
 
 def cubicPath(connection):
     from SpatialNode.definitions import PortType
@@ -23,6 +33,31 @@ def cubicPath(connection):
     return cubic
 
 
+def halfCubicPaths(connection):
+    from SpatialNode.definitions import PortType
+
+    inSlot = connection.endPoint(PortType.In)
+    outSlot = connection.endPoint(PortType.Out)
+
+    c1, c2 = connection.pointsC1C2()
+
+    # de Casteljau split at t = 0.5; the control points are symmetric about
+    # the middle of the curve, so that this is also half its length
+    c01 = (outSlot + c1) / 2.0
+    c12 = (c1 + c2) / 2.0
+    c23 = (c2 + inSlot) / 2.0
+    c012 = (c01 + c12) / 2.0
+    c123 = (c12 + c23) / 2.0
+    middle = (c012 + c123) / 2.0
+
+    first = QtGui.QPainterPath(outSlot)
+    first.cubicTo(c01, c012, middle)
+    second = QtGui.QPainterPath(middle)
+    second.cubicTo(c123, c23, inSlot)
+
+    return first, second, middle
+
+
 def drawSketchLine(painter, cgo):
     from SpatialNode.style_collection import StyleCollection
 
@@ -39,7 +74,7 @@ def drawSketchLine(painter, cgo):
         painter.setPen(pen)
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
 
-        cubic = cubicPath(cgo)
+        cubic = cgo.path()
 
         # cubic spline
         painter.drawPath(cubic)
@@ -69,7 +104,7 @@ def drawHoveredOrSelected(painter, cgo):
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
 
         # cubic spline
-        cubic = cubicPath(cgo)
+        cubic = cgo.path()
         painter.drawPath(cubic)
 
 
@@ -120,40 +155,30 @@ def drawNormalLine(painter, cgo):
 
     selected = cgo.isSelected()
 
-    cubic = cubicPath(cgo)
     if useGradientColor:
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
 
+        first, second, middle = halfCubicPaths(cgo)
+
         cOut = normalColorOut
+        cIn = normalColorIn
         if selected:
             cOut = cOut.darker(200)
+            cIn = cIn.darker(200)
+
         p.setColor(cOut)
         painter.setPen(p)
+        painter.drawPath(first)
 
-        segments = 60
-        for i in range(segments):
-            ratioPrev = float(i) / segments
-            ratio = float(i + 1) / segments
+        p.setColor(cIn)
+        painter.setPen(p)
+        painter.drawPath(second)
 
-            if i == segments / 2:
-                cIn = normalColorIn
-                if selected:
-                    cIn = cIn.darker(200)
-
-                p.setColor(cIn)
-                painter.setPen(p)
-            painter.drawLine(
-                cubic.pointAtPercent(ratioPrev), cubic.pointAtPercent(ratio)
-            )
-
-            icon = QtGui.QIcon(":convert.png")
-
-            pixmap = icon.pixmap(QtCore.QSize(22, 22))
-            painter.drawPixmap(
-                cubic.pointAtPercent(0.50)
-                - QtCore.QPoint(pixmap.width() / 2, pixmap.height() / 2),
-                pixmap,
-            )
+        pixmap = convertPixmap()
+        painter.drawPixmap(
+            middle - QtCore.QPointF(pixmap.width() / 2, pixmap.height() / 2),
+            pixmap,
+        )
     else:
         p.setColor(normalColorOut)
 
@@ -163,7 +188,7 @@ def drawNormalLine(painter, cgo):
         painter.setPen(p)
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
 
-        painter.drawPath(cubic)
+        painter.drawPath(cgo.path())
 
 
 class ConnectionPainter:
@@ -189,7 +214,7 @@ class ConnectionPainter:
     def getPainterStroke(connection):
         from SpatialNode.definitions import PortType
 
-        cubic = cubicPath(connection)
+        cubic = connection.path()
 
         out = connection.endPoint(PortType.Out)
 
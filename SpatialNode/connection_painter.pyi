@@ -4,11 +4,21 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
-from PySide6 import QtGui
+from PySide6 import QtGui, QtCore
 
 from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
 
+def convertPixmap() -> QtGui.QPixmap:
+    """Icon drawn halfway along connections between different data types."""
+    ...
+
 def cubicPath(connection: ConnectionGraphicsObject) -> QtGui.QPainterPath: ...
+def halfCubicPaths(
+    connection: ConnectionGraphicsObject,
+) -> tuple[QtGui.QPainterPath, QtGui.QPainterPath, QtCore.QPointF]:
+    """The two halves of the cubic path of `connection`, and its middle."""
+    ...
+
 def drawSketchLine(painter: QtGui.QPainter, cgo: ConnectionGraphicsObject) -> None: ...
 def drawHoveredOrSelected(
     painter: QtGui.QPainter, cgo: ConnectionGraphicsObject
@@ -0,0 +1,303 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.core_signal import CoreSignal
+from SpatialNode.definitions import (
+    NodeId,
+    PortType,
+    PortRole,
+    PortIndex,
+    ConnectionId,
+    QJsonObject,
+)
+from SpatialNode.graph_connectivity import GraphConnectivity
+
+
+class CoreGraphModel(GraphConnectivity):
+    def __init__(self, registry):
+        super().__init__()
+        self._initConnectivity()
+        self._registry = registry
+        self._models = {}
+        self._nodeTypes = {}
+        self._nodePositions = {}
+        self._propagationScheduler = None
+        self._propagationBlocked = False
+
+    @property
+    def dataModelRegistry(self):
+        return self._registry
+
+    def propagationScheduler(self):
+        return self._propagationScheduler
+
+    def setPropagationScheduler(self, scheduler):
+        self._propagationScheduler = scheduler
+
+    def blockPropagation(self, blocked):
+        previous = self._propagationBlocked
+        self._propagationBlocked = blocked
+        return previous
+
+    def compile(self, outputs, inputs=()):
+        from SpatialNode.execution_plan import ExecutionPlan
+
+        return ExecutionPlan.compile(self, outputs, inputs)
+
+    def allNodeIds(self):
+        return set(self._models)
+
+    def nodeExists(self, nodeId):
+        return nodeId in self._models
+
+    def delegateModel(self, nodeId):
+        return self._models[nodeId]
+
+    def addNode(self, nodeType=""):
+        from SpatialNode.definitions import InvalidNodeId
+
+        model = self._registry.create(nodeType)
+        if model is None:
+            return InvalidNodeId
+
+        newId = self.newNodeId()
+        self._attachDelegate(newId, nodeType, model)
+        self.nodeCreated.emit(newId)
+        return newId
+
+    def connectionPossible(self, connectionId):
+        from SpatialNode.definitions import ConnectionPolicy
+
+        outModel = self._models[connectionId.outNodeId]
+        inModel = self._models[connectionId.inNodeId]
+        outType = outModel.dataType(PortType.Out, connectionId.outPortIndex)
+        inType = inModel.dataType(PortType.In, connectionId.inPortIndex)
+        if outType.id != inType.id:
+            return False
+
+        for nodeId, portType, portIndex, model in [
+            (connectionId.outNodeId, PortType.Out, connectionId.outPortIndex, outModel),
+            (connectionId.inNodeId, PortType.In, connectionId.inPortIndex, inModel),
+        ]:
+            if (
+                nodeId,
+                portType,
+                portIndex,
+            ) in self._portConnections and model.portConnectionPolicy(
+                portType, portIndex
+            ) != ConnectionPolicy.Many:
+                return False
+
+        return not self.wouldCreateCycle(connectionId)
+
+    def addConnection(self, connectionId):
+        if not self._linkConnection(connectionId):
+            return
+
+        self.connectionCreated.emit(connectionId)
+        self._models[connectionId.inNodeId].inputConnectionCreated(connectionId)
+        self._models[connectionId.outNodeId].outputConnectionCreated(connectionId)
+
+        self.setInPortsData(
+            connectionId.inNodeId,
+            {
+                connectionId.inPortIndex: self._models[connectionId.outNodeId].outData(
+                    connectionId.outPortIndex
+                )
+            },
+        )
+
+    def deleteConnection(self, connectionId):
+        if not self._unlinkConnection(connectionId):
+            return False
+
+        self.connectionDeleted.emit(connectionId)
+        self._models[connectionId.inNodeId].inputConnectionDeleted(connectionId)
+        self._models[connectionId.outNodeId].outputConnectionDeleted(connectionId)
+
+        self.setInPortsData(connectionId.inNodeId, {connectionId.inPortIndex: None})
+        return True
+
+    def deleteNode(self, nodeId):
+        if nodeId not in self._models:
+            return False
+
+        for cId in self.allConnectionIds(nodeId):
+            self.deleteConnection(cId)
+        self._unlinkNode(nodeId)
+        self._nodeTypes.pop(nodeId, None)
+        self._nodePositions.pop(nodeId, None)
+        del self._models[nodeId]
+
+        self.nodeDeleted.emit(nodeId)
+        return True
+
+    def nodeData(self, nodeId, role):
+        from SpatialNode.definitions import NodeRole
+
+        model = self._models.get(nodeId)
+        if model is None:
+            return None
+
+        match role:
+            case NodeRole.Type:
+                return self._nodeTypes[nodeId]
+
+            case NodeRole.Position:
+                return self._nodePositions.get(nodeId, (0.0, 0.0))
+
+            case NodeRole.CaptionVisible:
+                return model.captionVisible()
+
+            case NodeRole.Caption:
+                return model.caption()
+
+            case NodeRole.InternalData:
+                nodeJson = QJsonObject()
+                nodeJson["internal-data"] = model.save()
+                return nodeJson
+
+            case NodeRole.InPortCount:
+                return model.nPorts(PortType.In)
+
+            case NodeRole.OutPortCount:
+                return model.nPorts(PortType.Out)
+
+    def setNodeData(self, nodeId, role, value):
+        from SpatialNode.definitions import NodeRole
+
+        if nodeId not in self._models or role != NodeRole.Position:
+            return False
+
+        self._nodePositions[nodeId] = (float(value[0]), float(value[1]))
+        self.nodePositionUpdated.emit(nodeId)
+        return True
+
+    def portData(self, nodeId, portType, portIndex, role=PortRole.Data):
+        model = self._models.get(nodeId)
+        if model is None:
+            return None
+
+        match role:
+            case PortRole.Data:
+                if portType == PortType.Out:
+                    return model.outData(portIndex)
+
+            case PortRole.DataType:
+                return model.dataType(portType, portIndex)
+
+            case PortRole.ConnectionPolicyRole:
+                return model.portConnectionPolicy(portType, portIndex)
+
+            case PortRole.CaptionVisible:
+                return model.portCaptionVisible(portType, portIndex)
+
+            case PortRole.Caption:
+                return model.portCaption(portType, portIndex)
+
+    def setPortData(self, nodeId, portType, portIndex, value, role=PortRole.Data):
+        if role != PortRole.Data or portType != PortType.In:
+            return False
+
+        self.setInPortsData(nodeId, {portIndex: value})
+        return True
+
+    def setInPortsData(self, nodeId, inputs):
+        self._models[nodeId].deliverInData(inputs)
+        for portIndex in inputs:
+            self.inPortDataWasSet.emit(nodeId, PortType.In, portIndex)
+
+    def outData(self, nodeId, portIndex=0):
+        return self._models[nodeId].outData(portIndex)
+
+    def saveNode(self, nodeId):
+        from SpatialNode.definitions import NodeRole
+
+        x, y = self.nodeData(nodeId, NodeRole.Position)
+
+        nodeJson = QJsonObject()
+        nodeJson["id"] = nodeId
+        nodeJson["internal-data"] = self._models[nodeId].save()
+        nodeJson["position"] = {"x": x, "y": y}
+        return nodeJson
+
+    def loadNode(self, nodeJson):
+        restoredNodeId = nodeJson["id"]
+        self._nextNodeId = max(self._nextNodeId, restoredNodeId + 1)
+
+        internalDataJson = nodeJson["internal-data"]
+        delegateModelName = internalDataJson["model-name"]
+
+        model = self._registry.create(delegateModelName)
+        if model is None:
+            raise Exception(f"No registered model with name {delegateModelName}")
+
+        self._attachDelegate(restoredNodeId, delegateModelName, model)
+        posJson = nodeJson.get("position")
+        if posJson is not None:
+            self._nodePositions[restoredNodeId] = (
+                float(posJson["x"]),
+                float(posJson["y"]),
+            )
+        self.nodeCreated.emit(restoredNodeId)
+        model.load(internalDataJson)
+
+    def onOutPortDataUpdated(self, nodeId, portIndex):
+        if self._propagationBlocked or nodeId not in self._models:
+            return
+
+        if self._propagationScheduler is not None:
+            self._propagationScheduler.propagate(self, nodeId, portIndex)
+            return
+
+        connected = self._portConnections.get((nodeId, PortType.Out, portIndex))
+        if not connected:
+            return
+
+        data = self._models[nodeId].outData(portIndex)
+        for cn in list(connected):
+            self.setInPortsData(cn.inNodeId, {cn.inPortIndex: data})
+
+    def _attachDelegate(self, nodeId, nodeType, model):
+        model.dataUpdated.connect(
+            lambda portIndex: self.onOutPortDataUpdated(nodeId, portIndex)
+        )
+        model.portsAboutToBeDeleted.connect(
+            lambda portType, first, last: self.portsAboutToBeDeleted.emit(
+                nodeId, portType, first, last
+            )
+        )
+        model.portsDeleted.connect(self.portsDeleted.emit)
+        model.portsAboutToBeInserted.connect(
+            lambda portType, first, last: self.portsAboutToBeInserted.emit(
+                nodeId, portType, first, last
+            )
+        )
+        model.portsInserted.connect(self.portsInserted.emit)
+
+        self._models[nodeId] = model
+        self._nodeTypes[nodeId] = nodeType
+        self._topologicalOrder.addNode(nodeId)
+
+    nodeCreated = CoreSignal(NodeId)
+
+    nodeDeleted = CoreSignal(NodeId)
+
+    nodePositionUpdated = CoreSignal(NodeId)
+
+    connectionCreated = CoreSignal(ConnectionId)
+
+    connectionDeleted = CoreSignal(ConnectionId)
+
+    inPortDataWasSet = CoreSignal(NodeId, PortType, PortIndex)
+
+    portsAboutToBeDeleted = CoreSignal(NodeId, PortType, PortIndex, PortIndex)
+
+    portsDeleted = CoreSignal()
+
+    portsAboutToBeInserted = CoreSignal(NodeId, PortType, PortIndex, PortIndex)
+
+    portsInserted = CoreSignal()
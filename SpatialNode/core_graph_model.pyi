@@ -0,0 +1,151 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Any, Iterable
+
+from SpatialNode.core_node_delegate import CoreNodeDelegate
+from SpatialNode.core_signal import CoreSignal
+from SpatialNode.definitions import (
+    NodeId,
+    ConnectionId,
+    PortIndex,
+    PortType,
+    NodeRole,
+    PortRole,
+    QJsonObject,
+)
+from SpatialNode.node_data import NodeData
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+from SpatialNode.execution_plan import ExecutionPlan
+from SpatialNode.propagation_scheduler import PropagationScheduler
+from SpatialNode.graph_connectivity import GraphConnectivity
+
+class CoreGraphModel(GraphConnectivity):
+    """
+    Data flow graph without Qt, for batch and server-side evaluation.
+
+    Same node, connection and propagation semantics as `DataFlowGraphModel`,
+    and the same scene JSON, but notifications go through `CoreSignal` and
+    data is propagated with plain method calls. Delegates are expected to
+    derive from `CoreNodeDelegate`; a `NodeDelegateModel` works too but keeps
+    paying for its Qt signals. Wrap the model in `CoreGraphModelAdapter` to
+    show it in a `BasicGraphicsScene`.
+
+    ```python
+    model = sNode.CoreGraphModel(registry)
+    source = model.addNode("Number")
+    ...
+    model.delegateModel(source).setNumber(3.0)
+    result = model.outData(display)
+    ```
+
+    Positions are kept as `(x, y)` tuples so that saved scenes round-trip.
+    """
+
+    def __init__(self, registry: NodeDelegateModelRegistry):
+        self._registry: NodeDelegateModelRegistry = None
+        self._models: dict[NodeId, CoreNodeDelegate] = None
+        self._nodeTypes: dict[NodeId, str] = None
+        self._nodePositions: dict[NodeId, tuple[float, float]] = None
+        self._propagationScheduler: PropagationScheduler | None = None
+        self._propagationBlocked: bool = None
+
+    @property
+    def dataModelRegistry(self) -> NodeDelegateModelRegistry: ...
+    def propagationScheduler(self) -> PropagationScheduler | None: ...
+    def setPropagationScheduler(self, scheduler: PropagationScheduler | None) -> None:
+        """Same as `DataFlowGraphModel.setPropagationScheduler`."""
+        ...
+
+    def blockPropagation(self, blocked: bool) -> bool:
+        """
+        While blocked, `dataUpdated` of the delegates is ignored. Returns the
+        previous state, as `QObject.blockSignals`.
+        """
+        ...
+
+    def compile(
+        self, outputs: Iterable[NodeId], inputs: Iterable[tuple[NodeId, PortIndex]] = ()
+    ) -> ExecutionPlan:
+        """See `ExecutionPlan.compile`."""
+        ...
+
+    def allNodeIds(self) -> set[NodeId]: ...
+    def nodeExists(self, nodeId: NodeId) -> bool: ...
+    def delegateModel(self, nodeId: NodeId) -> CoreNodeDelegate: ...
+    def addNode(self, nodeType: str = "") -> NodeId:
+        """Returns `InvalidNodeId` for a type missing from the registry."""
+        ...
+
+    def connectionPossible(self, connectionId: ConnectionId) -> bool:
+        """Matching data types, vacant ports and no cycle."""
+        ...
+
+    def addConnection(self, connectionId: ConnectionId) -> None: ...
+    def deleteConnection(self, connectionId: ConnectionId) -> bool: ...
+    def deleteNode(self, nodeId: NodeId) -> bool: ...
+    def nodeData(self, nodeId: NodeId, role: NodeRole) -> Any:
+        """
+        Answers the roles which do not need Qt: `Type`, `Position`, `Caption`,
+        `CaptionVisible`, `InternalData` and the port counts.
+        """
+        ...
+
+    def setNodeData(
+        self, nodeId: NodeId, role: NodeRole, value: tuple[float, float]
+    ) -> bool:
+        """Only `NodeRole.Position` can be set."""
+        ...
+
+    def portData(
+        self,
+        nodeId: NodeId,
+        portType: PortType,
+        portIndex: PortIndex,
+        role: PortRole = PortRole.Data,
+    ) -> Any: ...
+    def setPortData(
+        self,
+        nodeId: NodeId,
+        portType: PortType,
+        portIndex: PortIndex,
+        value: NodeData | None,
+        role: PortRole = PortRole.Data,
+    ) -> bool: ...
+    def setInPortsData(
+        self, nodeId: NodeId, inputs: dict[PortIndex, NodeData | None]
+    ) -> None: ...
+    def outData(self, nodeId: NodeId, portIndex: PortIndex = 0) -> NodeData | None: ...
+    def saveNode(self, nodeId: NodeId) -> QJsonObject: ...
+    def loadNode(self, nodeJson: QJsonObject) -> None: ...
+    def onOutPortDataUpdated(self, nodeId: NodeId, portIndex: PortIndex) -> None: ...
+    def _attachDelegate(
+        self, nodeId: NodeId, nodeType: str, model: CoreNodeDelegate
+    ) -> None: ...
+
+    nodeCreated: CoreSignal(NodeId)
+
+    nodeDeleted: CoreSignal(NodeId)
+
+    nodePositionUpdated: CoreSignal(NodeId)
+
+    connectionCreated: CoreSignal(ConnectionId)
+
+    connectionDeleted: CoreSignal(ConnectionId)
+
+    inPortDataWasSet: CoreSignal(NodeId, PortType, PortIndex)
+
+    portsAboutToBeDeleted: CoreSignal(NodeId, PortType, PortIndex, PortIndex)
+    """
+    Forwarded from the delegates. Shifting the connections of the moved
+    ports is left to `CoreGraphModelAdapter`.
+    """
+
+    portsDeleted: CoreSignal()
+
+    portsAboutToBeInserted: CoreSignal(NodeId, PortType, PortIndex, PortIndex)
+
+    portsInserted: CoreSignal()
@@ -0,0 +1,169 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import override
+
+from PySide6 import QtCore
+
+from SpatialNode.abstract_graph_model import AbstractGraphModel
+from SpatialNode.serializable import Serializable
+
+
+class CoreGraphModelAdapter(AbstractGraphModel, Serializable):
+    def __init__(self, coreModel):
+        super().__init__()
+        self._coreModel = coreModel
+        self._nodeSizes = {}
+
+        coreModel.nodeCreated.connect(self.notifyNodeCreated)
+        coreModel.nodeDeleted.connect(self.onCoreNodeDeleted)
+        coreModel.nodePositionUpdated.connect(self.notifyNodePositionUpdated)
+        coreModel.connectionCreated.connect(self.notifyConnectionCreated)
+        coreModel.connectionDeleted.connect(self.notifyConnectionDeleted)
+        coreModel.inPortDataWasSet.connect(self.onCoreInPortDataWasSet)
+        coreModel.portsAboutToBeDeleted.connect(self.portsAboutToBeDeleted)
+        coreModel.portsDeleted.connect(self.portsDeleted)
+        coreModel.portsAboutToBeInserted.connect(self.portsAboutToBeInserted)
+        coreModel.portsInserted.connect(self.portsInserted)
+
+    def coreModel(self):
+        return self._coreModel
+
+    @property
+    def dataModelRegistry(self):
+        return self._coreModel.dataModelRegistry
+
+    def delegateModel(self, nodeId):
+        return self._coreModel.delegateModel(nodeId)
+
+    @override
+    def newNodeId(self):
+        return self._coreModel.newNodeId()
+
+    @override
+    def allNodeIds(self):
+        return self._coreModel.allNodeIds()
+
+    @override
+    def allConnectionIds(self, nodeId):
+        return self._coreModel.allConnectionIds(nodeId)
+
+    @override
+    def connections(self, nodeId, portType, index):
+        return self._coreModel.connections(nodeId, portType, index)
+
+    @override
+    def connectionExists(self, connectionId):
+        return self._coreModel.connectionExists(connectionId)
+
+    @override
+    def addNode(self, nodeType=""):
+        return self._coreModel.addNode(nodeType)
+
+    @override
+    def connectionPossible(self, connectionId):
+        return self._coreModel.connectionPossible(connectionId)
+
+    @override
+    def addConnection(self, connectionId):
+        self._coreModel.addConnection(connectionId)
+
+    @override
+    def nodeExists(self, nodeId):
+        return self._coreModel.nodeExists(nodeId)
+
+    @override
+    def nodeData(self, nodeId, role):
+        from SpatialNode.definitions import NodeRole
+        from SpatialNode.style_collection import StyleCollection
+
+        if not self._coreModel.nodeExists(nodeId):
+            return None
+
+        match role:
+            case NodeRole.Position:
+                x, y = self._coreModel.nodeData(nodeId, role)
+                return QtCore.QPointF(x, y)
+
+            case NodeRole.Size:
+                return self._nodeSizes.get(nodeId, QtCore.QSize(0, 0))
+
+            case NodeRole.Style:
+                return StyleCollection.nodeStyle().toJson()
+
+            case NodeRole.Widget:
+                return self._coreModel.delegateModel(nodeId).embeddedWidget()
+
+            case NodeRole.Computing:
+                return False
+
+        return self._coreModel.nodeData(nodeId, role)
+
+    @override
+    def nodeStyle(self, nodeId):
+        from SpatialNode.style_collection import StyleCollection
+
+        return StyleCollection.nodeStyle()
+
+    @override
+    def nodeFlags(self, nodeId):
+        from SpatialNode.definitions import NodeFlag
+
+        if self._coreModel.delegateModel(nodeId).resizable():
+            return NodeFlag.Resizable
+        return NodeFlag.NoFlags
+
+    @override
+    def setNodeData(self, nodeId, role, value):
+        from SpatialNode.definitions import NodeRole
+
+        match role:
+            case NodeRole.Position:
+                return self._coreModel.setNodeData(nodeId, role, (value.x(), value.y()))
+            case NodeRole.Size:
+                self._nodeSizes[nodeId] = value
+                return True
+        return False
+
+    @override
+    def portData(self, nodeId, portType, index, role):
+        return self._coreModel.portData(nodeId, portType, index, role)
+
+    @override
+    def setPortData(self, nodeId, portType, index, value, role):
+        return self._coreModel.setPortData(nodeId, portType, index, value, role)
+
+    @override
+    def deleteConnection(self, connectionId):
+        return self._coreModel.deleteConnection(connectionId)
+
+    @override
+    def deleteNode(self, nodeId):
+        return self._coreModel.deleteNode(nodeId)
+
+    @override
+    def saveNode(self, nodeId):
+        return self._coreModel.saveNode(nodeId)
+
+    @override
+    def loadNode(self, nodeJson):
+        self._coreModel.loadNode(nodeJson)
+
+    @override
+    def save(self):
+        return self._coreModel.save()
+
+    @override
+    def load(self, jsonDocument):
+        self._coreModel.load(jsonDocument)
+
+    def onCoreNodeDeleted(self, nodeId):
+        self._nodeSizes.pop(nodeId, None)
+        self.notifyNodeDeleted(nodeId)
+
+    def onCoreInPortDataWasSet(self, nodeId, portType, index):
+        # embedded widgets and captions may show the new data
+        self.notifyNodeUpdated(nodeId)
@@ -0,0 +1,108 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Any, override
+
+from PySide6 import QtCore
+
+from SpatialNode.abstract_graph_model import AbstractGraphModel
+from SpatialNode.core_graph_model import CoreGraphModel
+from SpatialNode.core_node_delegate import CoreNodeDelegate
+from SpatialNode.definitions import (
+    NodeId,
+    NodeFlag,
+    ConnectionId,
+    PortIndex,
+    PortType,
+    NodeRole,
+    PortRole,
+    QJsonObject,
+)
+from SpatialNode.node_data import NodeData
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+from SpatialNode.node_style import NodeStyle
+from SpatialNode.serializable import Serializable
+
+class CoreGraphModelAdapter(AbstractGraphModel, Serializable):
+    """
+    Exposes a `CoreGraphModel` as an `AbstractGraphModel`, so that a headless
+    graph can be shown and edited in a `BasicGraphicsScene`.
+
+    Graph queries and edits are forwarded to the core model, and its
+    notifications are re-emitted as Qt signals. Only GUI state lives here:
+    node sizes, the style and the embedded widgets.
+
+    ```python
+    core = sNode.CoreGraphModel(registry)
+    scene = sNode.BasicGraphicsScene(sNode.CoreGraphModelAdapter(core))
+    ```
+    """
+
+    def __init__(self, coreModel: CoreGraphModel):
+        self._coreModel: CoreGraphModel = None
+        self._nodeSizes: dict[NodeId, QtCore.QSize] = None
+
+    def coreModel(self) -> CoreGraphModel: ...
+    @property
+    def dataModelRegistry(self) -> NodeDelegateModelRegistry: ...
+    def delegateModel(self, nodeId: NodeId) -> CoreNodeDelegate: ...
+    @override
+    def newNodeId(self) -> NodeId: ...
+    @override
+    def allNodeIds(self) -> set[NodeId]: ...
+    @override
+    def allConnectionIds(self, nodeId: NodeId) -> set[ConnectionId]: ...
+    @override
+    def connections(
+        self, nodeId: NodeId, portType: PortType, index: PortIndex
+    ) -> set[ConnectionId]: ...
+    @override
+    def connectionExists(self, connectionId: ConnectionId) -> bool: ...
+    @override
+    def addNode(self, nodeType: str = "") -> NodeId: ...
+    @override
+    def connectionPossible(self, connectionId: ConnectionId) -> bool: ...
+    @override
+    def addConnection(self, connectionId: ConnectionId) -> None: ...
+    @override
+    def nodeExists(self, nodeId: NodeId) -> bool: ...
+    @override
+    def nodeData(self, nodeId: NodeId, role: NodeRole) -> Any: ...
+    @override
+    def nodeStyle(self, nodeId: NodeId) -> NodeStyle: ...
+    @override
+    def nodeFlags(self, nodeId: NodeId) -> NodeFlag: ...
+    @override
+    def setNodeData(self, nodeId: NodeId, role: NodeRole, value: Any) -> bool: ...
+    @override
+    def portData(
+        self, nodeId: NodeId, portType: PortType, index: PortIndex, role: PortRole
+    ) -> Any: ...
+    @override
+    def setPortData(
+        self,
+        nodeId: NodeId,
+        portType: PortType,
+        index: PortIndex,
+        value: NodeData | None,
+        role: PortRole,
+    ) -> bool: ...
+    @override
+    def deleteConnection(self, connectionId: ConnectionId) -> bool: ...
+    @override
+    def deleteNode(self, nodeId: NodeId) -> bool: ...
+    @override
+    def saveNode(self, nodeId: NodeId) -> QJsonObject: ...
+    @override
+    def loadNode(self, nodeJson: QJsonObject) -> None: ...
+    @override
+    def save(self) -> QJsonObject: ...
+    @override
+    def load(self, jsonDocument: QJsonObject) -> None: ...
+    def onCoreNodeDeleted(self, nodeId: NodeId) -> None: ...
+    def onCoreInPortDataWasSet(
+        self, nodeId: NodeId, portType: PortType, index: PortIndex
+    ) -> None: ...
@@ -0,0 +1,181 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import copy
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import override
+
+from SpatialNode.core_signal import BoundCoreSignal, CoreSignal
+from SpatialNode.definitions import QJsonObject
+from SpatialNode.serializable import Serializable
+
+
+_MEMO_ATTRIBUTES = ("_memoCache", "_memoFingerprints", "memoHits", "memoMisses")
+
+
+class CoreNodeDelegate(Serializable):
+    memoCacheSize = 0
+    computesAsynchronously = False
+
+    def __init__(self):
+        super().__init__()
+        self._memoCache = OrderedDict()
+        self._memoFingerprints = {}
+        self.memoHits = 0
+        self.memoMisses = 0
+
+    def captionVisible(self):
+        return True
+
+    def caption(self):
+        return "NodeDelegateModel"
+
+    def portCaptionVisible(self, port_type, port_index):
+        return False
+
+    def portCaption(self, port_type, port_index):
+        return ""
+
+    @staticmethod
+    def register(registry, *args, **kwargs): ...
+
+    @override
+    def save(self):
+        modelJson = QJsonObject()
+        modelJson["model-name"] = type(self).__name__
+        return modelJson
+
+    @override
+    def load(self, p): ...
+
+    @abstractmethod
+    def nPorts(self, portType): ...
+
+    @abstractmethod
+    def dataType(self, portType, portIndex): ...
+
+    def portConnectionPolicy(self, port_type, port_index):
+        from SpatialNode.definitions import ConnectionPolicy, PortType
+
+        result = ConnectionPolicy.One
+        match port_type:
+            case PortType.In:
+                result = ConnectionPolicy.One
+            case PortType.Out:
+                result = ConnectionPolicy.Many
+
+        return result
+
+    @abstractmethod
+    def setInData(self, nodeData, portIndex): ...
+
+    def setInDataMany(self, inputs):
+        for portIndex in sorted(inputs):
+            self.setInData(inputs[portIndex], portIndex)
+
+    def deliverInData(self, inputs):
+        if self.memoCacheSize <= 0:
+            self._applyInData(inputs)
+            return
+
+        for portIndex, nodeData in inputs.items():
+            self._memoFingerprints[portIndex] = self.fingerprint(nodeData)
+
+        key = tuple(sorted(self._memoFingerprints.items()))
+        if any(fingerprint is None for _, fingerprint in key):
+            self.memoMisses += 1
+            self._applyInData(inputs)
+            return
+
+        state = self._memoCache.get(key)
+        if state is not None:
+            from SpatialNode.definitions import PortType
+
+            self.memoHits += 1
+            self._memoCache.move_to_end(key)
+            self.restoreMemoState(state)
+            for portIndex in range(self.nPorts(PortType.Out)):
+                self.dataUpdated.emit(portIndex)
+            return
+
+        self.memoMisses += 1
+        self._applyInData(inputs)
+        self._memoCache[key] = self.memoState()
+        while len(self._memoCache) > self.memoCacheSize:
+            self._memoCache.popitem(last=False)
+
+    def computeBatch(self, inputs):
+        return NotImplemented
+
+    def _applyInData(self, inputs):
+        if len(inputs) == 1:
+            ((portIndex, nodeData),) = inputs.items()
+            self.setInData(nodeData, portIndex)
+        else:
+            self.setInDataMany(inputs)
+
+    def fingerprint(self, nodeData):
+        if nodeData is None:
+            return ()
+        return nodeData.fingerprint()
+
+    def memoState(self):
+        return {
+            name: copy.copy(value) if isinstance(value, (dict, list, set)) else value
+            for name, value in vars(self).items()
+            if name not in _MEMO_ATTRIBUTES and not isinstance(value, BoundCoreSignal)
+        }
+
+    def restoreMemoState(self, state):
+        for name, value in state.items():
+            setattr(
+                self,
+                name,
+                copy.copy(value) if isinstance(value, (dict, list, set)) else value,
+            )
+
+    def clearMemo(self):
+        self._memoCache.clear()
+        self.memoHits = 0
+        self.memoMisses = 0
+
+    @abstractmethod
+    def outData(self, port): ...
+
+    def embeddedWidget(self):
+        return None
+
+    def resizable(self):
+        return False
+
+    from SpatialNode.definitions import PortIndex, PortType
+
+    dataUpdated = CoreSignal(PortIndex)
+
+    dataInvalidated = CoreSignal(PortIndex)
+
+    computingStarted = CoreSignal()
+
+    computingFinished = CoreSignal()
+
+    embeddedWidgetSizeUpdated = CoreSignal()
+
+    portsAboutToBeDeleted = CoreSignal(PortType, PortIndex, PortIndex)
+
+    portsDeleted = CoreSignal()
+
+    portsAboutToBeInserted = CoreSignal(PortType, PortIndex, PortIndex)
+
+    portsInserted = CoreSignal()
+
+    def inputConnectionCreated(self, connection_id): ...
+
+    def inputConnectionDeleted(self, connection_id): ...
+
+    def outputConnectionCreated(self, connection_id): ...
+
+    def outputConnectionDeleted(self, connection_id): ...
@@ -0,0 +1,170 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, override
+
+from SpatialNode.batch_column import BatchColumn
+from SpatialNode.core_signal import CoreSignal
+from SpatialNode.definitions import (
+    PortType,
+    PortIndex,
+    ConnectionId,
+    ConnectionPolicy,
+    QJsonObject,
+)
+from SpatialNode.node_data import NodeData, NodeDataType
+from SpatialNode.serializable import Serializable
+
+_MEMO_ATTRIBUTES: tuple[str, ...]
+
+class CoreNodeDelegate(Serializable, ABC):
+    """
+    Delegate protocol of the Qt-free core: everything `CoreGraphModel` needs
+    from a node, with `CoreSignal` in place of Qt signals. Delegates written
+    against it run headless without importing PySide6. `NodeDelegateModel`
+    extends it with Qt signals, a style and an embedded widget for the GUI.
+    """
+
+    memoCacheSize: int = 0
+    """
+    Number of input combinations whose results are remembered per node, least
+    recently used first out. `0` disables memoization. Only enable it for
+    synchronous delegates whose state is a pure function of their inputs.
+    """
+
+    computesAsynchronously: bool = False
+    """
+    Whether `outData` only reflects new inputs once a background compute
+    finished, as for `AsyncNodeDelegateModel`. `ExecutionPlan` rejects such
+    delegates.
+    """
+
+    def __init__(self):
+        self._memoCache: OrderedDict[tuple, dict[str, Any]] = None
+        self._memoFingerprints: dict[PortIndex, Hashable | None] = None
+        self.memoHits: int = None
+        self.memoMisses: int = None
+
+    def captionVisible(self) -> bool:
+        """It is possible to hide caption in GUI"""
+        ...
+
+    def caption(self) -> str:
+        """
+        Caption is used in GUI
+        """
+        ...
+
+    def portCaptionVisible(
+        self, portType: PortType | None, portIndex: PortIndex
+    ) -> bool:
+        """
+        It is possible to hide port caption in GUI
+        """
+        ...
+
+    def portCaption(self, portType: PortType | None, portIndex: PortIndex) -> str:
+        """
+        Port caption is used in GUI to label individual ports
+        """
+        ...
+
+    @staticmethod
+    def register(registry, *args, **kwargs): ...
+    @override
+    def save(self): ...
+    @override
+    def load(self, p: QJsonObject): ...
+    @abstractmethod
+    def nPorts(self, portType: PortType | None) -> int: ...
+    @abstractmethod
+    def dataType(
+        self, portType: PortType | None, portIndex: PortIndex
+    ) -> NodeDataType: ...
+    def portConnectionPolicy(
+        self, portType: PortType | None, portIndex: PortIndex
+    ) -> ConnectionPolicy: ...
+    @abstractmethod
+    def setInData(self, nodeData: NodeData, portIndex: PortIndex) -> None: ...
+    def setInDataMany(self, inputs: dict[PortIndex, NodeData | None]) -> None:
+        """
+        Sets several inputs at once. Used by `PropagationScheduler` when more
+        than one input changed in the same wave; the default calls `setInData`
+        per port. Override it to compute only once.
+        """
+        ...
+
+    def deliverInData(self, inputs: dict[PortIndex, NodeData | None]) -> None:
+        """
+        Entry point used by the graph models to set inputs. Calls
+        `setInData`, or `setInDataMany` for several ports. With
+        `memoCacheSize` set, the fingerprints of all current inputs form the
+        cache key: on a hit the state saved after the matching compute is
+        restored and `dataUpdated` emitted on every output instead of
+        computing again.
+        """
+        ...
+
+    def computeBatch(
+        self, inputs: dict[PortIndex, BatchColumn]
+    ) -> dict[PortIndex, BatchColumn | list[NodeData | None]]:
+        """
+        Vectorized compute used by `ExecutionPlan.runBatch`: maps the columns
+        of all the connected inputs to one column or list of rows per output
+        port. The default returns `NotImplemented`, and the batch is then fed
+        row by row through `deliverInData`.
+        """
+        ...
+
+    def _applyInData(self, inputs: dict[PortIndex, NodeData | None]) -> None: ...
+    def fingerprint(self, nodeData: NodeData | None) -> Hashable | None:
+        """`NodeData.fingerprint()`; an empty input has a fingerprint too."""
+        ...
+
+    def memoState(self) -> dict[str, Any]:
+        """
+        Snapshot of the instance attributes taken after a compute. Containers
+        are copied one level deep. Override it together with
+        `restoreMemoState` for delegates with heavier state.
+        """
+        ...
+
+    def restoreMemoState(self, state: dict[str, Any]) -> None: ...
+    def clearMemo(self) -> None: ...
+    @abstractmethod
+    def outData(self, port: PortIndex) -> NodeData: ...
+    def embeddedWidget(self) -> Any:
+        """Nothing to embed headless."""
+        ...
+
+    def resizable(self) -> bool: ...
+
+    dataUpdated: CoreSignal(PortIndex)
+    """Triggers the updates in the nodes downstream."""
+
+    dataInvalidated: CoreSignal(PortIndex)
+    """Triggers the propagation of the empty data downstream."""
+
+    computingStarted: CoreSignal()
+
+    computingFinished: CoreSignal()
+
+    embeddedWidgetSizeUpdated: CoreSignal()
+
+    portsAboutToBeDeleted: CoreSignal(PortType, PortIndex, PortIndex)
+
+    portsDeleted: CoreSignal()
+
+    portsAboutToBeInserted: CoreSignal(PortType, PortIndex, PortIndex)
+
+    portsInserted: CoreSignal()
+
+    def inputConnectionCreated(self, connectionId: ConnectionId) -> None: ...
+    def inputConnectionDeleted(self, connectionId: ConnectionId) -> None: ...
+    def outputConnectionCreated(self, connectionId: ConnectionId) -> None: ...
+    def outputConnectionDeleted(self, connectionId: ConnectionId) -> None: ...
@@ -0,0 +1,46 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+
+class BoundCoreSignal:
+    __slots__ = ("_slots",)
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self._slots.clear()
+            return True
+        try:
+            self._slots.remove(slot)
+        except ValueError:
+            return False
+        return True
+
+    def emit(self, *args):
+        for slot in self._slots[:]:
+            slot(*args)
+
+
+class CoreSignal:
+    def __init__(self, *types):
+        self._types = types
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # stored on the instance, later lookups bypass the descriptor
+        bound = BoundCoreSignal()
+        instance.__dict__[self._name] = bound
+        return bound
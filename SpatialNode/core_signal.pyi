@@ -0,0 +1,44 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Any, Callable
+
+class BoundCoreSignal:
+    """
+    Signal of one instance: the slots are plain callables invoked in
+    connection order, synchronously, from `emit`.
+    """
+
+    def __init__(self):
+        self._slots: list[Callable[..., Any]] = None
+
+    def connect(self, slot: Callable[..., Any]) -> None: ...
+    def disconnect(self, slot: Callable[..., Any] | None = None) -> bool:
+        """Without `slot`, disconnects everything."""
+        ...
+
+    def emit(self, *args: Any) -> None: ...
+
+class CoreSignal:
+    """
+    Qt-free stand-in for `QtCore.Signal`, declared the same way as a class
+    attribute, so code written against `connect`/`emit` works with both.
+    Emitting costs one Python call per slot, without Qt's dispatch and
+    argument conversion, and connecting is a list append.
+
+    ```python
+    class Source(CoreNodeDelegate):
+        dataUpdated = CoreSignal(PortIndex)
+    ```
+    """
+
+    def __init__(self, *types: type):
+        self._types: tuple[type, ...] = None
+        """Argument types, for documentation only."""
+        self._name: str = None
+
+    def __set_name__(self, owner: type, name: str) -> None: ...
+    def __get__(self, instance: Any, owner: type | None = None) -> BoundCoreSignal: ...
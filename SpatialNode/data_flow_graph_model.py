@@ -9,7 +9,8 @@ from typing import override
 from PySide6 import QtCore
 
 from SpatialNode.abstract_graph_model import AbstractGraphModel
-from SpatialNode.connection_id_utils import fromJson
+from SpatialNode.graph_connectivity import GraphConnectivity
+from SpatialNode.lazy_node_delegate import LazyNodeDelegate, LazyNodeType
 from SpatialNode.definitions import (
     PortRole,
     NodeId,
@@ -18,7 +19,6 @@ from SpatialNode.definitions import (
     QJsonObject,
     NodeRole,
 )
-from SpatialNode.serializable import Serializable
 
 
 class NodeGeometryData:
@@ -30,19 +30,116 @@ class NodeGeometryData:
         self.pos = pos
 
 
-class DataFlowGraphModel(AbstractGraphModel, Serializable):
+class NodePortDescriptors:
+    def __init__(self, model):
+        from SpatialNode.definitions import PortType
+
+        self.caption = model.caption()
+        self.captionVisible = model.captionVisible()
+        self.resizable = model.resizable()
+        self.counts = {}
+        self.dataTypes = {}
+        self.policies = {}
+        self.captionsVisible = {}
+        self.captions = {}
+
+        for portType in (PortType.In, PortType.Out):
+            count = model.nPorts(portType)
+            self.counts[portType] = count
+            for portIndex in range(count):
+                key = (portType, portIndex)
+                self.dataTypes[key] = model.dataType(portType, portIndex)
+                self.policies[key] = model.portConnectionPolicy(portType, portIndex)
+                self.captionsVisible[key] = model.portCaptionVisible(
+                    portType, portIndex
+                )
+                self.captions[key] = model.portCaption(portType, portIndex)
+
+
+class NodeDelegateSlots(QtCore.QObject):
+    # slots of a QObject keep `connect` linear in the number of nodes, where
+    # lambdas are quadratic and `sender()` scans every connected delegate
+    def __init__(self, graphModel, nodeId, model):
+        super().__init__()
+        self._graphModel = graphModel
+        self._nodeId = nodeId
+
+        model.dataUpdated.connect(self.onDataUpdated)
+        model.portsAboutToBeDeleted.connect(self.onPortsAboutToBeDeleted)
+        model.portsDeleted.connect(graphModel.portsDeleted)
+        model.portsAboutToBeInserted.connect(self.onPortsAboutToBeInserted)
+        model.portsInserted.connect(graphModel.portsInserted)
+        model.computingStarted.connect(self.onComputingStarted)
+        model.computingFinished.connect(self.onComputingFinished)
+        model.nodeStyleUpdated.connect(self.onNodeStyleUpdated)
+
+    def onDataUpdated(self, portIndex):
+        self._graphModel.onOutPortDataUpdated(self._nodeId, portIndex)
+
+    def onPortsAboutToBeDeleted(self, portType, first, last):
+        self._graphModel.portsAboutToBeDeleted(self._nodeId, portType, first, last)
+
+    def onPortsAboutToBeInserted(self, portType, first, last):
+        self._graphModel.portsAboutToBeInserted(self._nodeId, portType, first, last)
+
+    def onComputingStarted(self):
+        self._graphModel.onComputingStarted(self._nodeId)
+
+    def onComputingFinished(self):
+        self._graphModel.onComputingFinished(self._nodeId)
+
+    def onNodeStyleUpdated(self):
+        self._graphModel.notifyNodeUpdated(self._nodeId)
+
+
+class DataFlowGraphModel(GraphConnectivity, AbstractGraphModel):
+    _jsonArray = QtCore.QJsonArray
+
     def __init__(self, registry):
         super().__init__()
+        self._initConnectivity()
         self._registry = registry
-        self._nextNodeId = 0
         self._models = {}
-        self._connectivity = set()
         self._nodeGeometryData = {}
+        self._portDescriptors = {}
+        self._portsChangingNode = None
+        self._propagationScheduler = None
+        self._propagationBlocked = False
+        self._lazyEvaluation = False
+        self._dirtyInputs = {}
+        self._delegateSlots = {}
+        self._lazyNodeTypes = {}
+        self._computingNodes = set()
 
     @property
     def dataModelRegistry(self):
         return self._registry
 
+    def propagationScheduler(self):
+        return self._propagationScheduler
+
+    def setPropagationScheduler(self, scheduler):
+        self._propagationScheduler = scheduler
+
+    def blockPropagation(self, blocked):
+        previous = self._propagationBlocked
+        self._propagationBlocked = blocked
+        return previous
+
+    def compile(self, outputs, inputs=()):
+        from SpatialNode.execution_plan import ExecutionPlan
+
+        return ExecutionPlan.compile(self, outputs, inputs)
+
+    def isLazyEvaluation(self):
+        return self._lazyEvaluation
+
+    def setLazyEvaluation(self, enabled):
+        if not enabled:
+            for nodeId in list(self._dirtyInputs):
+                self.pull(nodeId)
+        self._lazyEvaluation = enabled
+
     @override
     def allNodeIds(self):
         from SpatialNode.definitions import NodeId
@@ -52,34 +149,6 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
             nodeIds.add(p)
         return nodeIds
 
-    @override
-    def allConnectionIds(self, nodeId):
-        from SpatialNode.definitions import ConnectionId
-
-        nodeIds: set[ConnectionId] = set()
-        for p in self._connectivity:
-            if p.inNodeId == nodeId or p.outNodeId == nodeId:
-                nodeIds.add(p)
-        return nodeIds
-
-    @override
-    def connections(self, nodeId, portType, port_index):
-        from SpatialNode.definitions import ConnectionId
-        from SpatialNode.connection_id_utils import getNodeId, getPortIndex
-
-        result: set[ConnectionId] = set()
-        for cid in self._connectivity:
-            if (
-                getNodeId(portType, cid) == nodeId
-                and getPortIndex(portType, cid) == port_index
-            ):
-                result.add(cid)
-        return result
-
-    @override
-    def connectionExists(self, connectionId):
-        return connectionId in self._connectivity
-
     @override
     def addNode(self, nodeType=""):
         from SpatialNode.definitions import InvalidNodeId
@@ -88,23 +157,13 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
 
         if model is not None:
             newId = self.newNodeId()
-            model.dataUpdated.connect(
-                lambda portIndex: self.onOutPortDataUpdated(newId, portIndex)
-            )
-            model.portsAboutToBeDeleted.connect(
-                lambda portType, first, last: self.portsAboutToBeDeleted(
-                    newId, portType, first, last
-                )
-            )
-            model.portsDeleted.connect(self.portsDeleted)
-            model.portsAboutToBeInserted.connect(
-                lambda portType, first, last: self.portsAboutToBeInserted(
-                    newId, portType, first, last
-                )
-            )
-            model.portsInserted.connect(self.portsInserted)
+            self._connectDelegate(newId, model)
             self._models[newId] = model
-            self.nodeCreated.emit(newId)
+            self._topologicalOrder.addNode(newId)
+            self._nodeGeometryData[newId] = NodeGeometryData(
+                QtCore.QSize(0, 0), QtCore.QPointF()
+            )
+            self.notifyNodeCreated(newId)
 
             return newId
         return InvalidNodeId
@@ -136,14 +195,20 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
             getDataType(PortType.Out).id == getDataType(PortType.In).id
             and portVacant(PortType.Out)
             and portVacant(PortType.In)
+            and not self.wouldCreateCycle(connectionId)
         )
 
     @override
     def addConnection(self, connectionId):
         from SpatialNode.definitions import PortType, PortRole
 
-        self._connectivity.add(connectionId)
-        self.sendConnectionCreation(connectionId)
+        if not self._insertConnection(connectionId):
+            return
+
+        if self._lazyEvaluation:
+            self.invalidateInput(connectionId.inNodeId, connectionId.inPortIndex)
+            return
+
         portDataToPropagate = self.portData(
             connectionId.outNodeId,
             PortType.Out,
@@ -158,6 +223,13 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
             PortRole.Data,
         )
 
+    def _insertConnection(self, connectionId):
+        if not self._linkConnection(connectionId):
+            return False
+
+        self.sendConnectionCreation(connectionId)
+        return True
+
     @override
     def nodeExists(self, nodeId):
         return nodeId in self._models
@@ -165,7 +237,6 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
     @override
     def nodeData(self, nodeId, role):
         from SpatialNode.definitions import NodeRole, PortType
-        from SpatialNode.style_collection import StyleCollection
 
         result = self._models.get(nodeId)
         if result is None:
@@ -176,20 +247,20 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
                 return result.name()
 
             case NodeRole.Position:
-                return self._nodeGeometryData[nodeId].pos
+                return self._nodePosition(nodeId)
 
             case NodeRole.Size:
-                return self._nodeGeometryData[nodeId].size
+                geometry = self._nodeGeometryData.get(nodeId)
+                return QtCore.QSize(0, 0) if geometry is None else geometry.size
 
             case NodeRole.CaptionVisible:
-                return result.captionVisible()
+                return self.portDescriptors(nodeId).captionVisible
 
             case NodeRole.Caption:
-                return result.caption()
+                return self.portDescriptors(nodeId).caption
 
             case NodeRole.Style:
-                style = StyleCollection.nodeStyle()
-                return style.toJson()
+                return self.nodeStyle(nodeId).toJson()
 
             case NodeRole.InternalData:
                 nodeJson = QJsonObject()
@@ -197,20 +268,31 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
                 return nodeJson
 
             case NodeRole.InPortCount:
-                return result.nPorts(PortType.In)
+                return self.portDescriptors(nodeId).counts[PortType.In]
 
             case NodeRole.OutPortCount:
-                return result.nPorts(PortType.Out)
+                return self.portDescriptors(nodeId).counts[PortType.Out]
 
             case NodeRole.Widget:
                 return result.embeddedWidget()
 
+            case NodeRole.Computing:
+                return nodeId in self._computingNodes
+
+    @override
+    def nodeStyle(self, nodeId):
+        model = self._models[nodeId]
+        if type(model) is LazyNodeDelegate:
+            from SpatialNode.style_collection import StyleCollection
+
+            return StyleCollection.nodeStyle()
+        return model.effectiveNodeStyle()
+
     @override
     def nodeFlags(self, nodeId):
         from SpatialNode.definitions import NodeFlag
 
-        it = self._models[nodeId]
-        if it is not None and it.resizable():
+        if self.portDescriptors(nodeId).resizable:
             return NodeFlag.Resizable
         return NodeFlag.NoFlags
 
@@ -218,21 +300,35 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
     def setNodeData(self, nodeId, role, value):
         from SpatialNode.definitions import NodeRole
 
-        self._nodeGeometryData.setdefault(
-            nodeId, NodeGeometryData(QtCore.QSize(0, 0), QtCore.QPointF())
-        )
-
         result = False
         match role:
             case NodeRole.Position:
-                self._nodeGeometryData[nodeId].pos = value
-                self.nodePositionUpdated.emit(nodeId)
+                self._nodeGeometry(nodeId).pos = value
+                self.notifyNodePositionUpdated(nodeId)
                 result = True
             case NodeRole.Size:
-                self._nodeGeometryData[nodeId].size = value
+                self._nodeGeometry(nodeId).size = value
                 result = True
         return result
 
+    def _nodeGeometry(self, nodeId):
+        geometry = self._nodeGeometryData.get(nodeId)
+        if geometry is None:
+            geometry = NodeGeometryData(QtCore.QSize(0, 0), self._nodePosition(nodeId))
+            self._nodeGeometryData[nodeId] = geometry
+        return geometry
+
+    def _nodePosition(self, nodeId):
+        geometry = self._nodeGeometryData.get(nodeId)
+        if geometry is not None:
+            return geometry.pos
+
+        # lazy nodes keep their position in the scene file until moved
+        model = self._models.get(nodeId)
+        if type(model) is LazyNodeDelegate:
+            return QtCore.QPointF(*model.position())
+        return QtCore.QPointF()
+
     @override
     def portData(self, nodeId, portType, port_index, role):
         from SpatialNode.definitions import PortRole, PortType
@@ -244,18 +340,32 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
         match role:
             case PortRole.Data:
                 if portType == PortType.Out:
+                    if nodeId in self._dirtyInputs:
+                        self.pull(nodeId)
                     return model.outData(port_index)
 
             case PortRole.DataType:
+                values = self.portDescriptors(nodeId).dataTypes
+                if (portType, port_index) in values:
+                    return values[(portType, port_index)]
                 return model.dataType(portType, port_index)
 
             case PortRole.ConnectionPolicyRole:
+                values = self.portDescriptors(nodeId).policies
+                if (portType, port_index) in values:
+                    return values[(portType, port_index)]
                 return model.portConnectionPolicy(portType, port_index)
 
             case PortRole.CaptionVisible:
+                values = self.portDescriptors(nodeId).captionsVisible
+                if (portType, port_index) in values:
+                    return values[(portType, port_index)]
                 return model.portCaptionVisible(portType, port_index)
 
             case PortRole.Caption:
+                values = self.portDescriptors(nodeId).captions
+                if (portType, port_index) in values:
+                    return values[(portType, port_index)]
                 return model.portCaption(portType, port_index)
 
     @override
@@ -263,27 +373,40 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
         from SpatialNode.definitions import PortType
 
         model = self._models[nodeId]
-        if model is None:
+        if model is None or type(model) is LazyNodeDelegate:
             return False
 
         match role:
             case PortRole.Data:
                 if portType == PortType.In:
-                    model.setInData(value, index)
-                    self.inPortDataWasSet.emit(nodeId, portType, index)
+                    model.deliverInData({index: value})
+                    if self.isBatching():
+                        self._pendingChanges.updateNode(nodeId)
+                    else:
+                        self.inPortDataWasSet.emit(nodeId, portType, index)
 
         return False
 
+    def setInPortsData(self, nodeId, inputs):
+        from SpatialNode.definitions import PortType
+
+        model = self._models[nodeId]
+        if type(model) is LazyNodeDelegate:
+            # pulls its inputs when materialized
+            return
+        model.deliverInData(inputs)
+        for index in inputs:
+            if self.isBatching():
+                self._pendingChanges.updateNode(nodeId)
+            else:
+                self.inPortDataWasSet.emit(nodeId, PortType.In, index)
+
     @override
     def deleteConnection(self, connectionId):
         from SpatialNode.definitions import PortType
         from SpatialNode.connection_id_utils import getNodeId, getPortIndex
 
-        disconnected = False
-        if connectionId in self._connectivity:
-            disconnected = True
-            self._connectivity.remove(connectionId)
-
+        disconnected = self._unlinkConnection(connectionId)
         if disconnected:
             self.sendConnectionDeletion(connectionId)
             self.propagateEmptyDataTo(
@@ -298,11 +421,16 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
         connectionIds = self.allConnectionIds(nodeId)
         for cId in connectionIds:
             self.deleteConnection(cId)
+        self._unlinkNode(nodeId)
 
-        self._nodeGeometryData.pop(nodeId)
+        self._nodeGeometryData.pop(nodeId, None)
+        self._dirtyInputs.pop(nodeId, None)
+        self._portDescriptors.pop(nodeId, None)
+        self._computingNodes.discard(nodeId)
+        self._delegateSlots.pop(nodeId, None)
         self._models.pop(nodeId)
 
-        self.nodeDeleted.emit(nodeId)
+        self.notifyNodeDeleted(nodeId)
 
         return True
 
@@ -323,93 +451,381 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
 
         return nodeJson
 
-    @override
-    def save(self):
-        from SpatialNode.connection_id_utils import toJson
-
-        sceneJson = QJsonObject()
-
-        nodesJsonArray = QtCore.QJsonArray()
-        for nodeId in self.allNodeIds():
-            nodesJsonArray.append(self.saveNode(nodeId))
-        sceneJson["nodes"] = nodesJsonArray
-
-        connJsonArray = QtCore.QJsonArray()
-        for cid in self._connectivity:
-            connJsonArray.append(toJson(cid))
-        sceneJson["connections"] = connJsonArray
-
-        return sceneJson
-
     @override
     def loadNode(self, nodeJson):
-        restoredNodeId = nodeJson["id"]
+        posJson = nodeJson["position"]
+        self._restoreNode(
+            nodeJson["id"],
+            nodeJson["internal-data"],
+            QtCore.QPointF(posJson["x"], posJson["y"]),
+        )
+
+    def _restoreNode(self, restoredNodeId, internalDataJson, pos):
         self._nextNodeId = max(self._nextNodeId, restoredNodeId + 1)
 
-        internalDataJson = nodeJson["internal-data"]
         delegateModelName = internalDataJson["model-name"]
 
         model = self._registry.create(delegateModelName)
         if model:
-            model.dataUpdated.connect(
-                lambda portIndex: self.onOutPortDataUpdated(restoredNodeId, portIndex)
-            )
+            self._connectDelegate(restoredNodeId, model)
             self._models[restoredNodeId] = model
-            self.nodeCreated.emit(restoredNodeId)
+            self._topologicalOrder.addNode(restoredNodeId)
 
-            posJson = nodeJson["position"]
-            pos = QtCore.QPointF(posJson["x"], posJson["y"])
-            self.setNodeData(restoredNodeId, NodeRole.Position, pos)
+            self._nodeGeometryData[restoredNodeId] = NodeGeometryData(
+                QtCore.QSize(0, 0), pos
+            )
+            self.notifyNodeCreated(restoredNodeId)
             self._models[restoredNodeId].load(internalDataJson)
+            self.invalidatePortDescriptors(restoredNodeId)
 
         else:
             raise Exception("No registered model with name {delegateModelName}")
 
+    def loadStream(self, stream, chunkSize=1000, progress=None):
+        from SpatialNode.connection_id_utils import fromJson
+        from SpatialNode.scene_stream_reader import SceneStreamReader
+
+        reader = SceneStreamReader(stream)
+        nodes = []
+        connectionIds = []
+
+        def loadChunk():
+            with self.batch():
+                for nodeJson in nodes:
+                    self.loadNode(nodeJson)
+            nodes.clear()
+            if progress is not None:
+                progress(reader.bytesRead())
+
+        previous = self.blockPropagation(True)
+        try:
+            for key, value in reader.items():
+                if key == "nodes":
+                    nodes.append(value)
+                    if len(nodes) >= chunkSize:
+                        loadChunk()
+                elif key == "connections":
+                    connectionIds.append(fromJson(value))
+            loadChunk()
+
+            with self.batch():
+                for connectionId in connectionIds:
+                    self._insertConnection(connectionId)
+                self._propagateLoadedConnections(connectionIds)
+        finally:
+            self.blockPropagation(previous)
+
+    def saveBinary(self):
+        from SpatialNode.scene_binary_format import encodeScene
+
+        nodeIds = list(self._models)
+        positions = []
+        for nodeId in nodeIds:
+            pos = self._nodePosition(nodeId)
+            positions.append((pos.x(), pos.y()))
+
+        return encodeScene(
+            nodeIds,
+            positions,
+            self._connectivity,
+            [self._models[nodeId].save() for nodeId in nodeIds],
+        )
+
+    def loadBinary(self, buffer, lazy=False):
+        from SpatialNode.scene_binary_format import BinaryScene
+
+        scene = BinaryScene(buffer)
+        if lazy:
+            self._loadLazyNodes(scene)
+            return
+
+        previous = self.blockPropagation(True)
+        try:
+            with self.batch():
+                positions = scene.positions
+                for index, nodeId in enumerate(scene.nodeIds):
+                    self._restoreNode(
+                        nodeId,
+                        scene.internalData(index),
+                        QtCore.QPointF(positions[2 * index], positions[2 * index + 1]),
+                    )
+
+                connectionIds = list(scene.connectionIds())
+                for connectionId in connectionIds:
+                    self._insertConnection(connectionId)
+                self._propagateLoadedConnections(connectionIds)
+        finally:
+            self.blockPropagation(previous)
+            scene.release()
+
+    def loadBinaryFile(self, fileName, lazy=True):
+        import mmap
+
+        with open(fileName, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.loadBinary(mapped, lazy)
+        if not lazy:
+            mapped.close()
+
+    def _loadLazyNodes(self, scene):
+        with self.batch():
+            for index, nodeId in enumerate(scene.nodeIds):
+                self._nextNodeId = max(self._nextNodeId, nodeId + 1)
+                self._models[nodeId] = LazyNodeDelegate(
+                    self,
+                    nodeId,
+                    self._lazyNodeType(scene.modelName(index)),
+                    scene,
+                    index,
+                )
+                self._topologicalOrder.addNode(nodeId)
+                self.notifyNodeCreated(nodeId)
+
+            for connectionId in scene.connectionIds():
+                self._insertConnection(connectionId)
+
+    def _lazyNodeType(self, modelName):
+        nodeType = self._lazyNodeTypes.get(modelName)
+        if nodeType is None:
+            prototype = self._registry.create(modelName)
+            if prototype is None:
+                raise Exception(f"No registered model with name {modelName}")
+            nodeType = self._lazyNodeTypes[modelName] = LazyNodeType(
+                modelName, prototype
+            )
+        return nodeType
+
     @override
-    def load(self, jsonDocument):
-        nodesJsonArray = jsonDocument["nodes"]
+    def isMaterialized(self, nodeId):
+        return type(self._models.get(nodeId)) is not LazyNodeDelegate
 
-        for nodeJson in nodesJsonArray:
-            self.loadNode(nodeJson)
+    def materializeNode(self, nodeId):
+        from SpatialNode.definitions import PortRole, PortType
 
-        connectionJsonArray = jsonDocument["connections"]
+        model = self._models[nodeId]
+        if type(model) is not LazyNodeDelegate:
+            return model
+
+        # lazy nodes upstream first, so that all the inputs are current
+        cone = set()
+        stack = [nodeId]
+        while stack:
+            current = stack.pop()
+            if current in cone or type(self._models[current]) is not LazyNodeDelegate:
+                continue
+            cone.add(current)
+            for cn in self.allConnectionIds(current):
+                if cn.inNodeId == current:
+                    stack.append(cn.outNodeId)
+
+        for current in sorted(cone, key=self.topologicalRank):
+            record = self._models[current]
+            model = self._registry.create(record.nodeType().modelName)
+            self._connectDelegate(current, model)
+            self._models[current] = model
+            model.load(record.internalData())
+
+            inputs = {}
+            for cn in self.allConnectionIds(current):
+                if cn.inNodeId == current:
+                    model.inputConnectionCreated(cn)
+                    inputs[cn.inPortIndex] = self.portData(
+                        cn.outNodeId, PortType.Out, cn.outPortIndex, PortRole.Data
+                    )
+                else:
+                    model.outputConnectionCreated(cn)
+            if inputs:
+                self.setInPortsData(current, inputs)
+            # the caption and ports may differ from the prototype's
+            self.notifyNodeUpdated(current)
 
-        for connection in connectionJsonArray:
-            connId = fromJson(connection)
+        return self._models[nodeId]
 
-            # Restore the connection
-            self.addConnection(connId)
+    def _propagateLoadedConnections(self, connectionIds):
+        from SpatialNode.definitions import PortType
+
+        if self._lazyEvaluation:
+            for cn in connectionIds:
+                self.invalidateInput(cn.inNodeId, cn.inPortIndex)
+            return
+
+        # every node receives all its inputs at once, upstream nodes first
+        inputs = {}
+        for cn in connectionIds:
+            inputs.setdefault(cn.inNodeId, []).append(cn)
+        for nodeId in self._topologicalOrder.order():
+            connected = inputs.get(nodeId)
+            if connected:
+                self.setInPortsData(
+                    nodeId,
+                    {
+                        cn.inPortIndex: self._models[cn.outNodeId].outData(
+                            cn.outPortIndex
+                        )
+                        for cn in connected
+                    },
+                )
 
     def delegateModel(self, nodeId):
-        return self._models[nodeId]
+        model = self._models[nodeId]
+        if type(model) is LazyNodeDelegate:
+            return self.materializeNode(nodeId)
+        return model
 
     inPortDataWasSet = QtCore.Signal(NodeId, PortType, PortIndex)
 
-    @override
-    def newNodeId(self):
-        result = self._nextNodeId
-        self._nextNodeId += 1
-        return result
-
     def sendConnectionCreation(self, connectionId):
-        self.connectionCreated.emit(connectionId)
+        self.notifyConnectionCreated(connectionId)
 
         modeli = self._models[connectionId.inNodeId]
         modelo = self._models[connectionId.outNodeId]
-        if modeli is not None and modelo is not None:
+        if type(modeli) is not LazyNodeDelegate:
             modeli.inputConnectionCreated(connectionId)
+        if type(modelo) is not LazyNodeDelegate:
             modelo.outputConnectionCreated(connectionId)
 
     def sendConnectionDeletion(self, connectionId):
-        self.connectionDeleted.emit(connectionId)
+        self.notifyConnectionDeleted(connectionId)
 
         modeli = self._models[connectionId.inNodeId]
         modelo = self._models[connectionId.outNodeId]
-        if modeli is not None and modelo is not None:
+        if type(modeli) is not LazyNodeDelegate:
             modeli.inputConnectionDeleted(connectionId)
+        if type(modelo) is not LazyNodeDelegate:
             modelo.outputConnectionDeleted(connectionId)
 
+    def portDescriptors(self, nodeId):
+        descriptors = self._portDescriptors.get(nodeId)
+        if descriptors is None:
+            model = self._models[nodeId]
+            if type(model) is LazyNodeDelegate:
+                # shared by all the lazy nodes of a model type
+                nodeType = model.nodeType()
+                if nodeType.descriptors is None:
+                    nodeType.descriptors = NodePortDescriptors(nodeType.prototype)
+                return nodeType.descriptors
+            descriptors = NodePortDescriptors(model)
+            self._portDescriptors[nodeId] = descriptors
+        return descriptors
+
+    def invalidatePortDescriptors(self, nodeId):
+        self._portDescriptors.pop(nodeId, None)
+
+    @override
+    def notifyNodeUpdated(self, nodeId):
+        self.invalidatePortDescriptors(nodeId)
+        super().notifyNodeUpdated(nodeId)
+
+    @override
+    def portsAboutToBeDeleted(self, nodeId, portType, first, last):
+        self._portsChangingNode = nodeId
+        super().portsAboutToBeDeleted(nodeId, portType, first, last)
+
+    @override
+    def portsDeleted(self):
+        nodeId = self._portsChangingNode
+        self._portsChangingNode = None
+        # lays the node out again before the shifted connections come back
+        self.notifyNodeUpdated(nodeId)
+        super().portsDeleted()
+
+    @override
+    def portsAboutToBeInserted(self, nodeId, portType, first, last):
+        self._portsChangingNode = nodeId
+        super().portsAboutToBeInserted(nodeId, portType, first, last)
+
+    @override
+    def portsInserted(self):
+        nodeId = self._portsChangingNode
+        self._portsChangingNode = None
+        # lays the node out again before the shifted connections come back
+        self.notifyNodeUpdated(nodeId)
+        super().portsInserted()
+
+    def isDirty(self, nodeId):
+        return nodeId in self._dirtyInputs
+
+    def dirtyInPorts(self, nodeId):
+        return set(self._dirtyInputs.get(nodeId, ()))
+
+    def invalidateInput(self, nodeId, portIndex):
+        stack = [(nodeId, portIndex)]
+        while stack:
+            nodeId, portIndex = stack.pop()
+            dirty = self._dirtyInputs.get(nodeId)
+            if dirty is not None:
+                # downstream was invalidated together with the first dirty port
+                dirty.add(portIndex)
+                continue
+
+            self._dirtyInputs[nodeId] = {portIndex}
+            self.nodeInvalidated.emit(nodeId)
+            for outPort in range(self._models[nodeId].nPorts(PortType.Out)):
+                for cn in self.connections(nodeId, PortType.Out, outPort):
+                    stack.append((cn.inNodeId, cn.inPortIndex))
+
+    def pull(self, nodeId):
+        # post-order walk of the dirty upstream cone, upstream nodes first
+        order = []
+        visited = set()
+        stack = [(nodeId, False)]
+        while stack:
+            nodeId, expanded = stack.pop()
+            if expanded:
+                order.append(nodeId)
+                continue
+            if nodeId in visited or nodeId not in self._dirtyInputs:
+                continue
+            visited.add(nodeId)
+            stack.append((nodeId, True))
+            for portIndex in self._dirtyInputs[nodeId]:
+                for cn in self.connections(nodeId, PortType.In, portIndex):
+                    stack.append((cn.outNodeId, False))
+
+        for nodeId in order:
+            dirty = self._dirtyInputs.pop(nodeId, None)
+            if not dirty:
+                continue
+
+            inputs = {}
+            for portIndex in sorted(dirty):
+                inputs[portIndex] = None
+                for cn in self.connections(nodeId, PortType.In, portIndex):
+                    inputs[portIndex] = self._models[cn.outNodeId].outData(
+                        cn.outPortIndex
+                    )
+            self.setInPortsData(nodeId, inputs)
+
+    def evaluate(self, nodeId, portIndex=0):
+        self.pull(nodeId)
+        return self._models[nodeId].outData(portIndex)
+
+    nodeInvalidated = QtCore.Signal(NodeId)
+
+    def _connectDelegate(self, nodeId, model):
+        self._delegateSlots[nodeId] = NodeDelegateSlots(self, nodeId, model)
+
+    def onComputingStarted(self, nodeId):
+        self._computingNodes.add(nodeId)
+        self.notifyNodeUpdated(nodeId)
+
+    def onComputingFinished(self, nodeId):
+        self._computingNodes.discard(nodeId)
+        self.notifyNodeUpdated(nodeId)
+
     def onOutPortDataUpdated(self, nodeId, portIndex):
+        if self._propagationBlocked or nodeId not in self._models:
+            return
+
+        if self._lazyEvaluation:
+            for cn in self.connections(nodeId, PortType.Out, portIndex):
+                self.invalidateInput(cn.inNodeId, cn.inPortIndex)
+            return
+
+        if self._propagationScheduler is not None:
+            self._propagationScheduler.propagate(self, nodeId, portIndex)
+            return
+
         connected = self.connections(nodeId, PortType.Out, portIndex)
         portDataToPropagate = self.portData(
             nodeId, PortType.Out, portIndex, PortRole.Data
@@ -425,4 +841,8 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
             )
 
     def propagateEmptyDataTo(self, nodeId, portIndex):
+        if self._lazyEvaluation:
+            self.invalidateInput(nodeId, portIndex)
+            return
+
         self.setPortData(nodeId, PortType.In, portIndex, None, PortRole.Data)
@@ -4,11 +4,12 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
-from typing import override
+from typing import BinaryIO, Callable, Iterable, override
 
 from PySide6 import QtCore
 
 from SpatialNode.abstract_graph_model import AbstractGraphModel
+from SpatialNode.graph_connectivity import GraphConnectivity
 from SpatialNode.definitions import (
     NodeId,
     ConnectionId,
@@ -16,10 +17,17 @@ from SpatialNode.definitions import (
     PortType,
     NodeRole,
     PortRole,
+    ConnectionPolicy,
+    QJsonObject,
 )
+from SpatialNode.node_data import NodeData, NodeDataType
 from SpatialNode.node_delegate_model import NodeDelegateModel
 from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
-from SpatialNode.serializable import Serializable
+from SpatialNode.node_style import NodeStyle
+from SpatialNode.execution_plan import ExecutionPlan
+from SpatialNode.lazy_node_delegate import LazyNodeDelegate, LazyNodeType
+from SpatialNode.scene_binary_format import BinaryScene
+from SpatialNode.propagation_scheduler import PropagationScheduler
 
 class NodeGeometryData:
     size: QtCore.QSize
@@ -27,36 +35,119 @@ class NodeGeometryData:
 
     def __init__(self, size: QtCore.QSize, pos: QtCore): ...
 
-class DataFlowGraphModel(AbstractGraphModel, Serializable):
+class NodePortDescriptors:
+    """
+    Snapshot of the static description of a node taken from its delegate:
+    caption, port counts, and per `(PortType, PortIndex)` data type, connection
+    policy and caption.
+    """
+
+    def __init__(self, model: NodeDelegateModel):
+        self.caption: str = None
+        self.captionVisible: bool = None
+        self.resizable: bool = None
+        self.counts: dict[PortType, int] = None
+        self.dataTypes: dict[tuple[PortType, PortIndex], NodeDataType] = None
+        self.policies: dict[tuple[PortType, PortIndex], ConnectionPolicy] = None
+        self.captionsVisible: dict[tuple[PortType, PortIndex], bool] = None
+        self.captions: dict[tuple[PortType, PortIndex], str] = None
+
+class NodeDelegateSlots(QtCore.QObject):
+    """
+    Forwards the signals of the delegate of `nodeId` to the graph model,
+    adding the node id. Owned by the model and dropped with the node, which
+    disconnects everything.
+    """
+
+    def __init__(
+        self, graphModel: DataFlowGraphModel, nodeId: NodeId, model: NodeDelegateModel
+    ):
+        self._graphModel: DataFlowGraphModel = None
+        self._nodeId: NodeId = None
+
+    def onDataUpdated(self, portIndex: PortIndex) -> None: ...
+    def onPortsAboutToBeDeleted(
+        self, portType: PortType, first: PortIndex, last: PortIndex
+    ) -> None: ...
+    def onPortsAboutToBeInserted(
+        self, portType: PortType, first: PortIndex, last: PortIndex
+    ) -> None: ...
+    def onComputingStarted(self) -> None: ...
+    def onComputingFinished(self) -> None: ...
+    def onNodeStyleUpdated(self) -> None: ...
+
+class DataFlowGraphModel(GraphConnectivity, AbstractGraphModel):
+    _jsonArray = QtCore.QJsonArray
+
     def __init__(self, registry: NodeDelegateModelRegistry):
         self._registry: NodeDelegateModelRegistry = None
-        self._nextNodeId: int = None
-        self._models: dict[NodeId, NodeDelegateModel] = None
-        self._connectivity: set[ConnectionId] = None
+        self._models: dict[NodeId, NodeDelegateModel | LazyNodeDelegate] = None
         self._nodeGeometryData: dict[NodeId, NodeGeometryData] = None
+        self._portDescriptors: dict[NodeId, NodePortDescriptors] = None
+        self._portsChangingNode: NodeId | None = None
+        self._propagationScheduler: PropagationScheduler | None = None
+        self._propagationBlocked: bool = None
+        self._lazyEvaluation: bool = None
+        self._dirtyInputs: dict[NodeId, set[PortIndex]] = None
+        self._delegateSlots: dict[NodeId, NodeDelegateSlots] = None
+        self._lazyNodeTypes: dict[str, LazyNodeType] = None
+        self._computingNodes: set[NodeId] = None
 
     @property
     def dataModelRegistry(self) -> NodeDelegateModelRegistry: ...
+    def blockPropagation(self, blocked: bool) -> bool:
+        """
+        While blocked, `dataUpdated` of the delegates is ignored. Returns the
+        previous state, as `QObject.blockSignals`.
+        """
+        ...
+
+    def compile(
+        self, outputs: Iterable[NodeId], inputs: Iterable[tuple[NodeId, PortIndex]] = ()
+    ) -> ExecutionPlan:
+        """See `ExecutionPlan.compile`."""
+        ...
+
+    def isLazyEvaluation(self) -> bool: ...
+    def setLazyEvaluation(self, enabled: bool) -> None:
+        """
+        In lazy mode `dataUpdated` only marks the downstream input ports dirty.
+        Nodes recompute when one of their outputs is read through `portData`,
+        `evaluate` or `pull`, and then only their dirty upstream cone is
+        evaluated. Leaving lazy mode brings every dirty node up to date.
+        """
+        ...
+
+    def propagationScheduler(self) -> PropagationScheduler | None: ...
+    def setPropagationScheduler(self, scheduler: PropagationScheduler | None) -> None:
+        """
+        Routes `dataUpdated` of the delegates through `scheduler`. With `None`
+        (the default) data is pushed depth-first along each connection as soon
+        as it is emitted.
+        """
+        ...
+
     @override
     def allNodeIds(self) -> set[NodeId]: ...
     @override
-    def allConnectionIds(self, nodeId: NodeId) -> set[ConnectionId]: ...
-    @override
-    def connections(
-        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
-    ) -> set[ConnectionId]: ...
-    @override
-    def connectionExists(self, connectionId: ConnectionId) -> bool: ...
-    @override
     def addNode(self, nodeType="") -> NodeId: ...
     @override
     def connectionPossible(self, connectionId: ConnectionId): ...
     @override
     def addConnection(self, connectionId: ConnectionId): ...
+    def _insertConnection(self, connectionId: ConnectionId) -> bool:
+        """`addConnection` without the data propagation."""
+        ...
+
     @override
     def nodeExists(self, nodeId: NodeId): ...
     @override
     def nodeData(self, nodeId: NodeId, role: NodeRole): ...
+    @override
+    def nodeStyle(self, nodeId: NodeId) -> NodeStyle:
+        """The `nodeStyle` of the delegate; lazy nodes use the collection's."""
+        ...
+
     @override
     def nodeFlags(self, nodeId: NodeId): ...
     @override
@@ -78,6 +169,15 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
         value,
         role: PortRole = PortRole.Data,
     ): ...
+    def setInPortsData(
+        self, nodeId: NodeId, inputs: dict[PortIndex, NodeData | None]
+    ) -> None:
+        """
+        Delivers several inputs of one node at once through
+        `NodeDelegateModel.deliverInData`.
+        """
+        ...
+
     @override
     def deleteConnection(self, connectionId: ConnectionId): ...
     @override
@@ -85,18 +185,137 @@ class DataFlowGraphModel(AbstractGraphModel, Serializable):
     @override
     def saveNode(self, nodeId: NodeId): ...
     @override
-    def save(self): ...
-    @override
     def loadNode(self, p: QtCore.QJsonArray): ...
+    def _nodeGeometry(self, nodeId: NodeId) -> NodeGeometryData: ...
+    def _nodePosition(self, nodeId: NodeId) -> QtCore.QPointF: ...
+    def _restoreNode(
+        self, restoredNodeId: NodeId, internalDataJson: QJsonObject, pos: QtCore.QPointF
+    ) -> None: ...
+    def loadStream(
+        self,
+        stream: BinaryIO,
+        chunkSize: int = 1000,
+        progress: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Loads a scene file read incrementally with `SceneStreamReader`, for
+        files too large for `load`. Nodes are created `chunkSize` at a time,
+        each chunk in one `batch()`, and `progress` receives the bytes read
+        after each of them. Data propagation is deferred until all the
+        connections are in: every connected node then receives all its
+        inputs at once, in topological order.
+        """
+        ...
+
+    def saveBinary(self) -> bytes:
+        """
+        The scene in the columnar format of `scene_binary_format`, an
+        alternative to `save` which is much smaller and faster to load.
+        """
+        ...
+
+    def loadBinary(self, buffer: bytes | memoryview, lazy: bool = False) -> None:
+        """
+        Loads a scene written by `saveBinary` from any bytes-like object.
+        Data is propagated once at the end, as in `loadStream`.
+
+        With `lazy`, nodes are only `LazyNodeDelegate` records into the
+        buffer, which must then stay valid: delegates are created and their
+        internal data loaded by `materializeNode` when first needed, e.g. to
+        evaluate them, show their widget or on selection. The connections
+        are indexed right away.
+        """
+        ...
+
+    def loadBinaryFile(self, fileName: str, lazy: bool = True) -> None:
+        """
+        `loadBinary` on a memory-mapped file, opening even very large scenes
+        almost instantly; only materialized nodes cost memory beyond the
+        connections. The mapping lives as long as the lazy nodes using it.
+        """
+        ...
+
+    def _loadLazyNodes(self, scene: BinaryScene) -> None: ...
+    def _lazyNodeType(self, modelName: str) -> LazyNodeType: ...
     @override
-    def load(self, p: QtCore.QJsonArray): ...
+    def isMaterialized(self, nodeId: NodeId) -> bool: ...
+    def materializeNode(self, nodeId: NodeId) -> NodeDelegateModel:
+        """
+        The delegate of `nodeId`, created from its record together with the
+        lazy nodes upstream, which provide its inputs. `delegateModel` calls
+        it, so callers outside the model always see real delegates.
+        """
+        ...
+
+    def _propagateLoadedConnections(
+        self, connectionIds: Iterable[ConnectionId]
+    ) -> None: ...
     def delegateModel(self, nodeId: NodeId): ...
 
     inPortDataWasSet: QtCore.Signal(NodeId, PortType, PortIndex)
 
-    @override
-    def newNodeId(self) -> NodeId: ...
     def sendConnectionCreation(self, connectionId: ConnectionId) -> None: ...
     def sendConnectionDeletion(self, connectionId: ConnectionId) -> None: ...
+    def portDescriptors(self, nodeId: NodeId) -> NodePortDescriptors:
+        """
+        Cached description of the ports of `nodeId`, which `nodeData` and
+        `portData` answer from instead of calling the delegate. Built on first
+        use and dropped on `nodeUpdated` and when the delegate inserts or
+        deletes ports.
+        """
+        ...
+
+    def invalidatePortDescriptors(self, nodeId: NodeId) -> None:
+        """
+        To be called when a delegate changes its captions or port types
+        without emitting any of the signals above.
+        """
+        ...
+
+    @override
+    def notifyNodeUpdated(self, nodeId: NodeId) -> None: ...
+    @override
+    def portsAboutToBeDeleted(
+        self, nodeId: NodeId, portType: PortType, first: PortIndex, last: PortIndex
+    ) -> None: ...
+    @override
+    def portsDeleted(self) -> None: ...
+    @override
+    def portsAboutToBeInserted(
+        self, nodeId: NodeId, portType: PortType, first: PortIndex, last: PortIndex
+    ) -> None: ...
+    @override
+    def portsInserted(self) -> None: ...
+    def isDirty(self, nodeId: NodeId) -> bool: ...
+    def dirtyInPorts(self, nodeId: NodeId) -> set[PortIndex]: ...
+    def invalidateInput(self, nodeId: NodeId, portIndex: PortIndex) -> None:
+        """
+        Marks an input port dirty. The first dirty port of a node also marks
+        every node downstream of it and emits `nodeInvalidated`.
+        """
+        ...
+
+    def pull(self, nodeId: NodeId) -> None:
+        """
+        Brings `nodeId` up to date: the dirty nodes upstream of it are
+        evaluated first, each one receiving all its dirty inputs at once.
+        """
+        ...
+
+    def evaluate(self, nodeId: NodeId, portIndex: PortIndex = 0) -> NodeData | None:
+        """Pulls `nodeId` and returns the data of its output `portIndex`."""
+        ...
+    nodeInvalidated: QtCore.Signal(NodeId)
+    """Emitted in lazy mode when a clean node gets its first dirty input."""
+
+    def _connectDelegate(self, nodeId: NodeId, model: NodeDelegateModel) -> None:
+        """
+        Connects the signals of the delegate through a `NodeDelegateSlots`.
+        Computing state is exposed as `NodeRole.Computing`.
+        """
+        ...
+
+    def onComputingStarted(self, nodeId: NodeId) -> None: ...
+    def onComputingFinished(self, nodeId: NodeId) -> None: ...
     def onOutPortDataUpdated(self, nodeId: NodeId, portIndex: PortIndex) -> None: ...
     def propagateEmptyDataTo(self, nodeId: NodeId, portIndex: PortIndex) -> None: ...
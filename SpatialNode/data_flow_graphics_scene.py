@@ -4,6 +4,8 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
+from typing import override
+
 from PySide6 import QtCore, QtWidgets
 
 from SpatialNode.basic_graphics_scene import BasicGraphicsScene
@@ -16,6 +18,27 @@ class DataFlowGraphicsScene(BasicGraphicsScene):
         self._graphModel.inPortDataWasSet.connect(
             lambda nodeId: self.onNodeUpdated(nodeId)
         )
+        self._nodesToPull = set()
+        self._graphModel.nodeInvalidated.connect(self.onNodeInvalidated)
+        self.nodeSelected.connect(self._graphModel.materializeNode)
+
+    def onNodeInvalidated(self, nodeId):
+        if not self._nodesToPull:
+            QtCore.QTimer.singleShot(0, self._pullVisibleNodes)
+        self._nodesToPull.add(nodeId)
+
+    @override
+    def onNodeShown(self, nodeId):
+        if self._graphModel.isDirty(nodeId):
+            self.onNodeInvalidated(nodeId)
+
+    def _pullVisibleNodes(self):
+        nodeIds = self._nodesToPull
+        self._nodesToPull = set()
+        for nodeId in nodeIds:
+            node = self.nodeGraphicsObject(nodeId)
+            if node is not None and node.isVisible():
+                self._graphModel.pull(nodeId)
 
     def selectedNodes(self):
         from SpatialNode.definitions import NodeId
@@ -120,6 +143,8 @@ class DataFlowGraphicsScene(BasicGraphicsScene):
 
     sceneLoaded = QtCore.Signal()
 
+    loadProgress = QtCore.Signal("qint64", "qint64")
+
     def save(self):
         from SpatialNode.data_flow_graph_model import DataFlowGraphModel
 
@@ -154,14 +179,16 @@ class DataFlowGraphicsScene(BasicGraphicsScene):
         if not isinstance(self._graphModel, DataFlowGraphModel):
             raise RuntimeError("_graphModel must be a DataFlowGraphModel")
 
-        file = QtCore.QFile(fileName)
-
-        if not file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
+        try:
+            file = open(fileName, "rb")
+        except OSError:
             print(fileName)
             return
 
         self.clearScene()
-        wholeFile = file.readAll()
-
-        self._graphModel.load(QtCore.QJsonDocument.fromJson(wholeFile).object())
+        size = QtCore.QFileInfo(fileName).size()
+        with file:
+            self._graphModel.loadStream(
+                file, progress=lambda bytesRead: self.loadProgress.emit(bytesRead, size)
+            )
         self.sceneLoaded.emit()
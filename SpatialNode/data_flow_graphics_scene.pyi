@@ -4,6 +4,8 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
+from typing import override
+
 from PySide6 import QtCore, QtWidgets
 
 from SpatialNode.basic_graphics_scene import BasicGraphicsScene
@@ -11,12 +13,37 @@ from SpatialNode.data_flow_graph_model import DataFlowGraphModel
 from SpatialNode.definitions import NodeId
 
 class DataFlowGraphicsScene(BasicGraphicsScene):
-    def __init__(self, graphModel: DataFlowGraphModel, parent=None): ...
+    def __init__(self, graphModel: DataFlowGraphModel, parent=None):
+        """
+        Clicking a node selects it and materializes its delegate when it was
+        loaded lazily.
+        """
+        self._nodesToPull: set[NodeId] = None
+        ...
+
+    def onNodeInvalidated(self, nodeId: NodeId) -> None:
+        """
+        Queues `nodeId` to be pulled once control returns to the event loop.
+        Only visible nodes are evaluated; hidden ones are pulled when shown.
+        """
+        ...
+
+    @override
+    def onNodeShown(self, nodeId: NodeId) -> None: ...
+    def _pullVisibleNodes(self) -> None: ...
     def selectedNodes(self) -> list[NodeId]: ...
     def createSceneMenu(self, scenePos: QtCore.QPointF) -> QtWidgets.QMenu: ...
 
     sceneLoaded: QtCore.Signal = None
 
+    loadProgress: QtCore.Signal = None
+    """`(bytesRead, fileSize)` after every chunk of nodes loaded by `loadUrl`."""
+
     def save(self) -> None: ...
     def load(self) -> None: ...
-    def loadUrl(self, fileName: str) -> None: ...
+    def loadUrl(self, fileName: str) -> None:
+        """
+        Streams the scene file into the model with
+        `DataFlowGraphModel.loadStream`, emitting `loadProgress` on the way.
+        """
+        ...
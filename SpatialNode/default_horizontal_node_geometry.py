@@ -6,10 +6,15 @@
 
 from typing import override
 from PySide6 import QtCore, QtGui, QtWidgets
-from SpatialNode.abstract_node_geometry import AbstractNodeGeometry
+from SpatialNode.abstract_node_geometry import (
+    AbstractNodeGeometry,
+    CachedNodeLayout,
+    NodeLayout,
+    PortGrid,
+)
 
 
-class DefaultHorizontalNodeGeometry(AbstractNodeGeometry):
+class DefaultHorizontalNodeGeometry(CachedNodeLayout, AbstractNodeGeometry):
     def __init__(self, graphModel):
         super().__init__(graphModel)
         self._portSize = 20
@@ -31,168 +36,115 @@ class DefaultHorizontalNodeGeometry(AbstractNodeGeometry):
     def recomputeSize(self, nodeId):
         from SpatialNode.definitions import NodeRole, PortType
 
-        height = self._maxVerticalPortsExtent(nodeId)
-        w = self._graphModel.nodeData(nodeId, NodeRole.Widget)
+        capRect, labels, advances, w = self._measure(nodeId)
+
+        step = self._portSize + self._portSpacing
+        height = step * max(len(labels[PortType.In]), len(labels[PortType.Out]))
         if w is not None:
             height = max(height, w.height())
 
-        capRect = self.captionRect(nodeId)
-
         height += capRect.height()
         # space above caption
         height += self._portSpacing
         # space below caption
         height += self._portSpacing
 
-        inPortWidth = self._maxPortsTextAdvance(nodeId, PortType.In)
-        outPortWidth = self._maxPortsTextAdvance(nodeId, PortType.Out)
-        width = inPortWidth + outPortWidth + 4 * self._portSpacing
+        width = advances[PortType.In] + advances[PortType.Out] + 4 * self._portSpacing
         if w is not None:
             width += w.width()
         width = max(width, int(capRect.width()) + 2 * self._portSpacing)
 
         size = QtCore.QSize(width, height)
         self._graphModel.setNodeData(nodeId, NodeRole.Size, size)
+        self._layouts[nodeId] = self._layoutNode(size, capRect, labels, advances, w)
 
     @override
-    def portPosition(self, nodeId, portType, port_index):
-        from SpatialNode.definitions import NodeRole, PortType
-
-        step = self._portSize + self._portSpacing
-        totalHeight = 0.0
-        totalHeight += self.captionRect(nodeId).height()
-        totalHeight += self._portSpacing
-
-        totalHeight += step * port_index
-        totalHeight += step / 2.0
-
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
+    def _layoutNode(self, size, capRect, labels, advances, w):
+        from SpatialNode.definitions import PortType
 
-        result = QtCore.QPointF()
-        match portType:
-            case PortType.In:
-                x = 0.0
-                result = QtCore.QPointF(x, totalHeight)
-            case PortType.Out:
-                x = size.width()
-                result = QtCore.QPointF(x, totalHeight)
-        return result
-
-    @override
-    def portTextPosition(self, nodeId, portType, port_index):
-        from SpatialNode.definitions import NodeRole, PortType
-
-        p = self.portPosition(nodeId, portType, port_index)
-        rect = self._portTextRect(nodeId, portType, port_index)
-        p.setY(p.y() + rect.height() / 4.0)
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
-
-        match portType:
-            case PortType.In:
-                p.setX(self._portSpacing)
-            case PortType.Out:
-                p.setX(size.width() - self._portSpacing - rect.width())
-        return p
-
-    @override
-    def captionPosition(self, nodeId):
-        from SpatialNode.definitions import NodeRole
-
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
-        return QtCore.QPointF(
-            0.5 * (size.width() - self.captionRect(nodeId).width()),
-            0.5 * self._portSpacing + self.captionRect(nodeId).height(),
+        layout = NodeLayout(size, capRect)
+        layout.captionPosition = QtCore.QPointF(
+            0.5 * (size.width() - capRect.width()),
+            0.5 * self._portSpacing + capRect.height(),
         )
 
-    @override
-    def captionRect(self, nodeId):
-        from SpatialNode.definitions import NodeRole
-
-        if not self._graphModel.nodeData(nodeId, NodeRole.CaptionVisible):
-            return QtCore.QRectF()
-
-        name = self._graphModel.nodeData(nodeId, NodeRole.Caption)
-        return self._boldFontMetrics.boundingRect(name)
-
-    @override
-    def widgetPosition(self, nodeId):
-        from SpatialNode.definitions import NodeRole, PortType
-
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
-
-        captionHeight = self.captionRect(nodeId).height()
+        step = self._portSize + self._portSpacing
+        firstY = capRect.height() + self._portSpacing + step / 2.0
+        for portType, names in labels.items():
+            x = 0.0 if portType == PortType.In else size.width()
+            layout.portGrids[portType] = PortGrid(x, firstY, 0.0, step, len(names))
+            positions = layout.portPositions[portType] = []
+            textPositions = layout.portTextPositions[portType] = []
+            for portIndex, name in enumerate(names):
+                y = firstY + step * portIndex
+                rect = self._fontMetrics.boundingRect(name)
+                textY = y + rect.height() / 4.0
+                match portType:
+                    case PortType.In:
+                        positions.append(QtCore.QPointF(0.0, y))
+                        textPositions.append(QtCore.QPointF(self._portSpacing, textY))
+                    case PortType.Out:
+                        positions.append(QtCore.QPointF(size.width(), y))
+                        textPositions.append(
+                            QtCore.QPointF(
+                                size.width() - self._portSpacing - rect.width(), textY
+                            )
+                        )
 
-        w = self._graphModel.nodeData(nodeId, NodeRole.Widget)
         if w is not None:
+            x = 2.0 * self._portSpacing + advances[PortType.In]
             # If the widget wants to use as much vertical space as possible,
             # place it immediately after the caption.
             if (
                 w.sizePolicy().verticalPolicy().value
                 & QtWidgets.QSizePolicy.PolicyFlag.ExpandFlag.value
             ):
-                return QtCore.QPointF(
-                    2.0 * self._portSpacing
-                    + self._maxPortsTextAdvance(nodeId, PortType.In),
-                    captionHeight,
-                )
+                layout.widgetPosition = QtCore.QPointF(x, capRect.height())
             else:
-                return QtCore.QPointF(
-                    2.0 * self._portSpacing
-                    + self._maxPortsTextAdvance(nodeId, PortType.In),
-                    (captionHeight + size.height() - w.height()) / 2.0,
+                layout.widgetPosition = QtCore.QPointF(
+                    x, (capRect.height() + size.height() - w.height()) / 2.0
                 )
-        return QtCore.QPointF()
 
-    @override
-    def resizeHandleRect(self, nodeId):
-        from SpatialNode.definitions import NodeRole
-
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
         rectSize = 7
-        return QtCore.QRect(
+        layout.resizeHandleRect = QtCore.QRect(
             size.width() - self._portSpacing,
             size.height() - self._portSpacing,
             rectSize,
             rectSize,
         )
+        return layout
 
-    def _portTextRect(self, node_id, portType, portIndex):
-        from SpatialNode.definitions import PortRole
+    @override
+    def _measure(self, nodeId):
+        from SpatialNode.definitions import NodeRole, PortType
 
-        if self._graphModel.portData(
-            node_id, portType, portIndex, PortRole.CaptionVisible
-        ):
-            s = self._graphModel.portData(
-                node_id, portType, portIndex, PortRole.Caption
-            )
+        if self._graphModel.nodeData(nodeId, NodeRole.CaptionVisible):
+            name = self._graphModel.nodeData(nodeId, NodeRole.Caption)
+            capRect = self._boldFontMetrics.boundingRect(name)
         else:
-            portData = self._graphModel.portData(
-                node_id, portType, portIndex, PortRole.DataType
+            capRect = QtCore.QRectF()
+
+        labels = {}
+        advances = {}
+        for portType in (PortType.In, PortType.Out):
+            names = labels[portType] = self._portLabels(nodeId, portType)
+            advances[portType] = max(
+                (self._fontMetrics.horizontalAdvance(name) for name in names),
+                default=0,
             )
-            s = portData.name
-
-        return self._fontMetrics.boundingRect(s)
 
-    def _maxVerticalPortsExtent(self, node_id):
-        from SpatialNode.definitions import NodeRole
-
-        nInPorts = self._graphModel.nodeData(node_id, NodeRole.InPortCount)
-        nOutPorts = self._graphModel.nodeData(node_id, NodeRole.OutPortCount)
-        maxNumOfEntries = max(nInPorts, nOutPorts)
-        step = self._portSize + self._portSpacing
-
-        return step * maxNumOfEntries
+        w = self._graphModel.nodeData(nodeId, NodeRole.Widget)
+        return capRect, labels, advances, w
 
-    def _maxPortsTextAdvance(self, nodeId, portType):
+    def _portLabels(self, nodeId, portType):
         from SpatialNode.definitions import NodeRole, PortType, PortRole
 
-        width = 0
-
         n = self._graphModel.nodeData(
             nodeId,
             NodeRole.OutPortCount if portType == PortType.Out else NodeRole.InPortCount,
         )
 
+        names = []
         for portIndex in range(n):
             if self._graphModel.portData(
                 nodeId, portType, portIndex, PortRole.CaptionVisible
@@ -205,7 +157,5 @@ class DefaultHorizontalNodeGeometry(AbstractNodeGeometry):
                     nodeId, portType, portIndex, PortRole.DataType
                 )
                 name = portData.name
-
-            width = max(self._fontMetrics.horizontalAdvance(name), width)
-
-        return width
+            names.append(name)
+        return names
@@ -6,13 +6,17 @@
 
 from typing import override
 
-from PySide6 import QtCore, QtGui
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from SpatialNode.abstract_graph_model import AbstractGraphModel
-from SpatialNode.abstract_node_geometry import AbstractNodeGeometry
-from SpatialNode.definitions import NodeId, PortType, PortIndex
+from SpatialNode.abstract_node_geometry import (
+    AbstractNodeGeometry,
+    CachedNodeLayout,
+    NodeLayout,
+)
+from SpatialNode.definitions import NodeId, PortType
 
-class DefaultHorizontalNodeGeometry(AbstractNodeGeometry):
+class DefaultHorizontalNodeGeometry(CachedNodeLayout, AbstractNodeGeometry):
     def __init__(self, graphModel: AbstractGraphModel):
         self._portSize: int = None
         self._portSpacing: int = None
@@ -24,25 +28,22 @@ class DefaultHorizontalNodeGeometry(AbstractNodeGeometry):
     @override
     def recomputeSize(self, nodeId: NodeId) -> None: ...
     @override
-    def portPosition(
-        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
-    ) -> QtCore.QPointF: ...
-    @override
-    def portTextPosition(
-        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
-    ) -> QtCore.QPointF: ...
-    @override
-    def captionPosition(self, nodeId: NodeId) -> QtCore.QPointF: ...
-    @override
-    def captionRect(self, nodeId: NodeId) -> QtCore.QRectF: ...
-    @override
-    def widgetPosition(self, nodeId: NodeId) -> QtCore.QPointF: ...
-    @override
-    def resizeHandleRect(self, nodeId: NodeId) -> QtCore.QRect: ...
-    def _portTextRect(
-        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
-    ) -> QtCore.QRectF: ...
-    def _maxVerticalPortsExtent(self, nodeId: NodeId) -> int: ...
-    def _maxPortsTextAdvance(
-        self, nodeId: NodeId, portType: PortType | None
-    ) -> int: ...
+    def _layoutNode(
+        self,
+        size: QtCore.QSize,
+        capRect: QtCore.QRectF,
+        labels: dict[PortType, list[str]],
+        advances: dict[PortType, int],
+        w: QtWidgets.QWidget | None,
+    ) -> NodeLayout: ...
+    @override
+    def _measure(self, nodeId: NodeId) -> tuple[
+        QtCore.QRectF,
+        dict[PortType, list[str]],
+        dict[PortType, int],
+        QtWidgets.QWidget | None,
+    ]:
+        """Caption rect, port labels, widest label per port type and the widget."""
+        ...
+
+    def _portLabels(self, nodeId: NodeId, portType: PortType) -> list[str]: ...
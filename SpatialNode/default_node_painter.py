@@ -7,15 +7,32 @@
 import math
 from typing import override
 
-from PySide6 import QtGui, QtCore
+from PySide6 import QtGui, QtCore, QtWidgets
 
 from SpatialNode.abstract_node_painter import AbstractNodePainter
 
 
 class DefaultNodePainter(AbstractNodePainter):
+    def __init__(self):
+        self.captionLevelOfDetail = 0.4
+        self.fullLevelOfDetail = 0.7
+        self.widgetLevelOfDetail = 0.5
+
     @override
     def paint(self, painter, ngo):
+        lod = QtWidgets.QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+            painter.worldTransform()
+        )
+        if lod < self.fullLevelOfDetail:
+            self.drawFlatNodeRect(painter, ngo)
+            self.drawComputingState(painter, ngo)
+            if lod >= self.captionLevelOfDetail:
+                self.drawFilledConnectionPoints(painter, ngo)
+                self.drawNodeCaption(painter, ngo)
+            return
+
         self.drawNodeRect(painter, ngo)
+        self.drawComputingState(painter, ngo)
         self.drawConnectionPoints(painter, ngo)
         self.drawFilledConnectionPoints(painter, ngo)
         self.drawNodeCaption(painter, ngo)
@@ -23,17 +40,12 @@ class DefaultNodePainter(AbstractNodePainter):
         self.drawResizeRect(painter, ngo)
 
     def drawNodeRect(self, painter, ngo):
-        from SpatialNode.definitions import NodeRole
-        from SpatialNode.node_style import NodeStyle
-
         model = ngo.graphModel
         nodeId = ngo.nodeId()
         geometry = ngo.nodeScene().nodeGeometry
         size = geometry.size(nodeId)
 
-        json = QtCore.QJsonDocument.fromVariant(model.nodeData(nodeId, NodeRole.Style))
-        nodeStyle = NodeStyle()
-        nodeStyle.fromJsonObject(json.object())
+        nodeStyle = model.nodeStyle(nodeId)
 
         color = (
             nodeStyle.SelectedBoundaryColor
@@ -61,8 +73,45 @@ class DefaultNodePainter(AbstractNodePainter):
         radius = 3.0
         painter.drawRoundedRect(boundary, radius, radius)
 
+    def drawFlatNodeRect(self, painter, ngo):
+        model = ngo.graphModel
+        nodeId = ngo.nodeId()
+        size = ngo.nodeScene().nodeGeometry.size(nodeId)
+
+        nodeStyle = model.nodeStyle(nodeId)
+
+        color = (
+            nodeStyle.SelectedBoundaryColor
+            if ngo.isSelected()
+            else nodeStyle.NormalBoundaryColor
+        )
+        painter.setPen(QtGui.QPen(color, nodeStyle.PenWidth))
+        painter.setBrush(nodeStyle.GradientColor1)
+        painter.drawRect(QtCore.QRectF(0, 0, size.width(), size.height()))
+
+    def drawComputingState(self, painter, ngo):
+        from SpatialNode.definitions import NodeRole
+
+        model = ngo.graphModel
+        nodeId = ngo.nodeId()
+
+        if not model.nodeData(nodeId, NodeRole.Computing):
+            return
+
+        nodeStyle = model.nodeStyle(nodeId)
+
+        size = ngo.nodeScene().nodeGeometry.size(nodeId)
+
+        pen = QtGui.QPen(nodeStyle.WarningColor, nodeStyle.HoveredPenWidth * 2)
+        pen.setStyle(QtCore.Qt.PenStyle.DashLine)
+        painter.setPen(pen)
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+
+        boundary = QtCore.QRectF(0, 0, size.width(), size.height())
+        radius = 3.0
+        painter.drawRoundedRect(boundary, radius, radius)
+
     def drawConnectionPoints(self, painter, ngo):
-        from SpatialNode.node_style import NodeStyle
         from SpatialNode.definitions import PortType, NodeRole, PortRole
         from SpatialNode.style_collection import StyleCollection
         from SpatialNode.connection_id_utils import makeCompleteConnectionId
@@ -71,9 +120,7 @@ class DefaultNodePainter(AbstractNodePainter):
         nodeId = ngo.nodeId()
         geometry = ngo.nodeScene().nodeGeometry
 
-        json = QtCore.QJsonDocument.fromVariant(model.nodeData(nodeId, NodeRole.Style))
-        nodeStyle = NodeStyle()
-        nodeStyle.fromJsonObject(json.object())
+        nodeStyle = model.nodeStyle(nodeId)
 
         connectionStyle = StyleCollection.connectionStyle()
 
@@ -133,7 +180,6 @@ class DefaultNodePainter(AbstractNodePainter):
             ngo.nodeState.resetConnectionForReaction()
 
     def drawFilledConnectionPoints(self, painter, ngo):
-        from SpatialNode.node_style import NodeStyle
         from SpatialNode.definitions import PortType, NodeRole, PortRole
         from SpatialNode.style_collection import StyleCollection
 
@@ -141,9 +187,7 @@ class DefaultNodePainter(AbstractNodePainter):
         nodeId = ngo.nodeId()
         geometry = ngo.nodeScene().nodeGeometry
 
-        json = QtCore.QJsonDocument.fromVariant(model.nodeData(nodeId, NodeRole.Style))
-        nodeStyle = NodeStyle()
-        nodeStyle.fromJsonObject(json.object())
+        nodeStyle = model.nodeStyle(nodeId)
 
         diameter = nodeStyle.ConnectionPointDiameter
 
@@ -178,7 +222,6 @@ class DefaultNodePainter(AbstractNodePainter):
                     painter.drawEllipse(p, diameter * 0.4, diameter * 0.4)
 
     def drawNodeCaption(self, painter, ngo):
-        from SpatialNode.node_style import NodeStyle
         from SpatialNode.definitions import NodeRole
 
         model = ngo.graphModel
@@ -195,9 +238,7 @@ class DefaultNodePainter(AbstractNodePainter):
 
         position = geometry.captionPosition(nodeId)
 
-        json = QtCore.QJsonDocument.fromVariant(model.nodeData(nodeId, NodeRole.Style))
-        nodeStyle = NodeStyle()
-        nodeStyle.fromJsonObject(json.object())
+        nodeStyle = model.nodeStyle(nodeId)
 
         painter.setFont(f)
         painter.setPen(nodeStyle.FontColor)
@@ -207,16 +248,13 @@ class DefaultNodePainter(AbstractNodePainter):
         painter.setFont(f)
 
     def drawEntryLabels(self, painter, ngo):
-        from SpatialNode.node_style import NodeStyle
         from SpatialNode.definitions import PortType, NodeRole, PortRole
 
         model = ngo.graphModel
         nodeId = ngo.nodeId()
         geometry = ngo.nodeScene().nodeGeometry
 
-        json = QtCore.QJsonDocument.fromVariant(model.nodeData(nodeId, NodeRole.Style))
-        nodeStyle = NodeStyle()
-        nodeStyle.fromJsonObject(json.object())
+        nodeStyle = model.nodeStyle(nodeId)
 
         for portType in [PortType.Out, PortType.In]:
             n = model.nodeData(
@@ -12,11 +12,36 @@ from SpatialNode.abstract_node_painter import AbstractNodePainter
 from SpatialNode.node_graphics_object import NodeGraphicsObject
 
 class DefaultNodePainter(AbstractNodePainter):
+    """
+    Paints nodes in three tiers of detail, chosen from the level of detail of
+    the painter transform, 1.0 at 100% zoom. Below `captionLevelOfDetail` a
+    node is a flat rectangle; below `fullLevelOfDetail` it also gets its
+    caption and its connected ports; above, the gradient, every port and the
+    port labels. The scene hides embedded widgets below `widgetLevelOfDetail`.
+    """
+
+    def __init__(self):
+        self.captionLevelOfDetail: float = 0.4
+        self.fullLevelOfDetail: float = 0.7
+        self.widgetLevelOfDetail: float = 0.5
+
     @override
     def paint(self, painter: QtGui.QPainter, ngo: NodeGraphicsObject) -> None: ...
     def drawNodeRect(
         self, painter: QtGui.QPainter, ngo: NodeGraphicsObject
     ) -> None: ...
+    def drawFlatNodeRect(
+        self, painter: QtGui.QPainter, ngo: NodeGraphicsObject
+    ) -> None:
+        """Node body in one color, without rounded corners."""
+        ...
+
+    def drawComputingState(
+        self, painter: QtGui.QPainter, ngo: NodeGraphicsObject
+    ) -> None:
+        """Dashed outline in `NodeStyle.WarningColor` while the node computes."""
+        ...
+
     def drawConnectionPoints(
         self, painter: QtGui.QPainter, ngo: NodeGraphicsObject
     ) -> None: ...
@@ -8,10 +8,15 @@ from typing import override
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from SpatialNode.abstract_node_geometry import AbstractNodeGeometry
+from SpatialNode.abstract_node_geometry import (
+    AbstractNodeGeometry,
+    CachedNodeLayout,
+    NodeLayout,
+    PortGrid,
+)
 
 
-class DefaultVerticalNodeGeometry(AbstractNodeGeometry):
+class DefaultVerticalNodeGeometry(CachedNodeLayout, AbstractNodeGeometry):
     def __init__(self, graphModel):
         super().__init__(graphModel)
         self._portSize = 20
@@ -33,28 +38,27 @@ class DefaultVerticalNodeGeometry(AbstractNodeGeometry):
     def recomputeSize(self, nodeId):
         from SpatialNode.definitions import NodeRole, PortType
 
+        capRect, labels, advances, captionsHeights, w = self._measure(nodeId)
+
         height = self._portSpacing
-        w = self._graphModel.nodeData(nodeId, NodeRole.Widget)
         if w is not None:
             height = max(height, w.height())
 
-        capRect = self.captionRect(nodeId)
-
         height += capRect.height()
         # space above caption
         height += self._portSpacing
         # space below caption
         height += self._portSpacing
 
-        nInPorts = self._graphModel.nodeData(nodeId, NodeRole.InPortCount)
-        nOutPorts = self._graphModel.nodeData(nodeId, NodeRole.OutPortCount)
+        nInPorts = len(labels[PortType.In])
+        nOutPorts = len(labels[PortType.Out])
 
         # Adding double step (top and bottom) to reserve space for port captions.
-        height += self._portCaptionsHeight(nodeId, PortType.In)
-        height += self._portCaptionsHeight(nodeId, PortType.Out)
+        height += captionsHeights[PortType.In]
+        height += captionsHeights[PortType.Out]
 
-        inPortWidth = self._maxPortsTextAdvance(nodeId, PortType.In)
-        outPortWidth = self._maxPortsTextAdvance(nodeId, PortType.Out)
+        inPortWidth = advances[PortType.In]
+        outPortWidth = advances[PortType.Out]
 
         totalInPortsWidth = (
             inPortWidth * nInPorts + self._portSpacing * (nInPorts - 1)
@@ -77,143 +81,86 @@ class DefaultVerticalNodeGeometry(AbstractNodeGeometry):
 
         size = QtCore.QSize(width, height)
         self._graphModel.setNodeData(nodeId, NodeRole.Size, size)
+        self._layouts[nodeId] = self._layoutNode(
+            size, capRect, labels, advances, captionsHeights, w
+        )
 
     @override
-    def portPosition(self, nodeId, portType, port_index):
-        from SpatialNode.definitions import NodeRole, PortType
-
-        result = QtCore.QPointF()
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
-        match portType:
-            case PortType.In:
-                inPortWidth = (
-                    self._maxPortsTextAdvance(nodeId, PortType.In) + self._portSpacing
-                )
-                nInPorts = self._graphModel.nodeData(nodeId, NodeRole.InPortCount)
-                x = (
-                    size.width() - (nInPorts - 1) * inPortWidth
-                ) / 2.0 + port_index * inPortWidth
-                y = 0.0
-
-                result = QtCore.QPointF(x, y)
-            case PortType.Out:
-                outPortWidth = (
-                    self._maxPortsTextAdvance(nodeId, PortType.Out) + self._portSpacing
-                )
-                nOutPorts = self._graphModel.nodeData(nodeId, NodeRole.OutPortCount)
-                x = (
-                    size.width() - (nOutPorts - 1) * outPortWidth
-                ) / 2.0 + port_index * outPortWidth
-                y = size.height()
-
-                result = QtCore.QPointF(x, y)
-        return result
-
-    @override
-    def portTextPosition(self, nodeId, portType, port_index):
-        from SpatialNode.definitions import NodeRole, PortType
-
-        p = self.portPosition(nodeId, portType, port_index)
-        rect = self._portTextRect(nodeId, portType, port_index)
-        p.setX(p.x() - rect.width() / 2.0)
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
-
-        match portType:
-            case PortType.In:
-                p.setY(5.0 + rect.height())
-            case PortType.Out:
-                p.setY(size.height() - 5.0)
-        return p
-
-    @override
-    def captionPosition(self, nodeId):
-        from SpatialNode.definitions import NodeRole, PortType
-
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
-        step = self._portCaptionsHeight(nodeId, PortType.In)
-        step += self._portSpacing
-        rect = self.captionRect(nodeId)
-        return QtCore.QPointF(0.5 * (size.width() - rect.width()), step + rect.height())
-
-    @override
-    def captionRect(self, nodeId):
-        from SpatialNode.definitions import NodeRole
-
-        if not self._graphModel.nodeData(nodeId, NodeRole.CaptionVisible):
-            return QtCore.QRectF()
-
-        name = self._graphModel.nodeData(nodeId, NodeRole.Caption)
-        return self._boldFontMetrics.boundingRect(name)
-
-    @override
-    def widgetPosition(self, nodeId):
-        from SpatialNode.definitions import NodeRole, PortType
+    def _layoutNode(self, size, capRect, labels, advances, captionsHeights, w):
+        from SpatialNode.definitions import PortType
 
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
+        layout = NodeLayout(size, capRect)
+        step = captionsHeights[PortType.In] + self._portSpacing
+        layout.captionPosition = QtCore.QPointF(
+            0.5 * (size.width() - capRect.width()), step + capRect.height()
+        )
 
-        captionHeight = self.captionRect(nodeId).height()
+        for portType, names in labels.items():
+            positions = layout.portPositions[portType] = []
+            textPositions = layout.portTextPositions[portType] = []
+            portWidth = advances[portType] + self._portSpacing
+            firstX = (size.width() - (len(names) - 1) * portWidth) / 2.0
+            y = 0.0 if portType == PortType.In else size.height()
+            layout.portGrids[portType] = PortGrid(firstX, y, portWidth, 0.0, len(names))
+            for portIndex, name in enumerate(names):
+                x = firstX + portIndex * portWidth
+                rect = self._fontMetrics.boundingRect(name)
+                textX = x - rect.width() / 2.0
+                match portType:
+                    case PortType.In:
+                        positions.append(QtCore.QPointF(x, 0.0))
+                        textPositions.append(QtCore.QPointF(textX, 5.0 + rect.height()))
+                    case PortType.Out:
+                        positions.append(QtCore.QPointF(x, size.height()))
+                        textPositions.append(QtCore.QPointF(textX, size.height() - 5.0))
 
-        w = self._graphModel.nodeData(nodeId, NodeRole.Widget)
         if w is not None:
+            x = self._portSpacing + advances[PortType.In]
             # If the widget wants to use as much vertical space as possible,
             # place it immediately after the caption.
             if (
                 w.sizePolicy().verticalPolicy().value
                 & QtWidgets.QSizePolicy.PolicyFlag.ExpandFlag.value
             ):
-                return QtCore.QPointF(
-                    self._portSpacing + self._maxPortsTextAdvance(nodeId, PortType.In),
-                    captionHeight,
-                )
+                layout.widgetPosition = QtCore.QPointF(x, capRect.height())
             else:
-                return QtCore.QPointF(
-                    self._portSpacing + self._maxPortsTextAdvance(nodeId, PortType.In),
-                    (captionHeight + size.height() - w.height()) / 2.0,
+                layout.widgetPosition = QtCore.QPointF(
+                    x, (capRect.height() + size.height() - w.height()) / 2.0
                 )
-        return QtCore.QPointF()
-
-    @override
-    def resizeHandleRect(self, nodeId):
-        from SpatialNode.definitions import NodeRole
 
-        size = self._graphModel.nodeData(nodeId, NodeRole.Size)
         rectSize = 7
-        return QtCore.QRect(
+        layout.resizeHandleRect = QtCore.QRect(
             size.width() - rectSize, size.height() - rectSize, rectSize, rectSize
         )
+        return layout
 
-    def _portTextRect(self, node_id, portType, portIndex):
-        from SpatialNode.definitions import PortRole
+    @override
+    def _measure(self, nodeId):
+        from SpatialNode.definitions import NodeRole, PortType
 
-        if self._graphModel.portData(
-            node_id, portType, portIndex, PortRole.CaptionVisible
-        ):
-            s = self._graphModel.portData(
-                node_id, portType, portIndex, PortRole.Caption
-            )
+        if self._graphModel.nodeData(nodeId, NodeRole.CaptionVisible):
+            name = self._graphModel.nodeData(nodeId, NodeRole.Caption)
+            capRect = self._boldFontMetrics.boundingRect(name)
         else:
-            portData = self._graphModel.portData(
-                node_id, portType, portIndex, PortRole.DataType
+            capRect = QtCore.QRectF()
+
+        labels = {}
+        advances = {}
+        captionsHeights = {}
+        for portType in (PortType.In, PortType.Out):
+            names = labels[portType] = self._portLabels(nodeId, portType)
+            advances[portType] = max(
+                (self._fontMetrics.horizontalAdvance(name) for name in names),
+                default=0,
             )
-            s = portData.name
-
-        return self._fontMetrics.boundingRect(s)
-
-    def _maxVerticalPortsExtent(self, node_id):
-        from SpatialNode.definitions import NodeRole
-
-        nInPorts = self._graphModel.nodeData(node_id, NodeRole.InPortCount)
-        nOutPorts = self._graphModel.nodeData(node_id, NodeRole.OutPortCount)
-        maxNumOfEntries = max(nInPorts, nOutPorts)
-        step = self._portSize + self._portSpacing
+            captionsHeights[portType] = self._portCaptionsHeight(nodeId, portType)
 
-        return step * maxNumOfEntries
+        w = self._graphModel.nodeData(nodeId, NodeRole.Widget)
+        return capRect, labels, advances, captionsHeights, w
 
-    def _maxPortsTextAdvance(self, node_id, port_type):
+    def _portLabels(self, node_id, port_type):
         from SpatialNode.definitions import NodeRole, PortType, PortRole
 
-        width = 0
-
         n = self._graphModel.nodeData(
             node_id,
             (
@@ -223,6 +170,7 @@ class DefaultVerticalNodeGeometry(AbstractNodeGeometry):
             ),
         )
 
+        names = []
         for portIndex in range(n):
             if self._graphModel.portData(
                 node_id, port_type, portIndex, PortRole.CaptionVisible
@@ -235,10 +183,8 @@ class DefaultVerticalNodeGeometry(AbstractNodeGeometry):
                     node_id, port_type, portIndex, PortRole.DataType
                 )
                 name = portData.name
-
-            width = max(self._fontMetrics.horizontalAdvance(name), width)
-
-        return width
+            names.append(name)
+        return names
 
     def _portCaptionsHeight(self, node_id, port_type):
         from SpatialNode.definitions import NodeRole, PortType, PortRole
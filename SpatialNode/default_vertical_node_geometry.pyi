@@ -6,13 +6,17 @@
 
 from typing import override
 
-from PySide6 import QtGui, QtCore
+from PySide6 import QtGui, QtCore, QtWidgets
 
 from SpatialNode.abstract_graph_model import AbstractGraphModel
-from SpatialNode.abstract_node_geometry import AbstractNodeGeometry
-from SpatialNode.definitions import NodeId, PortType, PortIndex
+from SpatialNode.abstract_node_geometry import (
+    AbstractNodeGeometry,
+    CachedNodeLayout,
+    NodeLayout,
+)
+from SpatialNode.definitions import NodeId, PortType
 
-class DefaultVerticalNodeGeometry(AbstractNodeGeometry):
+class DefaultVerticalNodeGeometry(CachedNodeLayout, AbstractNodeGeometry):
     def __init__(self, graphModel: AbstractGraphModel):
         self._portSize: int = None
         self._portSpacing: int = None
@@ -25,24 +29,28 @@ class DefaultVerticalNodeGeometry(AbstractNodeGeometry):
     @override
     def recomputeSize(self, nodeId: NodeId): ...
     @override
-    def portPosition(
-        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
-    ) -> QtCore.QPointF: ...
-    @override
-    def portTextPosition(
-        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
-    ) -> QtCore.QPointF: ...
-    @override
-    def captionPosition(self, nodeId: NodeId) -> QtCore.QPointF: ...
-    @override
-    def captionRect(self, nodeId: NodeId) -> QtCore.QRectF: ...
-    @override
-    def widgetPosition(self, nodeId: NodeId) -> QtCore.QPointF: ...
-    @override
-    def resizeHandleRect(self, nodeId: NodeId) -> QtCore.QRect: ...
-    def _portTextRect(
-        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
-    ): ...
-    def _maxVerticalPortsExtent(self, nodeId: NodeId): ...
-    def _maxPortsTextAdvance(self, nodeId: NodeId, portType: PortType | None): ...
+    def _layoutNode(
+        self,
+        size: QtCore.QSize,
+        capRect: QtCore.QRectF,
+        labels: dict[PortType, list[str]],
+        advances: dict[PortType, int],
+        captionsHeights: dict[PortType, int],
+        w: QtWidgets.QWidget | None,
+    ) -> NodeLayout: ...
+    @override
+    def _measure(self, nodeId: NodeId) -> tuple[
+        QtCore.QRectF,
+        dict[PortType, list[str]],
+        dict[PortType, int],
+        dict[PortType, int],
+        QtWidgets.QWidget | None,
+    ]:
+        """
+        Caption rect, port labels, widest label and caption height per port
+        type, and the widget.
+        """
+        ...
+
+    def _portLabels(self, nodeId: NodeId, portType: PortType) -> list[str]: ...
     def _portCaptionsHeight(self, nodeId: NodeId, portType: PortType | None): ...
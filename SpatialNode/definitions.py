@@ -6,8 +6,7 @@
 
 import sys
 from enum import *
-
-from PySide6 import QtCore
+from typing import Any
 
 
 class NodeRole(IntFlag):
@@ -33,6 +32,8 @@ class NodeRole(IntFlag):
     """unsigned int"""
     Widget = 10
     """Optional `QWidget * ` or `nullptr`"""
+    Computing = 11
+    """`bool`, the node delegate is computing"""
 
 
 class NodeFlag(IntFlag):
@@ -93,8 +94,14 @@ class ConnectionId:
     """
      A unique connection identificator that stores
     out `NodeId`, out `PortIndex`, in `NodeId`, in `PortIndex`
+
+    Instances are immutable values: two ids with the same four fields compare
+    equal and share the same (cached) hash, so they can be used interchangeably
+    as set members and dict keys.
     """
 
+    __slots__ = ("outNodeId", "outPortIndex", "inNodeId", "inPortIndex", "_hash")
+
     outNodeId: NodeId
     outPortIndex: PortIndex
     inNodeId: NodeId
@@ -107,16 +114,57 @@ class ConnectionId:
         inNodeId: NodeId,
         inPortIndex: PortIndex,
     ):
-        self.outNodeId = outNodeId
-        self.outPortIndex = outPortIndex
-        self.inNodeId = inNodeId
-        self.inPortIndex = inPortIndex
+        setField = object.__setattr__
+        setField(self, "outNodeId", outNodeId)
+        setField(self, "outPortIndex", outPortIndex)
+        setField(self, "inNodeId", inNodeId)
+        setField(self, "inPortIndex", inPortIndex)
+        setField(self, "_hash", hash((outNodeId, outPortIndex, inNodeId, inPortIndex)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ConnectionId is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ConnectionId is immutable")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, ConnectionId):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self.outNodeId == other.outNodeId
+            and self.outPortIndex == other.outPortIndex
+            and self.inNodeId == other.inNodeId
+            and self.inPortIndex == other.inPortIndex
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return (
+            f"ConnectionId({self.outNodeId}, {self.outPortIndex}, "
+            f"{self.inNodeId}, {self.inPortIndex})"
+        )
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (
+            ConnectionId,
+            (self.outNodeId, self.outPortIndex, self.inNodeId, self.inPortIndex),
+        )
 
 
 def invertConnection(id: ConnectionId):
-    """Inverts the Connection"""
-    (id.outNodeId, id.inNodeId) = (id.inNodeId, id.outNodeId)
-    (id.outPortIndex, id.inPortIndex) = (id.inPortIndex, id.outPortIndex)
+    """Returns the inverted Connection"""
+    return ConnectionId(id.inNodeId, id.inPortIndex, id.outNodeId, id.outPortIndex)
 
 
-QJsonObject = dict[str, QtCore.QJsonValue]
+QJsonObject = dict[str, Any]
@@ -0,0 +1,206 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.batch_column import BatchColumn
+from SpatialNode.definitions import PortType
+
+
+class ExecutionPlan:
+    def __init__(self, model, steps, inputSlots, outputSlots, slotCount):
+        self._model = model
+        self._version = model.topologyVersion()
+        self._steps = steps
+        self._inputSlots = inputSlots
+        self._outputSlots = outputSlots
+        self._slotCount = slotCount
+        # Qt delegates, whose signals are blocked while the plan runs
+        self._qtDelegates = tuple(
+            delegate for delegate, _, _ in steps if hasattr(delegate, "blockSignals")
+        )
+
+    @staticmethod
+    def compile(model, outputs, inputs=()):
+        inputs = tuple(inputs)
+        inputPorts = set(inputs)
+        outputs = tuple(outputs)
+        for nodeId in outputs + tuple(nodeId for nodeId, _ in inputs):
+            if not model.nodeExists(nodeId):
+                raise ValueError(f"No node with id {nodeId}")
+
+        slots = {port: slot for slot, port in enumerate(inputs)}
+
+        def slotOf(port):
+            slot = slots.get(port)
+            if slot is None:
+                slot = slots[port] = len(slots)
+            return slot
+
+        # upstream cone of the outputs, cut at the ports fed by `inputs`
+        needed = set()
+        stack = list(outputs)
+        while stack:
+            nodeId = stack.pop()
+            if nodeId in needed:
+                continue
+            needed.add(nodeId)
+            nIn = model.delegateModel(nodeId).nPorts(PortType.In)
+            for portIndex in range(nIn):
+                for cn in model.connections(nodeId, PortType.In, portIndex):
+                    if (cn.outNodeId, cn.outPortIndex) not in slots:
+                        stack.append(cn.outNodeId)
+
+        steps = []
+        for nodeId in sorted(needed, key=model.topologicalRank):
+            delegate = model.delegateModel(nodeId)
+            if delegate.computesAsynchronously:
+                raise ValueError(
+                    f"Node {nodeId} computes asynchronously and cannot be planned"
+                )
+            stepInputs = []
+            for portIndex in range(delegate.nPorts(PortType.In)):
+                for cn in model.connections(nodeId, PortType.In, portIndex):
+                    slot = slotOf((cn.outNodeId, cn.outPortIndex))
+                    stepInputs.append((portIndex, slot))
+            steps.append((nodeId, delegate, tuple(stepInputs)))
+
+        outputSlots = tuple(
+            ((nodeId, portIndex), slotOf((nodeId, portIndex)))
+            for nodeId in outputs
+            for portIndex in range(model.delegateModel(nodeId).nPorts(PortType.Out))
+        )
+
+        # a step only reads the outputs which have a reader, never the inputs
+        frozenSteps = []
+        for nodeId, delegate, stepInputs in steps:
+            stepOutputs = tuple(
+                (portIndex, slots[(nodeId, portIndex)])
+                for portIndex in range(delegate.nPorts(PortType.Out))
+                if (nodeId, portIndex) in slots
+                and (nodeId, portIndex) not in inputPorts
+            )
+            frozenSteps.append((delegate, stepInputs, stepOutputs))
+
+        return ExecutionPlan(
+            model,
+            tuple(frozenSteps),
+            tuple((port, slots[port], model.delegateModel(port[0])) for port in inputs),
+            outputSlots,
+            len(slots),
+        )
+
+    def isValid(self):
+        return self._version == self._model.topologyVersion()
+
+    def steps(self):
+        return self._steps
+
+    def inputPorts(self):
+        return [port for port, _, _ in self._inputSlots]
+
+    def run(self, inputs=None):
+        if not self.isValid():
+            raise RuntimeError("The graph topology changed since the plan was compiled")
+
+        if inputs is None:
+            inputs = {}
+        values = [None] * self._slotCount
+        for port, slot, delegate in self._inputSlots:
+            if port in inputs:
+                values[slot] = inputs[port]
+            else:
+                values[slot] = delegate.outData(port[1])
+
+        previous = self._model.blockPropagation(True)
+        blocked = [delegate.blockSignals(True) for delegate in self._qtDelegates]
+        try:
+            for delegate, stepInputs, stepOutputs in self._steps:
+                if stepInputs:
+                    delegate.deliverInData(
+                        {portIndex: values[slot] for portIndex, slot in stepInputs}
+                    )
+                for portIndex, slot in stepOutputs:
+                    values[slot] = delegate.outData(portIndex)
+        finally:
+            for delegate, wasBlocked in zip(self._qtDelegates, blocked):
+                delegate.blockSignals(wasBlocked)
+            self._model.blockPropagation(previous)
+
+        return {port: values[slot] for port, slot in self._outputSlots}
+
+    def runBatch(self, columns):
+        if not self.isValid():
+            raise RuntimeError("The graph topology changed since the plan was compiled")
+
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All the input columns must have the same length")
+        nRows = lengths.pop() if lengths else 1
+
+        values = [None] * self._slotCount
+        for port, slot, delegate in self._inputSlots:
+            if port in columns:
+                values[slot] = columns[port]
+            else:
+                values[slot] = [delegate.outData(port[1])] * nRows
+
+        previous = self._model.blockPropagation(True)
+        blocked = [delegate.blockSignals(True) for delegate in self._qtDelegates]
+        try:
+            for delegate, stepInputs, stepOutputs in self._steps:
+                self._runBatchStep(delegate, stepInputs, stepOutputs, values, nRows)
+        finally:
+            for delegate, wasBlocked in zip(self._qtDelegates, blocked):
+                delegate.blockSignals(wasBlocked)
+            self._model.blockPropagation(previous)
+
+        return {port: self._column(values[slot]) for port, slot in self._outputSlots}
+
+    @staticmethod
+    def _column(rows):
+        if isinstance(rows, BatchColumn):
+            return rows
+        return BatchColumn.fromRows(rows) or BatchColumn(rows, None)
+
+    @staticmethod
+    def _runBatchStep(delegate, stepInputs, stepOutputs, values, nRows):
+        if not stepInputs:
+            for portIndex, slot in stepOutputs:
+                values[slot] = [delegate.outData(portIndex)] * nRows
+            return
+
+        # vectorized, when every input converts to a column
+        batch = {}
+        for portIndex, slot in stepInputs:
+            column = values[slot]
+            if not isinstance(column, BatchColumn) or column.dataClass is None:
+                rows = column.rows() if isinstance(column, BatchColumn) else column
+                column = BatchColumn.fromRows(rows)
+                if column is None:
+                    break
+                values[slot] = column
+            batch[portIndex] = column
+        else:
+            result = delegate.computeBatch(batch)
+            if result is not NotImplemented:
+                for portIndex, slot in stepOutputs:
+                    values[slot] = result[portIndex]
+                return
+
+        # row by row otherwise
+        inputRows = []
+        for portIndex, slot in stepInputs:
+            column = values[slot]
+            rows = column.rows() if isinstance(column, BatchColumn) else column
+            inputRows.append((portIndex, rows))
+        outputRows = [(slot, portIndex, []) for portIndex, slot in stepOutputs]
+        for row in range(nRows):
+            delegate.deliverInData(
+                {portIndex: rows[row] for portIndex, rows in inputRows}
+            )
+            for _, portIndex, rows in outputRows:
+                rows.append(delegate.outData(portIndex))
+        for slot, _, rows in outputRows:
+            values[slot] = rows
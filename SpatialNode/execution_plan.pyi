@@ -0,0 +1,109 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Iterable
+
+from SpatialNode.batch_column import BatchColumn
+from SpatialNode.core_graph_model import CoreGraphModel
+from SpatialNode.core_node_delegate import CoreNodeDelegate
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import NodeId, PortIndex
+from SpatialNode.node_data import NodeData
+
+OutPort = tuple[NodeId, PortIndex]
+
+class ExecutionPlan:
+    """
+    Frozen evaluation order of the part of a graph that feeds some output
+    nodes, for running the same graph many times with different inputs.
+
+    A plan is a flat list of steps in topological order, one per node:
+    the delegate, the slots its inputs are read from and the slots its
+    outputs are written to. Running it delivers all the inputs of every
+    step at once through `deliverInData` and reads `outData`, without
+    touching the graph model. The model's own propagation, and the signals
+    of Qt delegates, are blocked meanwhile.
+
+    ```python
+    plan = model.compile(outputs=[display], inputs=[(source, 0)])
+    for x in values:
+        results = plan.run({(source, 0): DecimalData(x)})
+    ```
+
+    Plans are synchronous and expect delegates which compute in
+    `setInData`. Nodes outside the plan are not updated. A plan becomes
+    invalid when connections or nodes are added or removed.
+
+    Delegates computing in the background, such as `AsyncNodeDelegateModel`,
+    cannot be steps: their `outData` would still hold the previous result.
+    `compile` rejects them; they may feed a plan through `inputs`.
+    """
+
+    def __init__(
+        self,
+        model: DataFlowGraphModel | CoreGraphModel,
+        steps: tuple[
+            tuple[
+                CoreNodeDelegate,
+                tuple[tuple[PortIndex, int], ...],
+                tuple[tuple[PortIndex, int], ...],
+            ],
+            ...,
+        ],
+        inputSlots: tuple[tuple[OutPort, int, CoreNodeDelegate], ...],
+        outputSlots: tuple[tuple[OutPort, int], ...],
+        slotCount: int,
+    ):
+        self._model: DataFlowGraphModel | CoreGraphModel = None
+        self._version: int = None
+        """`topologyVersion()` of the model at compile time."""
+        self._steps = None
+        self._inputSlots = None
+        self._outputSlots = None
+        self._slotCount: int = None
+        self._qtDelegates: tuple[CoreNodeDelegate, ...] = None
+        """Delegates with Qt signals, blocked during `run`."""
+
+    @staticmethod
+    def compile(
+        model: DataFlowGraphModel | CoreGraphModel,
+        outputs: Iterable[NodeId],
+        inputs: Iterable[OutPort] = (),
+    ) -> ExecutionPlan:
+        """
+        Plans the evaluation of `outputs` and of every node upstream of them.
+        `inputs` are output ports whose data is passed to `run` instead of
+        being computed; the nodes only needed to compute them are left out.
+        Raises `ValueError` for unknown nodes, and for delegates with
+        `computesAsynchronously` among the planned steps.
+        """
+        ...
+
+    def isValid(self) -> bool: ...
+    def steps(self) -> tuple: ...
+    def inputPorts(self) -> list[OutPort]: ...
+    def run(
+        self, inputs: dict[OutPort, NodeData | None] | None = None
+    ) -> dict[OutPort, NodeData | None]:
+        """
+        Evaluates the plan and returns the data on every output port of the
+        output nodes. Input ports missing from `inputs` keep the data their
+        node currently provides. Raises `RuntimeError` on an invalid plan.
+        """
+        ...
+
+    def runBatch(
+        self, columns: dict[OutPort, BatchColumn | list[NodeData | None]]
+    ) -> dict[OutPort, BatchColumn]:
+        """
+        Evaluates the plan once over whole columns of inputs, all of the same
+        length, and returns one `BatchColumn` per output port, whichever way
+        it was computed; `rows()` gives the data of every row. Each step calls
+        `computeBatch` when all its inputs convert to `BatchColumn`s, and
+        falls back to running row by row otherwise. Input ports missing from
+        `columns` repeat the data their node currently provides.
+        """
+        ...
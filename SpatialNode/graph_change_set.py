@@ -0,0 +1,56 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+
+class GraphChangeSet:
+    def __init__(self):
+        self.nodesAdded = set()
+        self.nodesRemoved = set()
+        self.nodesMoved = set()
+        self.nodesUpdated = set()
+        self.connectionsAdded = set()
+        self.connectionsRemoved = set()
+
+    def isEmpty(self):
+        return not (
+            self.nodesAdded
+            or self.nodesRemoved
+            or self.nodesMoved
+            or self.nodesUpdated
+            or self.connectionsAdded
+            or self.connectionsRemoved
+        )
+
+    def addNode(self, nodeId):
+        self.nodesAdded.add(nodeId)
+
+    def removeNode(self, nodeId):
+        self.nodesMoved.discard(nodeId)
+        self.nodesUpdated.discard(nodeId)
+
+        if nodeId in self.nodesAdded:
+            self.nodesAdded.discard(nodeId)
+        else:
+            self.nodesRemoved.add(nodeId)
+
+    def moveNode(self, nodeId):
+        if nodeId not in self.nodesAdded:
+            self.nodesMoved.add(nodeId)
+
+    def updateNode(self, nodeId):
+        self.nodesUpdated.add(nodeId)
+
+    def addConnection(self, connectionId):
+        if connectionId in self.connectionsRemoved:
+            self.connectionsRemoved.discard(connectionId)
+        else:
+            self.connectionsAdded.add(connectionId)
+
+    def removeConnection(self, connectionId):
+        if connectionId in self.connectionsAdded:
+            self.connectionsAdded.discard(connectionId)
+        else:
+            self.connectionsRemoved.add(connectionId)
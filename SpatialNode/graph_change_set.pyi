@@ -0,0 +1,42 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.definitions import NodeId, ConnectionId
+
+class GraphChangeSet:
+    """
+    Net structural changes accumulated by `AbstractGraphModel` while a batch is
+    open. Opposite operations on the same id cancel out, so a node created and
+    deleted inside one batch does not appear at all.
+    """
+
+    def __init__(self):
+        self.nodesAdded: set[NodeId] = None
+        self.nodesRemoved: set[NodeId] = None
+        self.nodesMoved: set[NodeId] = None
+        self.nodesUpdated: set[NodeId] = None
+        self.connectionsAdded: set[ConnectionId] = None
+        self.connectionsRemoved: set[ConnectionId] = None
+
+    def isEmpty(self) -> bool: ...
+    def addNode(self, nodeId: NodeId) -> None: ...
+    def removeNode(self, nodeId: NodeId) -> None:
+        """
+        Cancels a pending creation, otherwise records the removal. Pending
+        moves and updates of the node are dropped.
+        """
+        ...
+
+    def moveNode(self, nodeId: NodeId) -> None:
+        """
+        Nodes created in the same batch are not recorded: they are placed at
+        their final position on creation.
+        """
+        ...
+
+    def updateNode(self, nodeId: NodeId) -> None: ...
+    def addConnection(self, connectionId: ConnectionId) -> None: ...
+    def removeConnection(self, connectionId: ConnectionId) -> None: ...
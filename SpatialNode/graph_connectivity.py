@@ -0,0 +1,134 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import override
+
+from SpatialNode.definitions import PortType, QJsonObject
+from SpatialNode.serializable import Serializable
+from SpatialNode.topological_order import TopologicalOrder
+
+
+class GraphConnectivity(Serializable):
+    _jsonArray = list
+
+    def _initConnectivity(self):
+        self._nextNodeId = 0
+        self._connectivity = set()
+        self._portConnections = {}
+        self._nodeConnections = {}
+        self._topologicalOrder = TopologicalOrder()
+        self._topologyVersion = 0
+
+    def topologyVersion(self):
+        return self._topologyVersion
+
+    def newNodeId(self):
+        result = self._nextNodeId
+        self._nextNodeId += 1
+        return result
+
+    def allConnectionIds(self, nodeId):
+        return set(self._nodeConnections.get(nodeId, ()))
+
+    def connections(self, nodeId, portType, portIndex):
+        return set(self._portConnections.get((nodeId, portType, portIndex), ()))
+
+    def connectionExists(self, connectionId):
+        return connectionId in self._connectivity
+
+    def topologicalOrder(self):
+        return list(self._topologicalOrder.order())
+
+    def topologicalRank(self, nodeId):
+        return self._topologicalOrder.rank(nodeId)
+
+    def wouldCreateCycle(self, connectionId):
+        return self._topologicalOrder.wouldCreateCycle(
+            connectionId.outNodeId, connectionId.inNodeId
+        )
+
+    def hasCycles(self):
+        return self._topologicalOrder.hasCycles()
+
+    @override
+    def save(self):
+        from SpatialNode.connection_id_utils import toJson
+
+        sceneJson = QJsonObject()
+
+        nodesJsonArray = self._jsonArray()
+        for nodeId in self._models:
+            nodesJsonArray.append(self.saveNode(nodeId))
+        sceneJson["nodes"] = nodesJsonArray
+
+        connJsonArray = self._jsonArray()
+        for cid in self._connectivity:
+            connJsonArray.append(toJson(cid))
+        sceneJson["connections"] = connJsonArray
+
+        return sceneJson
+
+    @override
+    def load(self, jsonDocument):
+        from SpatialNode.connection_id_utils import fromJson
+
+        for nodeJson in jsonDocument["nodes"]:
+            self.loadNode(nodeJson)
+
+        for connection in jsonDocument["connections"]:
+            self.addConnection(fromJson(connection))
+
+    def _linkConnection(self, connectionId):
+        if connectionId in self._connectivity:
+            return False
+
+        self._connectivity.add(connectionId)
+        self._indexConnection(connectionId)
+        self._topologyVersion += 1
+        self._topologicalOrder.addEdge(connectionId.outNodeId, connectionId.inNodeId)
+        return True
+
+    def _unlinkConnection(self, connectionId):
+        if connectionId not in self._connectivity:
+            return False
+
+        self._connectivity.remove(connectionId)
+        self._unindexConnection(connectionId)
+        self._topologyVersion += 1
+        self._topologicalOrder.removeEdge(connectionId.outNodeId, connectionId.inNodeId)
+        return True
+
+    def _unlinkNode(self, nodeId):
+        self._nodeConnections.pop(nodeId, None)
+        self._topologicalOrder.removeNode(nodeId)
+        self._topologyVersion += 1
+
+    def _indexConnection(self, connectionId):
+        outKey = (connectionId.outNodeId, PortType.Out, connectionId.outPortIndex)
+        inKey = (connectionId.inNodeId, PortType.In, connectionId.inPortIndex)
+
+        self._portConnections.setdefault(outKey, set()).add(connectionId)
+        self._portConnections.setdefault(inKey, set()).add(connectionId)
+        self._nodeConnections.setdefault(connectionId.outNodeId, set()).add(
+            connectionId
+        )
+        self._nodeConnections.setdefault(connectionId.inNodeId, set()).add(connectionId)
+
+    def _unindexConnection(self, connectionId):
+        outKey = (connectionId.outNodeId, PortType.Out, connectionId.outPortIndex)
+        inKey = (connectionId.inNodeId, PortType.In, connectionId.inPortIndex)
+
+        for index, key in [
+            (self._portConnections, outKey),
+            (self._portConnections, inKey),
+            (self._nodeConnections, connectionId.outNodeId),
+            (self._nodeConnections, connectionId.inNodeId),
+        ]:
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.discard(connectionId)
+                if len(bucket) == 0:
+                    del index[key]
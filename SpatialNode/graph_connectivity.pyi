@@ -0,0 +1,105 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Any, Callable, override
+
+from SpatialNode.definitions import (
+    NodeId,
+    ConnectionId,
+    PortIndex,
+    PortType,
+    QJsonObject,
+)
+from SpatialNode.serializable import Serializable
+from SpatialNode.topological_order import TopologicalOrder
+
+class GraphConnectivity(Serializable):
+    """
+    Connections, adjacency indexes, topological order and scene JSON shared
+    by `DataFlowGraphModel` and `CoreGraphModel`. Free of Qt.
+
+    The host class keeps its delegates in `_models` and provides `saveNode`,
+    `loadNode` and `addConnection`; it calls `_initConnectivity` from its
+    constructor and wraps `_linkConnection` and `_unlinkConnection` with its
+    own notifications.
+    """
+
+    _jsonArray: Callable[[], Any]
+    """Type of the arrays written by `save`, `list` unless overridden."""
+
+    _models: dict[NodeId, Any]
+
+    def _initConnectivity(self) -> None:
+        self._nextNodeId: int = None
+        self._connectivity: set[ConnectionId] = None
+        self._portConnections: dict[
+            tuple[NodeId, PortType, PortIndex], set[ConnectionId]
+        ] = None
+        self._nodeConnections: dict[NodeId, set[ConnectionId]] = None
+        self._topologicalOrder: TopologicalOrder = None
+        self._topologyVersion: int = None
+
+    def topologyVersion(self) -> int:
+        """Incremented when a connection is added or removed, or a node deleted."""
+        ...
+
+    def newNodeId(self) -> NodeId: ...
+    def allConnectionIds(self, nodeId: NodeId) -> set[ConnectionId]: ...
+    def connections(
+        self, nodeId: NodeId, portType: PortType | None, portIndex: PortIndex
+    ) -> set[ConnectionId]: ...
+    def connectionExists(self, connectionId: ConnectionId) -> bool: ...
+    def topologicalOrder(self) -> list[NodeId]:
+        """
+        All nodes, upstream first. The order is maintained incrementally on
+        every connection change, see `TopologicalOrder`; connections closing a
+        cycle are ignored by it.
+        """
+        ...
+
+    def topologicalRank(self, nodeId: NodeId) -> int:
+        """Sort key of `nodeId` in `topologicalOrder()`."""
+        ...
+
+    def wouldCreateCycle(self, connectionId: ConnectionId) -> bool:
+        """
+        Whether adding `connectionId` closes a cycle. `connectionPossible`
+        rejects such connections; `addConnection` still accepts them.
+        """
+        ...
+
+    def hasCycles(self) -> bool: ...
+    @override
+    def save(self) -> QJsonObject: ...
+    @override
+    def load(self, jsonDocument: QJsonObject) -> None: ...
+    def _linkConnection(self, connectionId: ConnectionId) -> bool:
+        """
+        Records `connectionId` in the indexes and the topological order.
+        Returns False if it already exists.
+        """
+        ...
+
+    def _unlinkConnection(self, connectionId: ConnectionId) -> bool:
+        """Inverse of `_linkConnection`. Returns False if it did not exist."""
+        ...
+
+    def _unlinkNode(self, nodeId: NodeId) -> None:
+        """Drops `nodeId` once all its connections are unlinked."""
+        ...
+
+    def _indexConnection(self, connectionId: ConnectionId) -> None:
+        """
+        Registers `connectionId` in the per-port and per-node adjacency indexes,
+        so `connections()` and `allConnectionIds()` run in O(degree).
+        """
+        ...
+
+    def _unindexConnection(self, connectionId: ConnectionId) -> None:
+        """
+        Removes `connectionId` from the adjacency indexes, dropping empty buckets.
+        """
+        ...
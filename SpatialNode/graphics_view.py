@@ -46,6 +46,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
             QtWidgets.QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate
         )
         self.setScaleRange(0.3, 2)
+        self.scaleChanged.connect(self._updateLevelOfDetail)
 
         # Sets the scene rect to its maximum possible ranges to avoid autu scene range
         # re-calculation when expanding the all QGraphicsItems common rect.
@@ -137,6 +138,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
         redoAction.setShortcuts(QtGui.QKeySequence.StandardKey.Redo)
         self.addAction(redoAction)
 
+        self._updateLevelOfDetail()
+
     def centerScene(self):
         if self.scene() is not None:
             self.scene().setSceneRect(QtCore.QRectF())
@@ -147,6 +150,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
                 or sceneRect.height() > self.rect().height()
             ):
                 self.fitInView(sceneRect, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+                self._updateLevelOfDetail()
 
             self.centerOn(sceneRect.center())
 
@@ -336,6 +340,14 @@ class GraphicsView(QtWidgets.QGraphicsView):
     def nodeScene(self):
         return self.scene()
 
+    def _updateLevelOfDetail(self):
+        if self.scene() is not None:
+            self.scene().updateLevelOfDetail(
+                QtWidgets.QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+                    self.transform()
+                )
+            )
+
     # Computes scene position for pasting the copied/duplicated node groups.
     def scenePastePosition(self):
         origin = self.mapFromGlobal(QtGui.QCursor.pos())
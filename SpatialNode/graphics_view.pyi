@@ -62,3 +62,10 @@ class GraphicsView(QtWidgets.QGraphicsView):
     def showEvent(self, event): ...
     def nodeScene(self) -> BasicGraphicsScene: ...
     def scenePastePosition(self) -> QtCore.QPointF: ...
+    def _updateLevelOfDetail(self) -> None:
+        """
+        Passes the level of detail of the view transform to
+        `BasicGraphicsScene.updateLevelOfDetail`, on `scaleChanged`, a new
+        scene and `centerScene`.
+        """
+        ...
@@ -0,0 +1,73 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+
+class LazyNodeType:
+    __slots__ = ("modelName", "prototype", "descriptors")
+
+    def __init__(self, modelName, prototype):
+        self.modelName = modelName
+        self.prototype = prototype
+        self.descriptors = None
+
+
+class LazyNodeDelegate:
+    __slots__ = ("_graphModel", "_nodeId", "_nodeType", "_scene", "_index")
+
+    def __init__(self, graphModel, nodeId, nodeType, scene, index):
+        self._graphModel = graphModel
+        self._nodeId = nodeId
+        self._nodeType = nodeType
+        self._scene = scene
+        self._index = index
+
+    def nodeType(self):
+        return self._nodeType
+
+    def position(self):
+        return self._scene.position(self._index)
+
+    def internalData(self):
+        return self._scene.internalData(self._index)
+
+    def materialize(self):
+        return self._graphModel.materializeNode(self._nodeId)
+
+    # the static description comes from the prototype of the model type
+
+    def caption(self):
+        return self._nodeType.prototype.caption()
+
+    def captionVisible(self):
+        return self._nodeType.prototype.captionVisible()
+
+    def resizable(self):
+        return self._nodeType.prototype.resizable()
+
+    def nPorts(self, portType):
+        return self._nodeType.prototype.nPorts(portType)
+
+    def dataType(self, portType, portIndex):
+        return self._nodeType.prototype.dataType(portType, portIndex)
+
+    def portConnectionPolicy(self, portType, portIndex):
+        return self._nodeType.prototype.portConnectionPolicy(portType, portIndex)
+
+    def portCaptionVisible(self, portType, portIndex):
+        return self._nodeType.prototype.portCaptionVisible(portType, portIndex)
+
+    def portCaption(self, portType, portIndex):
+        return self._nodeType.prototype.portCaption(portType, portIndex)
+
+    def embeddedWidget(self):
+        return self._nodeType.prototype.embeddedWidget()
+
+    def save(self):
+        return self.internalData()
+
+    def __getattr__(self, name):
+        # anything else needs the real delegate
+        return getattr(self.materialize(), name)
@@ -0,0 +1,78 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Any
+
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel, NodePortDescriptors
+from SpatialNode.definitions import (
+    ConnectionPolicy,
+    NodeId,
+    PortIndex,
+    PortType,
+    QJsonObject,
+)
+from SpatialNode.node_data import NodeDataType
+from SpatialNode.node_delegate_model import NodeDelegateModel
+from SpatialNode.scene_binary_format import BinaryScene
+
+class LazyNodeType:
+    """
+    What the lazy nodes of one model type share: an unconnected `prototype`
+    delegate answering for their static description, and its port
+    descriptors.
+    """
+
+    def __init__(self, modelName: str, prototype: NodeDelegateModel):
+        self.modelName: str = None
+        self.prototype: NodeDelegateModel = None
+        self.descriptors: NodePortDescriptors | None = None
+
+class LazyNodeDelegate:
+    """
+    Stand-in for the delegate of a node loaded by
+    `DataFlowGraphModel.loadBinary(..., lazy=True)`, a few slots pointing into
+    the `BinaryScene`. Caption, ports, widget and saving are answered
+    without the delegate; any other attribute materializes it through
+    `DataFlowGraphModel.materializeNode`.
+
+    Ports which depend on internal data, as with dynamic ports, are those of
+    a freshly created delegate until the node is materialized.
+    """
+
+    def __init__(
+        self,
+        graphModel: DataFlowGraphModel,
+        nodeId: NodeId,
+        nodeType: LazyNodeType,
+        scene: BinaryScene,
+        index: int,
+    ): ...
+    def nodeType(self) -> LazyNodeType: ...
+    def position(self) -> tuple[float, float]: ...
+    def internalData(self) -> QJsonObject: ...
+    def materialize(self) -> NodeDelegateModel: ...
+    def caption(self) -> str: ...
+    def captionVisible(self) -> bool: ...
+    def resizable(self) -> bool: ...
+    def nPorts(self, portType: PortType) -> int: ...
+    def dataType(self, portType: PortType, portIndex: PortIndex) -> NodeDataType: ...
+    def portConnectionPolicy(
+        self, portType: PortType, portIndex: PortIndex
+    ) -> ConnectionPolicy: ...
+    def portCaptionVisible(self, portType: PortType, portIndex: PortIndex) -> bool: ...
+    def portCaption(self, portType: PortType, portIndex: PortIndex) -> str: ...
+    def embeddedWidget(self) -> Any:
+        """
+        The widget of the prototype, shared by all the lazy nodes of the type.
+        Only good for sizing the node; it is never embedded.
+        """
+        ...
+
+    def save(self) -> QJsonObject:
+        """The internal data from the scene file."""
+        ...
+
+    def __getattr__(self, name: str) -> Any: ...
@@ -22,5 +22,24 @@ class NodeData(ABC):
             return self.type().id == nodeData.type().id
         return False
 
+    def fingerprint(self):
+        try:
+            key = (type(self), tuple(sorted(vars(self).items())))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def batchValue(self):
+        return self
+
+    @classmethod
+    def fromBatchValue(cls, value):
+        return value
+
+    @classmethod
+    def emptyBatchValue(cls):
+        return None
+
     @abstractmethod
     def type(self) -> NodeDataType: ...
@@ -5,6 +5,7 @@
 #  property of any third parties.
 
 from abc import ABC, abstractmethod
+from typing import Any, Hashable
 
 class NodeDataType:
     id: str
@@ -20,5 +21,33 @@ class NodeData(ABC):
     """
 
     def sameType(self, nodeData: NodeData): ...
+    def fingerprint(self) -> Hashable | None:
+        """
+        Hashable value identifying the content of the data, used to memoize
+        computations. The default is built from the instance attributes;
+        `None` means the data cannot be fingerprinted, e.g. because it holds
+        unhashable values. Override it for large payloads, e.g. with a version
+        counter or a digest.
+        """
+        ...
+
+    def batchValue(self) -> Any:
+        """
+        Value standing for this data in a `BatchColumn`. The default is the
+        data itself; override it together with `fromBatchValue`, e.g. with a
+        number, so that `computeBatch` can work on arrays.
+        """
+        ...
+
+    @classmethod
+    def fromBatchValue(cls, value: Any) -> NodeData | None:
+        """Inverse of `batchValue`, `None` for `emptyBatchValue()`."""
+        ...
+
+    @classmethod
+    def emptyBatchValue(cls) -> Any:
+        """Column value of a row without data, e.g. `nan` for numbers."""
+        ...
+
     @abstractmethod
     def type(self) -> NodeDataType: ...
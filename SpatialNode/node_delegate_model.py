@@ -4,84 +4,41 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
-from abc import ABC, abstractmethod
-from typing import override
+from abc import abstractmethod
 
 from PySide6 import QtCore
 
-from SpatialNode.definitions import QJsonObject
-from SpatialNode.serializable import Serializable
+from SpatialNode.core_node_delegate import CoreNodeDelegate
 
 
-class NodeDelegateModel(QtCore.QObject, Serializable):
+class NodeDelegateModel(QtCore.QObject, CoreNodeDelegate):
     def __init__(self):
-        from SpatialNode.node_style import NodeStyle
-
         super().__init__()
-        self._nodeStyle = NodeStyle()
-
-    def captionVisible(self):
-        return True
-
-    def caption(self):
-        return "NodeDelegateModel"
-
-    def portCaptionVisible(self, port_type, port_index):
-        return False
-
-    def portCaption(self, port_type, port_index):
-        return ""
-
-    @staticmethod
-    def register(registry, *args, **kwargs): ...
-
-    @override
-    def save(self):
-        modelJson = QJsonObject()
-        modelJson["model-name"] = type(self).__name__
-        return modelJson
-
-    @override
-    def load(self, p): ...
-
-    @abstractmethod
-    def nPorts(self, portType): ...
-
-    @abstractmethod
-    def dataType(self, portType, portIndex): ...
-
-    def portConnectionPolicy(self, port_type, port_index):
-        from SpatialNode.definitions import ConnectionPolicy, PortType
-
-        result = ConnectionPolicy.One
-        match port_type:
-            case PortType.In:
-                result = ConnectionPolicy.One
-            case PortType.Out:
-                result = ConnectionPolicy.Many
-
-        return result
+        self._nodeStyle = None
 
     @property
     def nodeStyle(self):
+        if self._nodeStyle is None:
+            from SpatialNode.style_collection import StyleCollection
+
+            self._nodeStyle = StyleCollection.nodeStyle().copy()
         return self._nodeStyle
 
     @nodeStyle.setter
     def nodeStyle(self, style):
         self._nodeStyle = style
+        self.nodeStyleUpdated.emit()
 
-    @abstractmethod
-    def setInData(self, nodeData, portIndex): ...
+    def effectiveNodeStyle(self):
+        if self._nodeStyle is None:
+            from SpatialNode.style_collection import StyleCollection
 
-    @abstractmethod
-    def outData(self, port): ...
+            return StyleCollection.nodeStyle()
+        return self._nodeStyle
 
     @abstractmethod
     def embeddedWidget(self): ...
 
-    def resizable(self):
-        return False
-
     from SpatialNode.definitions import PortIndex, PortType
 
     dataUpdated = QtCore.Signal(PortIndex)
@@ -96,6 +53,8 @@ class NodeDelegateModel(QtCore.QObject, Serializable):
 
     embeddedWidgetSizeUpdated = QtCore.Signal()
 
+    nodeStyleUpdated = QtCore.Signal()
+
     portsAboutToBeDeleted = QtCore.Signal(PortType, PortIndex, PortIndex)
 
     portsDeleted = QtCore.Signal()
@@ -103,11 +62,3 @@ class NodeDelegateModel(QtCore.QObject, Serializable):
     portsAboutToBeInserted = QtCore.Signal(PortType, PortIndex, PortIndex)
 
     portsInserted = QtCore.Signal()
-
-    def inputConnectionCreated(self, connection_id): ...
-
-    def inputConnectionDeleted(self, connection_id): ...
-
-    def outputConnectionCreated(self, connection_id): ...
-
-    def outputConnectionDeleted(self, connection_id): ...
@@ -4,70 +4,43 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
-from abc import ABC, abstractmethod
-from typing import override
+from abc import abstractmethod
 
 from PySide6 import QtCore, QtWidgets
 
-from SpatialNode.definitions import PortType, PortIndex, ConnectionId, ConnectionPolicy
-from SpatialNode.node_data import NodeData, NodeDataType
+from SpatialNode.core_node_delegate import CoreNodeDelegate
+from SpatialNode.definitions import PortType, PortIndex
 from SpatialNode.node_style import NodeStyle
-from SpatialNode.serializable import Serializable
 
-class NodeDelegateModel(QtCore.QObject, Serializable, ABC):
+class NodeDelegateModel(QtCore.QObject, CoreNodeDelegate):
+    """
+    `CoreNodeDelegate` for the GUI: its signals are Qt signals, so they can
+    cross threads, and it carries a `NodeStyle` and an embedded widget.
+    """
+
     def __init__(self):
         self._nodeStyle: NodeStyle = None
 
-    def captionVisible(self) -> bool:
-        """It is possible to hide caption in GUI"""
-        ...
-
-    def caption(self) -> str:
-        """
-        Caption is used in GUI
-        """
-        ...
-
-    def portCaptionVisible(
-        self, portType: PortType | None, portIndex: PortIndex
-    ) -> bool:
+    @property
+    def nodeStyle(self) -> NodeStyle:
         """
-        It is possible to hide port caption in GUI
+        The style of this node, owned by it and editable. The first read copies
+        `StyleCollection.nodeStyle()`; until then the node shares that style,
+        see `effectiveNodeStyle`.
         """
         ...
 
-    def portCaption(self, portType: PortType | None, portIndex: PortIndex) -> str:
+    @nodeStyle.setter
+    def nodeStyle(self, style: NodeStyle): ...
+    def effectiveNodeStyle(self) -> NodeStyle:
         """
-        Port caption is used in GUI to label individual ports
+        The style drawn for this node: its own `nodeStyle` once read or set,
+        else the shared, frozen `StyleCollection.nodeStyle()`, without copying it.
         """
         ...
 
-    @staticmethod
-    def register(registry, *args, **kwargs): ...
-    @override
-    def save(self): ...
-    @override
-    def load(self, p: QtCore.QJsonArray): ...
-    @abstractmethod
-    def nPorts(self, portType: PortType | None) -> int: ...
-    @abstractmethod
-    def dataType(
-        self, portType: PortType | None, portIndex: PortIndex
-    ) -> NodeDataType: ...
-    def portConnectionPolicy(
-        self, portType: PortType | None, portIndex: PortIndex
-    ) -> ConnectionPolicy: ...
-    @property
-    def nodeStyle(self) -> NodeStyle: ...
-    @nodeStyle.setter
-    def nodeStyle(self, style: NodeStyle): ...
-    @abstractmethod
-    def setInData(self, nodeData: NodeData, portIndex: PortIndex) -> None: ...
-    @abstractmethod
-    def outData(self, port: PortIndex) -> NodeData: ...
     @abstractmethod
     def embeddedWidget(self) -> QtWidgets.QWidget: ...
-    def resizable(self) -> bool: ...
 
     dataUpdated: QtCore.Signal(PortIndex)
     """Triggers the updates in the nodes downstream."""
@@ -81,6 +54,9 @@ class NodeDelegateModel(QtCore.QObject, Serializable, ABC):
 
     embeddedWidgetSizeUpdated: QtCore.Signal()
 
+    nodeStyleUpdated: QtCore.Signal()
+    """Emitted when a style is assigned to `nodeStyle`."""
+
     portsAboutToBeDeleted: QtCore.Signal(PortType, PortIndex, PortIndex)
 
     portsDeleted: QtCore.Signal()
@@ -88,8 +64,3 @@ class NodeDelegateModel(QtCore.QObject, Serializable, ABC):
     portsAboutToBeInserted: QtCore.Signal(PortType, PortIndex, PortIndex)
 
     portsInserted: QtCore.Signal()
-
-    def inputConnectionCreated(self, connectionId: ConnectionId) -> None: ...
-    def inputConnectionDeleted(self, connectionId: ConnectionId) -> None: ...
-    def outputConnectionCreated(self, connectionId: ConnectionId) -> None: ...
-    def outputConnectionDeleted(self, connectionId: ConnectionId) -> None: ...
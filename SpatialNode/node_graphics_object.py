@@ -12,7 +12,6 @@ from PySide6 import QtWidgets, QtCore, QtGui
 class NodeGraphicsObject(QtWidgets.QGraphicsObject):
     def __init__(self, scene, node):
         from SpatialNode.node_state import NodeState
-        from SpatialNode.node_style import NodeStyle
         from SpatialNode.definitions import NodeRole
 
         super().__init__()
@@ -20,6 +19,7 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
         self._graphModel = scene.graphModel
         self._nodeState = NodeState()
         self._proxyWidget = None
+        self._widgetPending = False
 
         scene.addItem(self)
 
@@ -29,11 +29,11 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
         )
         self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsFocusable, True)
 
-        self._setLockedState()
+        self.updateLockedState()
 
         self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
-        nodeStyle = NodeStyle()
+        nodeStyle = self._graphModel.nodeStyle(node)
         effect = QtWidgets.QGraphicsDropShadowEffect()
         effect.setOffset(4, 4)
         effect.setBlurRadius(20)
@@ -50,9 +50,6 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
 
         pos = self._graphModel.nodeData(self._nodeId, NodeRole.Position)
         self.setPos(pos)
-        self._graphModel.nodeFlagsUpdated.connect(
-            lambda nodeId: self._setLockedState() if self._nodeId == nodeId else None
-        )
 
     @property
     def graphModel(self):
@@ -78,11 +75,14 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
 
     def moveConnections(self):
         connected = self._graphModel.allConnectionIds(self._nodeId)
+        layer = self.nodeScene().connectionLayer
 
         for cnId in connected:
             cgo = self.nodeScene().connectionGraphicsObject(cnId)
             if cgo:
                 cgo.move()
+            elif layer is not None:
+                layer.moveConnection(cnId)
 
     def reactToConnection(self, cgo):
         self._nodeState.connectionForReaction = cgo
@@ -101,6 +101,12 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
             and self.scene()
         ):
             self.moveConnections()
+        elif (
+            change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemVisibleHasChanged
+            and value
+            and self.scene()
+        ):
+            self.nodeScene().onNodeShown(self._nodeId)
 
         return super().itemChange(change, value)
 
@@ -135,7 +141,7 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
                 cnId = list(connected)[0]
                 interaction = NodeConnectionInteraction(
                     self,
-                    self.nodeScene().connectionGraphicsObject(cnId),
+                    self.nodeScene().promoteConnection(cnId),
                     self.nodeScene(),
                 )
 
@@ -185,7 +191,7 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
             diff = event.pos() - event.lastPos()
             w = self._graphModel.nodeData(self._nodeId, NodeRole.Widget)
 
-            if w is not None:
+            if w is not None and self._proxyWidget is not None:
                 self.prepareGeometryChange()
                 oldSize = w.size()
                 oldSize += QtCore.QSize(diff.x(), diff.y())
@@ -274,11 +280,17 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
         geometry = self.nodeScene().nodeGeometry
         geometry.recomputeSize(self._nodeId)
 
+        # until materialized, the widget only sizes the node
+        self._widgetPending = not self._graphModel.isMaterialized(self._nodeId)
+        if self._widgetPending:
+            return
+
         w = self._graphModel.nodeData(self._nodeId, NodeRole.Widget)
         if w is not None:
             self._proxyWidget = QtWidgets.QGraphicsProxyWidget(self)
             self._proxyWidget.setWidget(w)
             self._proxyWidget.setPreferredWidth(5)
+            self._proxyWidget.setVisible(self.nodeScene().widgetsVisible())
             geometry.recomputeSize(self._nodeId)
 
             if (
@@ -297,7 +309,15 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
                 QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIgnoresParentOpacity
             )
 
-    def _setLockedState(self):
+    def updateEmbeddedWidget(self):
+        if self._widgetPending:
+            self._embedQWidget()
+
+    def setWidgetVisible(self, visible):
+        if self._proxyWidget is not None and self._proxyWidget.isVisible() != visible:
+            self._proxyWidget.setVisible(visible)
+
+    def updateLockedState(self):
         from SpatialNode.definitions import NodeFlag
 
         flags = self._graphModel.nodeFlags(self._nodeId)
@@ -20,6 +20,7 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
         self._graphModel: AbstractGraphModel = None
         self._nodeState: NodeState = None
         self._proxyWidget: QtWidgets.QGraphicsProxyWidget = None
+        self._widgetPending: bool = None
         ...
 
     @property
@@ -53,5 +54,20 @@ class NodeGraphicsObject(QtWidgets.QGraphicsObject):
     def mouseDoubleClickEvent(self, event): ...
     @override
     def contextMenuEvent(self, event): ...
+    def updateEmbeddedWidget(self) -> None:
+        """
+        Embeds the widget of a node shown before its delegate was
+        materialized, once it is. Does nothing for any other node, so it is
+        cheap on every `nodeUpdated`.
+        """
+        ...
+
+    def setWidgetVisible(self, visible: bool) -> None:
+        """Shows or hides the embedded widget, if the node has one."""
+        ...
+
+    def updateLockedState(self) -> None:
+        """Applies `NodeFlag.Locked` of the node to the item flags."""
+        ...
+
     def _embedQWidget(self) -> None: ...
-    def _setLockedState(self) -> None: ...
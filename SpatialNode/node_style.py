@@ -8,7 +8,12 @@ from typing import override
 from PySide6 import QtGui
 
 from SpatialNode.definitions import QJsonObject
-from SpatialNode.style import Style, json_read_color, json_read_float
+from SpatialNode.style import (
+    Style,
+    copy_attributes,
+    json_read_color,
+    json_read_float,
+)
 from SpatialNode.resources import qInitResources
 
 
@@ -36,10 +41,17 @@ class NodeStyle(Style):
 
     Opacity: float = 0
 
+    _defaultAttributes = None
+
     def __init__(self):
         super().__init__()
-        qInitResources()
-        self.loadJsonFile(":DefaultStyle.json")
+        # the resource is parsed once, later styles copy its values
+        if NodeStyle._defaultAttributes is None:
+            qInitResources()
+            self.loadJsonFile(":DefaultStyle.json")
+            NodeStyle._defaultAttributes = copy_attributes(vars(self))
+        else:
+            vars(self).update(copy_attributes(NodeStyle._defaultAttributes))
 
     def fromJsonText(self, jsonText: str):
         self.loadJsonText(jsonText)
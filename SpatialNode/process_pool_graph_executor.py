@@ -0,0 +1,120 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from PySide6 import QtCore
+
+_workerRegistry = None
+_workerDelegates = {}
+
+
+def _initWorker(registry):
+    global _workerRegistry
+    _workerRegistry = registry
+    _workerDelegates.clear()
+
+
+def _computeNode(nodeId, internalData, inputs):
+    from SpatialNode.definitions import PortType
+
+    # delegates are rebuilt from their saved state, and reused while it holds
+    cached = _workerDelegates.get(nodeId)
+    if cached is not None and cached[0] == internalData:
+        delegate = cached[1]
+    else:
+        internalDataJson = QtCore.QJsonDocument.fromJson(internalData).object()
+        delegate = _workerRegistry.create(internalDataJson["model-name"])
+        delegate.load(internalDataJson)
+        _workerDelegates[nodeId] = (internalData, delegate)
+
+    if inputs:
+        delegate.deliverInData(inputs)
+
+    return {
+        portIndex: delegate.outData(portIndex)
+        for portIndex in range(delegate.nPorts(PortType.Out))
+    }
+
+
+class ProcessPoolGraphExecutor:
+    def __init__(self, registry, maxWorkers=None):
+        self._registry = registry
+        self._pool = ProcessPoolExecutor(
+            max_workers=maxWorkers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initWorker,
+            initargs=(registry,),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.shutdown()
+
+    def shutdown(self):
+        self._pool.shutdown()
+
+    def run(self, model, applyToSinks=False):
+        from SpatialNode.definitions import PortType
+
+        nodeIds = model.allNodeIds()
+        inDegree = dict.fromkeys(nodeIds, 0)
+        inputs = {nodeId: {} for nodeId in nodeIds}
+        for nodeId in nodeIds:
+            for cId in model.allConnectionIds(nodeId):
+                if cId.inNodeId == nodeId:
+                    inDegree[nodeId] += 1
+
+        results = {}
+        running = {}
+
+        def submit(nodeId):
+            delegate = model.delegateModel(nodeId)
+            internalData = bytes(
+                QtCore.QJsonDocument(delegate.save()).toJson(
+                    QtCore.QJsonDocument.JsonFormat.Compact
+                )
+            )
+            # every port, so a reused worker delegate drops removed inputs
+            nodeInputs = {
+                portIndex: inputs[nodeId].get(portIndex)
+                for portIndex in range(delegate.nPorts(PortType.In))
+            }
+            future = self._pool.submit(_computeNode, nodeId, internalData, nodeInputs)
+            running[future] = nodeId
+
+        for nodeId in sorted(nodeIds):
+            if inDegree[nodeId] == 0:
+                submit(nodeId)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                nodeId = running.pop(future)
+                outputs = future.result()
+                results[nodeId] = outputs
+
+                for portIndex, data in outputs.items():
+                    for cn in model.connections(nodeId, PortType.Out, portIndex):
+                        inputs[cn.inNodeId][cn.inPortIndex] = data
+                        inDegree[cn.inNodeId] -= 1
+                        if inDegree[cn.inNodeId] == 0:
+                            submit(cn.inNodeId)
+
+        if len(results) < len(nodeIds):
+            raise RuntimeError("The graph contains a cycle")
+
+        if applyToSinks:
+            for nodeId in sorted(nodeIds):
+                if inputs[nodeId] and not any(
+                    cId.outNodeId == nodeId for cId in model.allConnectionIds(nodeId)
+                ):
+                    model.setInPortsData(nodeId, inputs[nodeId])
+
+        return results
@@ -0,0 +1,66 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from concurrent.futures import ProcessPoolExecutor
+
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import NodeId, PortIndex
+from SpatialNode.node_data import NodeData
+from SpatialNode.node_delegate_model import NodeDelegateModel
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+
+_workerRegistry: NodeDelegateModelRegistry | None
+_workerDelegates: dict[NodeId, tuple[bytes, NodeDelegateModel]]
+
+def _initWorker(registry: NodeDelegateModelRegistry) -> None: ...
+def _computeNode(
+    nodeId: NodeId, internalData: bytes, inputs: dict[PortIndex, NodeData | None]
+) -> dict[PortIndex, NodeData | None]:
+    """
+    Runs in a worker process: rebuilds the delegate from its saved JSON, sets
+    its inputs and returns its outputs. The delegate is reused while its saved
+    JSON does not change; `inputs` holds every In port, `None` for unconnected
+    ones, so no input survives from a previous run.
+    """
+    ...
+
+class ProcessPoolGraphExecutor:
+    """
+    Evaluates a whole `DataFlowGraphModel` on a pool of processes, for
+    CPU-bound delegates which would otherwise serialize on the GIL.
+
+    Nodes are dispatched as soon as all their upstream nodes are done, so
+    independent branches run in parallel. Workers rebuild each delegate
+    through `save()`/`load()` and the registry, which must therefore be
+    picklable: delegates are registered by module-level classes, and their
+    `NodeData` must be picklable as well. Per-node dispatch costs a round trip
+    to a worker, which only pays off for nodes doing real work.
+
+    ```python
+    with sNode.ProcessPoolGraphExecutor(registry) as executor:
+        results = executor.run(model)
+    ```
+    """
+
+    def __init__(
+        self, registry: NodeDelegateModelRegistry, maxWorkers: int | None = None
+    ):
+        self._registry: NodeDelegateModelRegistry = None
+        self._pool: ProcessPoolExecutor = None
+
+    def __enter__(self) -> "ProcessPoolGraphExecutor": ...
+    def __exit__(self, excType, excValue, traceback) -> None: ...
+    def shutdown(self) -> None: ...
+    def run(
+        self, model: DataFlowGraphModel, applyToSinks: bool = False
+    ) -> dict[NodeId, dict[PortIndex, NodeData | None]]:
+        """
+        Computes every node of `model` in the workers and returns their outputs.
+        With `applyToSinks`, nodes without outgoing connections (displays) get
+        their computed inputs in `model`, so they show the result. Raises
+        `RuntimeError` on cycles.
+        """
+        ...
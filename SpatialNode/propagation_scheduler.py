@@ -0,0 +1,73 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+
+class PropagationScheduler:
+    def __init__(self):
+        self._running = False
+        self._dirty = {}
+        self.waves = 0
+        self.computes = 0
+        self.savedComputes = 0
+
+    def resetStats(self):
+        self.waves = 0
+        self.computes = 0
+        self.savedComputes = 0
+
+    def isRunning(self):
+        return self._running
+
+    def propagate(self, model, nodeId, portIndex):
+        self._dirty.setdefault(nodeId, set()).add(portIndex)
+        if self._running:
+            return
+
+        self._running = True
+        try:
+            while self._dirty:
+                self._runWave(model)
+        finally:
+            self._running = False
+            self._dirty = {}
+
+    @staticmethod
+    def topologicalOrder(model, seeds):
+        reachable = set()
+        stack = list(seeds)
+        while stack:
+            nodeId = stack.pop()
+            if nodeId in reachable or not model.nodeExists(nodeId):
+                continue
+            reachable.add(nodeId)
+            for cId in model.allConnectionIds(nodeId):
+                if cId.outNodeId == nodeId:
+                    stack.append(cId.inNodeId)
+
+        return sorted(reachable, key=model.topologicalRank)
+
+    def _runWave(self, model):
+        from SpatialNode.definitions import PortType, PortRole
+
+        self.waves += 1
+        seeds = self._dirty
+        self._dirty = {}
+        pending = {}
+
+        for nodeId in self.topologicalOrder(model, seeds):
+            inputs = pending.pop(nodeId, None)
+            if inputs is not None:
+                self.computes += 1
+                model.setInPortsData(nodeId, inputs)
+
+            ports = seeds.pop(nodeId, set()) | self._dirty.pop(nodeId, set())
+            for portIndex in sorted(ports):
+                data = model.portData(nodeId, PortType.Out, portIndex, PortRole.Data)
+                for cn in model.connections(nodeId, PortType.Out, portIndex):
+                    inputs = pending.setdefault(cn.inNodeId, {})
+                    if inputs:
+                        self.savedComputes += 1
+                    inputs[cn.inPortIndex] = data
@@ -0,0 +1,63 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Iterable
+
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import NodeId, PortIndex
+
+class PropagationScheduler:
+    """
+    Glitch-free replacement for the depth-first data propagation of
+    `DataFlowGraphModel`.
+
+    When a node emits `dataUpdated`, the scheduler collects every node
+    downstream of it, orders them topologically and visits them once: all
+    inputs which changed in the wave are delivered together through
+    `DataFlowGraphModel.setInPortsData`, so a node never computes on a mix of
+    old and new inputs. Nodes on a feedback loop are visited once per wave.
+
+    ```python
+    model.setPropagationScheduler(sNode.PropagationScheduler())
+    ```
+    """
+
+    def __init__(self):
+        self._running: bool = None
+        self._dirty: dict[NodeId, set[PortIndex]] = None
+        self.waves: int = None
+        """Number of propagation waves run."""
+        self.computes: int = None
+        """Number of input deliveries, i.e. node updates, performed."""
+        self.savedComputes: int = None
+        """
+        Deliveries merged into an update already pending for the same node.
+        Each one is a `setInData` call, and usually a compute, that eager
+        propagation would have performed.
+        """
+
+    def resetStats(self) -> None: ...
+    def isRunning(self) -> bool: ...
+    def propagate(
+        self, model: DataFlowGraphModel, nodeId: NodeId, portIndex: PortIndex
+    ) -> None:
+        """
+        Called for every `dataUpdated` of a delegate. Inside a running wave the
+        port is only marked dirty and is read once when its node is visited.
+        """
+        ...
+
+    @staticmethod
+    def topologicalOrder(
+        model: DataFlowGraphModel, seeds: Iterable[NodeId]
+    ) -> list[NodeId]:
+        """
+        `seeds` and every node reachable from them, upstream nodes first, as
+        ranked by `DataFlowGraphModel.topologicalRank`.
+        """
+        ...
+
+    def _runWave(self, model: DataFlowGraphModel) -> None: ...
@@ -0,0 +1,217 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import json
+import struct
+import sys
+from array import array
+from itertools import accumulate
+
+from SpatialNode.definitions import ConnectionId
+
+MAGIC = b"SNBS"
+VERSION = 2
+
+# magic and version, then the node, connection and model type counts; every
+# column after it is made of 8 byte little-endian values, so all of them stay
+# aligned
+_PREFIX = struct.Struct("<4sI")
+_COUNTS = struct.Struct("<QQQ")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _column(buffer, offset, typecode, count):
+    end = offset + 8 * count
+    if end > len(buffer):
+        raise ValueError("Truncated binary scene")
+
+    view = buffer[offset:end]
+    if _LITTLE_ENDIAN:
+        return view.cast(typecode), end
+
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values, end
+
+
+def _jsonDefault(value):
+    # Qt JSON values stored by delegates in their internal data
+    toVariant = getattr(value, "toVariant", None)
+    if toVariant is None:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+    return toVariant()
+
+
+def _toBytes(values):
+    if not _LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class BinaryScene:
+    def __init__(self, buffer):
+        buffer = memoryview(buffer).cast("B")
+        if len(buffer) < _PREFIX.size:
+            raise ValueError("Truncated binary scene")
+
+        magic, version = _PREFIX.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Not a binary scene")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary scene version {version}")
+        if len(buffer) < _PREFIX.size + _COUNTS.size:
+            raise ValueError("Truncated binary scene")
+
+        nNodes, nConnections, nTypes = _COUNTS.unpack_from(buffer, _PREFIX.size)
+
+        offset = _PREFIX.size + _COUNTS.size
+        self.nodeIds, offset = _column(buffer, offset, "q", nNodes)
+        self.positions, offset = _column(buffer, offset, "d", 2 * nNodes)
+        self.connections, offset = _column(buffer, offset, "q", 4 * nConnections)
+        lengths, offset = _column(buffer, offset, "q", nNodes)
+        self.typeIndexes, offset = _column(buffer, offset, "q", nNodes)
+        typeLengths, offset = _column(buffer, offset, "q", nTypes)
+
+        # model type names, then the internal data of every node
+        typeOffsets = list(accumulate(typeLengths, initial=offset))
+        self._typeNames = [
+            bytes(buffer[start:end]).decode()
+            for start, end in zip(typeOffsets, typeOffsets[1:])
+        ]
+        self._blobOffsets = array("q", accumulate(lengths, initial=typeOffsets[-1]))
+        if self._blobOffsets[-1] > len(buffer):
+            raise ValueError("Truncated binary scene")
+        self._buffer = buffer
+
+    def nodeCount(self):
+        return len(self.nodeIds)
+
+    def connectionCount(self):
+        return len(self.connections) // 4
+
+    def position(self, index):
+        return self.positions[2 * index], self.positions[2 * index + 1]
+
+    def connectionId(self, index):
+        return ConnectionId(*self.connections[4 * index : 4 * index + 4])
+
+    def connectionIds(self):
+        connections = self.connections
+        for index in range(0, len(connections), 4):
+            yield ConnectionId(*connections[index : index + 4])
+
+    def modelName(self, index):
+        return self._typeNames[self.typeIndexes[index]]
+
+    def internalDataBytes(self, index):
+        return self._buffer[self._blobOffsets[index] : self._blobOffsets[index + 1]]
+
+    def internalData(self, index):
+        return json.loads(self.internalDataBytes(index).tobytes())
+
+    def release(self):
+        # lets an underlying mmap be closed
+        views = (
+            self.nodeIds,
+            self.positions,
+            self.connections,
+            self.typeIndexes,
+            self._buffer,
+        )
+        for view in views:
+            if isinstance(view, memoryview):
+                view.release()
+
+
+def encodeScene(nodeIds, positions, connectionIds, internalData):
+    nodeIds = array("q", nodeIds)
+    flatPositions = array("d")
+    for x, y in positions:
+        flatPositions.append(x)
+        flatPositions.append(y)
+    connections = array("q")
+    for cn in connectionIds:
+        connections.extend((cn.outNodeId, cn.outPortIndex, cn.inNodeId, cn.inPortIndex))
+    names = []
+    blobs = []
+    for data in internalData:
+        names.append(data["model-name"])
+        blobs.append(
+            json.dumps(data, separators=(",", ":"), default=_jsonDefault).encode()
+        )
+
+    if len(flatPositions) != 2 * len(nodeIds) or len(blobs) != len(nodeIds):
+        raise ValueError("Every node needs a position and internal data")
+
+    types = {}
+    typeIndexes = array("q", (types.setdefault(name, len(types)) for name in names))
+    typeNames = [name.encode() for name in types]
+
+    return b"".join(
+        [
+            _PREFIX.pack(MAGIC, VERSION),
+            _COUNTS.pack(len(nodeIds), len(connections) // 4, len(types)),
+            _toBytes(nodeIds),
+            _toBytes(flatPositions),
+            _toBytes(connections),
+            _toBytes(array("q", map(len, blobs))),
+            _toBytes(typeIndexes),
+            _toBytes(array("q", map(len, typeNames))),
+            *typeNames,
+            *blobs,
+        ]
+    )
+
+
+def isBinaryScene(data):
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def sceneJsonToBinary(sceneJson):
+    from SpatialNode.connection_id_utils import fromJson
+
+    nodes = sceneJson["nodes"]
+    return encodeScene(
+        [node["id"] for node in nodes],
+        [(node["position"]["x"], node["position"]["y"]) for node in nodes],
+        [fromJson(connection) for connection in sceneJson["connections"]],
+        [node["internal-data"] for node in nodes],
+    )
+
+
+def sceneBinaryToJson(data):
+    from SpatialNode.connection_id_utils import toJson
+
+    scene = BinaryScene(data)
+    nodes = []
+    for index, nodeId in enumerate(scene.nodeIds):
+        x, y = scene.position(index)
+        nodes.append(
+            {
+                "id": nodeId,
+                "internal-data": scene.internalData(index),
+                "position": {"x": x, "y": y},
+            }
+        )
+    connections = [toJson(cn) for cn in scene.connectionIds()]
+    scene.release()
+    return {"connections": connections, "nodes": nodes}
+
+
+def convertSceneFile(source, target):
+    with open(source, "rb") as file:
+        data = file.read()
+
+    if isBinaryScene(data):
+        converted = json.dumps(sceneBinaryToJson(data), indent=4).encode()
+    else:
+        converted = sceneJsonToBinary(json.loads(data))
+
+    with open(target, "wb") as file:
+        file.write(converted)
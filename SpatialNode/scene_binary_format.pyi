@@ -0,0 +1,78 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Compact binary container for scenes, next to the JSON of
+`DataFlowGraphModel.save`. After a little-endian header holding the magic
+`b"SNBS"`, the version and the node, connection and model type counts come
+columns of 8 byte little-endian values:
+
+- node ids, `int64[nodes]`
+- positions, `float64[2 * nodes]`, x and y interleaved
+- connections, `int64[4 * connections]`, `ConnectionId` fields in order
+- internal data lengths, `int64[nodes]`
+- model type of every node, `int64[nodes]`, an index into the type names
+- type name lengths, `int64[types]`
+
+followed by the UTF-8 type names, then the compact JSON of every node's
+internal data, in node order.
+"""
+
+from array import array
+from os import PathLike
+from typing import Any, Iterable, Iterator
+
+from SpatialNode.definitions import ConnectionId, NodeId, QJsonObject
+
+MAGIC: bytes
+VERSION: int
+
+class BinaryScene:
+    """
+    Read-only view of a binary scene. The columns are `memoryview`s cast over
+    the buffer, without a Python object per value (copies on big-endian
+    hosts).
+    """
+
+    def __init__(self, buffer: bytes | memoryview):
+        self.nodeIds: memoryview | array = None
+        self.positions: memoryview | array = None
+        self.connections: memoryview | array = None
+        self.typeIndexes: memoryview | array = None
+
+    def nodeCount(self) -> int: ...
+    def connectionCount(self) -> int: ...
+    def position(self, index: int) -> tuple[float, float]: ...
+    def connectionId(self, index: int) -> ConnectionId: ...
+    def connectionIds(self) -> Iterator[ConnectionId]: ...
+    def modelName(self, index: int) -> str:
+        """Registered model name of the node at `index`, without parsing JSON."""
+        ...
+
+    def internalDataBytes(self, index: int) -> memoryview:
+        """Undecoded JSON internal data of the node at `index`."""
+        ...
+
+    def internalData(self, index: int) -> QJsonObject: ...
+    def release(self) -> None:
+        """Releases the views on the buffer, e.g. before closing an `mmap`."""
+        ...
+
+def encodeScene(
+    nodeIds: Iterable[NodeId],
+    positions: Iterable[tuple[float, float]],
+    connectionIds: Iterable[ConnectionId],
+    internalData: Iterable[QJsonObject],
+) -> bytes: ...
+def isBinaryScene(data: bytes | memoryview) -> bool: ...
+def sceneJsonToBinary(sceneJson: dict[str, Any]) -> bytes:
+    """Converts a scene parsed from a JSON file with `json.load`."""
+    ...
+
+def sceneBinaryToJson(data: bytes | memoryview) -> dict[str, Any]: ...
+def convertSceneFile(source: str | PathLike, target: str | PathLike) -> None:
+    """Converts a scene file to the other format, detected from its content."""
+    ...
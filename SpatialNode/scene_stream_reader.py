@@ -0,0 +1,98 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class SceneStreamReader:
+    def __init__(self, stream, bufferSize=1 << 20):
+        self._stream = stream
+        self._bufferSize = bufferSize
+        self._textDecoder = codecs.getincrementaldecoder("utf-8")()
+        self._jsonDecoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._bytesRead = 0
+        self._eof = False
+
+    def bytesRead(self):
+        return self._bytesRead
+
+    def items(self):
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            self._expect(":")
+            if self._peek() == "[":
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield key, self._value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                yield key, self._value()
+
+            if self._expect(",}") == "}":
+                return
+
+    def _fill(self):
+        if self._eof:
+            return False
+
+        raw = self._stream.read(self._bufferSize)
+        self._bytesRead += len(raw)
+        self._eof = not raw
+        self._buffer = self._buffer[self._pos :] + self._textDecoder.decode(
+            raw, final=self._eof
+        )
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char is None or char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r} near byte {self._bytesRead}, got {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._jsonDecoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # the value continues in the next chunk
+                if self._fill():
+                    continue
+                raise
+
+            # so does a number ending the buffer
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._pos = end
+            return value
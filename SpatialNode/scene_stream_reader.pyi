@@ -0,0 +1,39 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from typing import Any, BinaryIO, Iterator
+
+class SceneStreamReader:
+    """
+    Incremental reader of scene files, which are one JSON object holding
+    arrays such as `"nodes"` and `"connections"`. Only `bufferSize` bytes
+    plus the current element are held in memory, whatever the file size.
+
+    ```python
+    with open("scene.json", "rb") as file:
+        for key, element in SceneStreamReader(file).items():
+            ...
+    ```
+    """
+
+    def __init__(self, stream: BinaryIO, bufferSize: int = 1 << 20): ...
+    def bytesRead(self) -> int:
+        """Bytes read from the stream so far, for progress reports."""
+        ...
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """
+        Yields `(key, element)` for every element of the top-level arrays, in
+        file order, and `(key, value)` for top-level values which are not
+        arrays. Raises `ValueError` or `json.JSONDecodeError` on malformed
+        input.
+        """
+        ...
+
+    def _fill(self) -> bool: ...
+    def _peek(self) -> str | None: ...
+    def _expect(self, chars: str) -> str: ...
+    def _value(self) -> Any: ...
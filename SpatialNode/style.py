@@ -10,9 +10,31 @@ from PySide6 import QtCore, QtGui
 
 
 class Style:
+    _frozen = False
+
     def __init__(self):
         return
 
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(
+                f"{type(self).__name__} is shared and frozen, edit a copy() of it"
+            )
+        super().__setattr__(name, value)
+
+    def freeze(self):
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    def isFrozen(self):
+        return self._frozen
+
+    def copy(self):
+        style = type(self).__new__(type(self))
+        attributes = {k: v for k, v in vars(self).items() if k != "_frozen"}
+        vars(style).update(copy_attributes(attributes))
+        return style
+
     @abstractmethod
     def loadJson(self, json): ...
 
@@ -35,6 +57,13 @@ class Style:
         self.loadJsonFromByteArray(file.readAll())
 
 
+def copy_attributes(attributes):
+    return {
+        name: QtGui.QColor(value) if isinstance(value, QtGui.QColor) else value
+        for name, value in attributes.items()
+    }
+
+
 def json_read_color(obj, key, default):
     valueRef = obj.get(key, default)
     if isinstance(valueRef, str):
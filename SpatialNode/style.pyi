@@ -1,11 +1,31 @@
 from abc import abstractmethod
+from typing import Any, Self
 
 from PySide6 import QtCore, QtGui
 
 from SpatialNode.definitions import QJsonObject
 
 class Style:
+    """
+    Styles shared between nodes, `StyleCollection.nodeStyle()` and the
+    resolved ones, are frozen: setting any of their attributes raises
+    `AttributeError`. Edit a `copy()` and assign it instead;
+    `StyleCollection.setNodeStyle` freezes a copy and leaves the given style
+    editable. Colors are `QColor`s, so replace them rather than changing them
+    in place.
+    """
+
     def __init__(self): ...
+    def __setattr__(self, name: str, value: Any) -> None: ...
+    def freeze(self) -> Self:
+        """Makes the style read-only, for good, and returns it."""
+        ...
+
+    def isFrozen(self) -> bool: ...
+    def copy(self) -> Self:
+        """An editable copy, with colors of its own."""
+        ...
+
     @abstractmethod
     def loadJson(self, json: QJsonObject): ...
     @abstractmethod
@@ -14,6 +34,10 @@ class Style:
     def loadJsonText(self, jsonText: str) -> None: ...
     def loadJsonFile(self, fileName: str) -> None: ...
 
+def copy_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    """`attributes` with every `QColor` copied."""
+    ...
+
 def json_read_color(
     obj: QJsonObject, key: str, default: QtGui.QColor
 ) -> QtGui.QColor: ...
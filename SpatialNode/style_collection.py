@@ -4,6 +4,8 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
+import json
+
 from SpatialNode.connection_style import ConnectionStyle
 from SpatialNode.graphics_view_style import GraphicsViewStyle
 from SpatialNode.node_style import NodeStyle
@@ -14,14 +16,32 @@ collection = None
 
 class StyleCollection:
     def __init__(self):
-        self._nodeStyle = NodeStyle()
+        self._nodeStyle = NodeStyle().freeze()
         self._connectionStyle = ConnectionStyle()
         self._flowViewStyle = GraphicsViewStyle()
+        self._nodeStyleVersion = 0
+        # resolved node styles, interned by their json; shared and frozen
+        self._resolvedNodeStyles = {}
 
     @staticmethod
     def nodeStyle() -> NodeStyle:
         return StyleCollection._instance()._nodeStyle
 
+    @staticmethod
+    def nodeStyleVersion() -> int:
+        return StyleCollection._instance()._nodeStyleVersion
+
+    @staticmethod
+    def resolveNodeStyle(styleJson) -> NodeStyle:
+        instance = StyleCollection._instance()
+        key = json.dumps(styleJson, sort_keys=True)
+        style = instance._resolvedNodeStyles.get(key)
+        if style is None:
+            style = NodeStyle()
+            style.fromJsonObject(styleJson)
+            instance._resolvedNodeStyles[key] = style.freeze()
+        return style
+
     @staticmethod
     def connectionStyle() -> ConnectionStyle:
         return StyleCollection._instance()._connectionStyle
@@ -32,7 +52,10 @@ class StyleCollection:
 
     @staticmethod
     def setNodeStyle(style: NodeStyle):
-        StyleCollection._instance()._nodeStyle = style
+        instance = StyleCollection._instance()
+        instance._nodeStyle = style.copy().freeze()
+        instance._nodeStyleVersion += 1
+        instance._resolvedNodeStyles.clear()
 
     @staticmethod
     def setConnectionStyle(style: ConnectionStyle):
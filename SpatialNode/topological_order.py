@@ -0,0 +1,134 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+
+class TopologicalOrder:
+    def __init__(self):
+        self._rank = {}
+        self._nextRank = 0
+        self._successors = {}
+        self._predecessors = {}
+        self._feedbackEdges = {}
+        self._order = None
+
+    def addNode(self, nodeId):
+        self._rank[nodeId] = self._nextRank
+        self._nextRank += 1
+        self._successors[nodeId] = {}
+        self._predecessors[nodeId] = {}
+        self._order = None
+
+    def removeNode(self, nodeId):
+        for successor in self._successors.pop(nodeId):
+            del self._predecessors[successor][nodeId]
+        for predecessor in self._predecessors.pop(nodeId):
+            del self._successors[predecessor][nodeId]
+        for edge in [e for e in self._feedbackEdges if nodeId in e]:
+            del self._feedbackEdges[edge]
+        del self._rank[nodeId]
+        self._order = None
+
+    def addEdge(self, outNodeId, inNodeId):
+        if not self._insert(outNodeId, inNodeId):
+            edge = (outNodeId, inNodeId)
+            self._feedbackEdges[edge] = self._feedbackEdges.get(edge, 0) + 1
+            return False
+        return True
+
+    def removeEdge(self, outNodeId, inNodeId):
+        edge = (outNodeId, inNodeId)
+        count = self._feedbackEdges.get(edge)
+        if count is not None:
+            if count == 1:
+                del self._feedbackEdges[edge]
+            else:
+                self._feedbackEdges[edge] = count - 1
+            return
+
+        successors = self._successors[outNodeId]
+        if successors[inNodeId] == 1:
+            del successors[inNodeId]
+            del self._predecessors[inNodeId][outNodeId]
+        else:
+            successors[inNodeId] -= 1
+            self._predecessors[inNodeId][outNodeId] -= 1
+
+        # a removed edge may have broken the cycle a feedback edge closed
+        for edge, count in list(self._feedbackEdges.items()):
+            if self._insert(*edge):
+                del self._feedbackEdges[edge]
+                for _ in range(count - 1):
+                    self._insert(*edge)
+
+    def hasCycles(self):
+        return len(self._feedbackEdges) > 0
+
+    def rank(self, nodeId):
+        return self._rank[nodeId]
+
+    def order(self):
+        if self._order is None:
+            self._order = sorted(self._rank, key=self._rank.__getitem__)
+        return self._order
+
+    def wouldCreateCycle(self, outNodeId, inNodeId):
+        if outNodeId == inNodeId:
+            return True
+        upper = self._rank[outNodeId]
+        if upper < self._rank[inNodeId]:
+            return False
+        return self._forward(inNodeId, upper) is None
+
+    def _insert(self, outNodeId, inNodeId):
+        if outNodeId == inNodeId:
+            return False
+
+        lower = self._rank[inNodeId]
+        upper = self._rank[outNodeId]
+        if upper > lower:
+            forward = self._forward(inNodeId, upper)
+            if forward is None:
+                return False
+            backward = self._backward(outNodeId, lower)
+            self._reorder(backward, forward)
+
+        successors = self._successors[outNodeId]
+        successors[inNodeId] = successors.get(inNodeId, 0) + 1
+        predecessors = self._predecessors[inNodeId]
+        predecessors[outNodeId] = predecessors.get(outNodeId, 0) + 1
+        return True
+
+    def _forward(self, start, upper):
+        # nodes reachable from `start` ranked below `upper`, None on reaching it
+        visited = {start}
+        stack = [start]
+        while stack:
+            for successor in self._successors[stack.pop()]:
+                rank = self._rank[successor]
+                if rank == upper:
+                    return None
+                if rank < upper and successor not in visited:
+                    visited.add(successor)
+                    stack.append(successor)
+        return visited
+
+    def _backward(self, start, lower):
+        visited = {start}
+        stack = [start]
+        while stack:
+            for predecessor in self._predecessors[stack.pop()]:
+                if self._rank[predecessor] > lower and predecessor not in visited:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+        return visited
+
+    def _reorder(self, backward, forward):
+        rankOf = self._rank.__getitem__
+        nodes = sorted(backward, key=rankOf) + sorted(forward, key=rankOf)
+        ranks = sorted(map(rankOf, nodes))
+        for nodeId, rank in zip(nodes, ranks):
+            self._rank[nodeId] = rank
+        self._order = None
@@ -0,0 +1,63 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.definitions import NodeId
+
+class TopologicalOrder:
+    """
+    Topological order of a graph maintained incrementally (Pearce-Kelly).
+
+    Every node holds a rank, upstream nodes rank lower. Inserting an edge
+    which already agrees with the ranks costs O(1); otherwise only the nodes
+    ranked between its two ends and connected to them are visited and
+    re-ranked among themselves. Removing an edge never invalidates the order.
+
+    Edges closing a cycle are kept aside as feedback edges and ignored by the
+    order until a removal makes them insertable again.
+    """
+
+    def __init__(self):
+        self._rank: dict[NodeId, int] = None
+        self._nextRank: int = None
+        self._successors: dict[NodeId, dict[NodeId, int]] = None
+        """Edge multiplicities, feedback edges excluded."""
+        self._predecessors: dict[NodeId, dict[NodeId, int]] = None
+        self._feedbackEdges: dict[tuple[NodeId, NodeId], int] = None
+        self._order: list[NodeId] | None = None
+
+    def addNode(self, nodeId: NodeId) -> None:
+        """New nodes are ranked last."""
+        ...
+
+    def removeNode(self, nodeId: NodeId) -> None: ...
+    def addEdge(self, outNodeId: NodeId, inNodeId: NodeId) -> bool:
+        """Returns `False` if the edge closes a cycle and became a feedback edge."""
+        ...
+
+    def removeEdge(self, outNodeId: NodeId, inNodeId: NodeId) -> None: ...
+    def hasCycles(self) -> bool: ...
+    def rank(self, nodeId: NodeId) -> int:
+        """
+        Position key of the node: ranks are unique and increase along edges,
+        but are not contiguous.
+        """
+        ...
+
+    def order(self) -> list[NodeId]:
+        """All nodes, upstream first. Cached until the ranks change."""
+        ...
+
+    def wouldCreateCycle(self, outNodeId: NodeId, inNodeId: NodeId) -> bool:
+        """
+        O(1) when the edge agrees with the current order, otherwise searches
+        only the nodes ranked between its ends.
+        """
+        ...
+
+    def _insert(self, outNodeId: NodeId, inNodeId: NodeId) -> bool: ...
+    def _forward(self, start: NodeId, upper: int) -> set[NodeId] | None: ...
+    def _backward(self, start: NodeId, lower: int) -> set[NodeId]: ...
+    def _reorder(self, backward: set[NodeId], forward: set[NodeId]) -> None: ...
@@ -13,7 +13,6 @@ from SpatialNode.definitions import QJsonObject, NodeId, ConnectionId, NodeRole
 
 
 def serializeSelectedItems(scene):
-    from SpatialNode.connection_graphics_object import ConnectionGraphicsObject
     from SpatialNode.node_graphics_object import NodeGraphicsObject
 
     serializedScene = QJsonObject()
@@ -31,10 +30,11 @@ def serializeSelectedItems(scene):
 
     connJsonArray = QtCore.QJsonArray()
 
-    for item in scene.selectedItems():
-        if isinstance(item, ConnectionGraphicsObject):
-            cid = item.connectionId
-            if cid.outNodeId in selectedNodes and cid.inNodeId in selectedNodes:
+    # taken from the model: connections drawn by the connection layer have no
+    # item to select
+    for nodeId in selectedNodes:
+        for cid in graphModel.allConnectionIds(nodeId):
+            if cid.outNodeId == nodeId and cid.inNodeId in selectedNodes:
                 connJsonArray.append(toJson(cid))
 
     serializedScene["nodes"] = nodesJsonArray
@@ -67,7 +67,7 @@ def insertSerializedItems(json, scene):
             # Restore the connection
             graphModel.addConnection(connId)
 
-            scene.connectionGraphicsObject(connId).setSelected(True)
+            scene.promoteConnection(connId).setSelected(True)
 
 
 def deleteSerializedItems(sceneJson, graphModel):
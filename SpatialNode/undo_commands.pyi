@@ -12,7 +12,13 @@ from SpatialNode.abstract_graph_model import AbstractGraphModel
 from SpatialNode.basic_graphics_scene import BasicGraphicsScene
 from SpatialNode.definitions import NodeId, ConnectionId, QJsonObject
 
-def serializeSelectedItems(scene: BasicGraphicsScene) -> QJsonObject: ...
+def serializeSelectedItems(scene: BasicGraphicsScene) -> QJsonObject:
+    """
+    Selected nodes and every connection of the model between two of them,
+    whether or not it is selected or has a `ConnectionGraphicsObject`.
+    """
+    ...
+
 def insertSerializedItems(json: QJsonObject, scene: BasicGraphicsScene) -> None: ...
 def deleteSerializedItems(
     sceneJson: QJsonObject, graphModel: AbstractGraphModel
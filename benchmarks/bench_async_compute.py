@@ -0,0 +1,79 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Time the GUI thread is blocked when one source feeds `n` slow nodes, with a
+synchronous delegate and with `AsyncNodeDelegateModel`. The slow work sleeps,
+standing in for native image processing which releases the GIL.
+
+    python -m benchmarks.bench_async_compute
+"""
+
+import time
+
+from PySide6 import QtCore
+
+import SpatialNode as sNode
+from benchmarks.common import PassThroughModel, ValueData, report
+
+WORK = 0.05
+
+
+class SlowModel(PassThroughModel):
+    def setInData(self, nodeData, portIndex):
+        time.sleep(WORK)
+        super().setInData(nodeData, portIndex)
+
+
+class SlowAsyncModel(sNode.AsyncNodeDelegateModel):
+    def nPorts(self, portType):
+        return 1
+
+    def dataType(self, portType, portIndex):
+        return ValueData().type()
+
+    def compute(self, inputs):
+        time.sleep(WORK)
+        return {0: inputs[0]}
+
+    def embeddedWidget(self):
+        return None
+
+
+def run(n, modelType):
+    registry = sNode.NodeDelegateModelRegistry()
+    registry.registerModel(PassThroughModel, "Source")
+    registry.registerModel(modelType, "Slow")
+    model = sNode.DataFlowGraphModel(registry)
+
+    source = model.addNode("Source")
+    for _ in range(n):
+        model.addConnection(sNode.ConnectionId(source, 0, model.addNode("Slow"), 0))
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    QtCore.QCoreApplication.processEvents()
+
+    start = time.perf_counter()
+    model.delegateModel(source).setInData(ValueData(1.0), 0)
+    blocked = time.perf_counter() - start
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    QtCore.QCoreApplication.processEvents()
+    return blocked, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    app = QtCore.QCoreApplication()
+
+    rows = []
+    for n in [1, 4, 16]:
+        syncBlocked, syncTotal = run(n, SlowModel)
+        asyncBlocked, asyncTotal = run(n, SlowAsyncModel)
+        rows.append((n, syncBlocked, asyncBlocked, syncTotal, asyncTotal))
+
+    report(
+        f"one update fanned out to n nodes of {WORK * 1000:.0f} ms",
+        ["n", "sync GUI [s]", "async GUI [s]", "sync total [s]", "async total [s]"],
+        rows,
+    )
@@ -0,0 +1,93 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Throughput of the calculator chain from `bench_execution_plan` over a batch
+of inputs: `ExecutionPlan.run` once per row, `ExecutionPlan.runBatch` with
+the per-row fallback, and `runBatch` with the NumPy `computeBatch` of the
+operator models.
+
+    python -m benchmarks.bench_batch_evaluation
+"""
+
+import time
+
+import numpy
+
+import SpatialNode as sNode
+from benchmarks.bench_execution_plan import buildChain
+from benchmarks.common import report
+from examples.calculator.addition_model import AdditionModel
+from examples.calculator.decimal_data import DecimalData
+
+
+class RowAdditionModel(AdditionModel):
+    def computeBatch(self, inputs):
+        return NotImplemented
+
+
+def lastAddition(model, display):
+    (connection,) = model.connections(display, sNode.PortType.In, 0)
+    return connection.outNodeId
+
+
+def withRowAdditions(model):
+    for nodeId in model.allNodeIds():
+        if isinstance(model.delegateModel(nodeId), AdditionModel):
+            model._models[nodeId] = RowAdditionModel()
+    return model
+
+
+def perRow(model, source, output, values):
+    plan = model.compile(outputs=[output], inputs=[(source, 0)])
+    start = time.perf_counter()
+    results = [plan.run({(source, 0): DecimalData(x)})[(output, 0)] for x in values]
+    elapsed = time.perf_counter() - start
+    return elapsed, [row.number() for row in results]
+
+
+def batch(model, source, output, values):
+    plan = model.compile(outputs=[output], inputs=[(source, 0)])
+    start = time.perf_counter()
+    column = sNode.BatchColumn(values, DecimalData)
+    result = plan.runBatch({(source, 0): column})[(output, 0)]
+    elapsed = time.perf_counter() - start
+    return elapsed, [row.number() for row in result.rows()]
+
+
+if __name__ == "__main__":
+    rows = []
+    for length, nRows in [(10, 10_000), (10, 100_000), (50, 20_000)]:
+        values = numpy.arange(nRows, dtype=float)
+
+        model, source, display = buildChain(length)
+        output = lastAddition(model, display)
+        single, expected = perRow(model, source, output, values)
+        model, source, display = buildChain(length)
+        fallback, results = batch(
+            withRowAdditions(model), source, lastAddition(model, display), values
+        )
+        assert results == expected
+        model, source, display = buildChain(length)
+        vectorized, results = batch(model, source, lastAddition(model, display), values)
+        assert results == expected
+
+        rows.append(
+            (
+                length,
+                nRows,
+                nRows / single,
+                nRows / fallback,
+                nRows / vectorized,
+                single / vectorized,
+            )
+        )
+
+    report(
+        "rows/sec over a batch of source values",
+        ["additions", "rows", "run per row", "row fallback", "vectorized", "speedup"],
+        rows,
+    )
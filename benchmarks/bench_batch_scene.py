@@ -0,0 +1,86 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Scripted construction of a graph attached to a scene, with and without
+`AbstractGraphModel.batch()`.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_batch_scene
+"""
+
+import subprocess
+import sys
+import time
+
+from PySide6 import QtCore, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.common import makeRegistry, report
+
+
+def buildGrid(model, nNodes, columns=50):
+    nodeIds = []
+    for i in range(nNodes):
+        nodeId = model.addNode("PassThrough")
+        model.setNodeData(
+            nodeId,
+            sNode.NodeRole.Position,
+            QtCore.QPointF(200 * (i % columns), 120 * (i // columns)),
+        )
+        nodeIds.append(nodeId)
+
+    # edges towards the next node in the row and the next row
+    for i, nodeId in enumerate(nodeIds):
+        if (i + 1) % columns and i + 1 < nNodes:
+            model.addConnection(sNode.ConnectionId(nodeId, 0, nodeIds[i + 1], 0))
+        if i + columns < nNodes:
+            model.addConnection(sNode.ConnectionId(nodeId, 1, nodeIds[i + columns], 1))
+
+
+def timeBuild(nNodes, batched):
+    model = sNode.DataFlowGraphModel(makeRegistry())
+    scene = sNode.DataFlowGraphicsScene(model)
+
+    start = time.perf_counter()
+    if batched:
+        with model.batch():
+            buildGrid(model, nNodes)
+    else:
+        buildGrid(model, nNodes)
+    return time.perf_counter() - start
+
+
+def timeBuildIsolated(nNodes, batched):
+    # scenes left alive by earlier runs slow down signal connections, so every
+    # measurement gets a fresh interpreter
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_batch_scene", str(nNodes)]
+        + (["batched"] if batched else []),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(out.split()[-1])
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication()
+
+    if len(sys.argv) > 1:
+        print(timeBuild(int(sys.argv[1]), batched="batched" in sys.argv[2:]))
+        sys.exit(0)
+
+    rows = []
+    for nNodes in [250, 500, 1000, 2000]:
+        signals = timeBuildIsolated(nNodes, batched=False)
+        batched = timeBuildIsolated(nNodes, batched=True)
+        rows.append((nNodes, signals, batched, signals / batched))
+
+    report(
+        "scene population from a script",
+        ["nodes", "signals [s]", "batch [s]", "speedup"],
+        rows,
+    )
@@ -0,0 +1,92 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Binary scene format against JSON on the calculator chain of
+`bench_execution_plan`: file size, save time, decoding of the file alone,
+and a full model load, which is dominated by creating the delegates.
+
+    python -m benchmarks.bench_binary_scene
+"""
+
+import json
+import time
+
+from PySide6 import QtCore
+
+import SpatialNode as sNode
+from benchmarks.bench_execution_plan import buildChain
+from benchmarks.bench_scene_loading import emptyModel
+from benchmarks.common import report
+from SpatialNode.scene_binary_format import BinaryScene
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def decodeBinary(data):
+    # the columns are views; only the internal data becomes Python objects
+    scene = BinaryScene(data)
+    internalData = [scene.internalData(index) for index in range(scene.nodeCount())]
+    scene.release()
+    return internalData
+
+
+if __name__ == "__main__":
+    rows = []
+    for length in [1_000, 10_000]:
+        model, _, _ = buildChain(length)
+        jsonSave, jsonData = timed(
+            lambda: QtCore.QJsonDocument(model.save()).toJson().data()
+        )
+        binarySave, binaryData = timed(model.saveBinary)
+
+        jsonDecode, _ = timed(lambda: json.loads(jsonData))
+        binaryDecode, _ = timed(lambda: decodeBinary(binaryData))
+
+        # the scheduler keeps the per-connection propagation of `load` iterative
+        loaded = emptyModel()
+        loaded.setPropagationScheduler(sNode.PropagationScheduler())
+        jsonLoad, _ = timed(
+            lambda: loaded.load(QtCore.QJsonDocument.fromJson(jsonData).object())
+        )
+        expected = loaded.save()
+        loaded = emptyModel()
+        binaryLoad, _ = timed(lambda: loaded.loadBinary(binaryData))
+        assert loaded.save() == expected
+
+        rows.append(
+            (
+                len(list(model.allNodeIds())),
+                len(jsonData) / 2**10,
+                len(binaryData) / 2**10,
+                jsonSave * 1e3,
+                binarySave * 1e3,
+                jsonDecode * 1e3,
+                binaryDecode * 1e3,
+                jsonLoad,
+                binaryLoad,
+            )
+        )
+
+    report(
+        "JSON against binary scenes",
+        [
+            "nodes",
+            "json [KB]",
+            "binary [KB]",
+            "json save [ms]",
+            "binary save [ms]",
+            "json decode [ms]",
+            "binary decode [ms]",
+            "json load [s]",
+            "binary load [s]",
+        ],
+        rows,
+    )
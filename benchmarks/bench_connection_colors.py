@@ -0,0 +1,82 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Paint of 2000 connections between ports of different data types, with the
+data defined colors of the connection_colors example.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_connection_colors
+"""
+
+import time
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.common import report
+from examples.connection_colors.connection_colors import (
+    registerDataModels,
+    setStyle,
+)
+
+
+def buildChain(model, nEdges, columns=50):
+    nodeIds = []
+    for i in range(nEdges + 1):
+        nodeId = model.addNode("NaiveDataModel")
+        model.setNodeData(
+            nodeId,
+            sNode.NodeRole.Position,
+            QtCore.QPointF(250 * (i % columns), 150 * (i // columns)),
+        )
+        nodeIds.append(nodeId)
+
+    # "MyNodeData" out of each node into the "SimpleData" port of the next
+    for source, sink in zip(nodeIds, nodeIds[1:]):
+        model.addConnection(sNode.ConnectionId(source, 0, sink, 1))
+
+
+if __name__ == "__main__":
+    from SpatialNode.connection_painter import ConnectionPainter
+
+    app = QtWidgets.QApplication()
+    setStyle()
+
+    model = sNode.DataFlowGraphModel(registerDataModels())
+    scene = sNode.DataFlowGraphicsScene(model)
+    with model.batch():
+        buildChain(model, 2000)
+    connections = [
+        item
+        for item in scene.items()
+        if isinstance(item, sNode.ConnectionGraphicsObject)
+    ]
+
+    image = QtGui.QImage(512, 512, QtGui.QImage.Format.Format_ARGB32)
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    rows = []
+    for selected in [False, True]:
+        for connection in connections:
+            connection.setSelected(selected)
+
+        frames = 3
+        start = time.perf_counter()
+        for _ in range(frames):
+            for connection in connections:
+                painter.save()
+                painter.translate(-connection.outSlot())
+                ConnectionPainter.paint(painter, connection)
+                painter.restore()
+        frame = (time.perf_counter() - start) / frames
+        rows.append((len(connections), selected, frame, frame / len(connections) * 1e6))
+    painter.end()
+
+    report(
+        "mixed type connections",
+        ["edges", "selected", "frame [s]", "per edge [us]"],
+        rows,
+    )
@@ -0,0 +1,104 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Memory and connection-drag cost of `ConnectionId`.
+
+"legacy" reproduces the former mutable class, whose drag path copied the id
+with `copy.deepcopy` before patching one side.
+
+    python -m benchmarks.bench_connection_id
+"""
+
+import copy
+import tracemalloc
+
+import SpatialNode as sNode
+from benchmarks.common import measure, report
+
+
+class LegacyConnectionId:
+    def __init__(self, outNodeId, outPortIndex, inNodeId, inPortIndex):
+        self.outNodeId = outNodeId
+        self.outPortIndex = outPortIndex
+        self.inNodeId = inNodeId
+        self.inPortIndex = inPortIndex
+
+
+def legacyExists(connectivity, cid):
+    # identity hashing meant an equal id could only be found by a scan
+    for c in connectivity:
+        if (
+            c.outNodeId == cid.outNodeId
+            and c.outPortIndex == cid.outPortIndex
+            and c.inNodeId == cid.inNodeId
+            and c.inPortIndex == cid.inPortIndex
+        ):
+            return True
+    return False
+
+
+def legacyMakeComplete(incompleteConnectionId, nodeId, portIndex):
+    newConnectionId = copy.deepcopy(incompleteConnectionId)
+    newConnectionId.inNodeId = nodeId
+    newConnectionId.inPortIndex = portIndex
+    return newConnectionId
+
+
+def allocatedBytes(factory, n):
+    # node ids are allocated up front so only the id objects are traced
+    nodeIds = list(range(n + 1))
+    tracemalloc.start()
+    ids = [factory(nodeIds[i], 0, nodeIds[i + 1], 0) for i in range(n)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ids
+    return size / n
+
+
+def dragCompletion(makeComplete):
+    return measure(lambda: [makeComplete(i) for i in range(10000)]) / 10000 * 1e6
+
+
+def existsLookup(factory, exists, n):
+    connectivity = {factory(i, 0, i + 1, 0) for i in range(n)}
+    probes = [factory(i, 0, i + 1, 0) for i in range(0, n, n // 100)]
+    return (
+        measure(lambda: [exists(connectivity, p) for p in probes], repeat=1)
+        / len(probes)
+        * 1e6
+    )
+
+
+if __name__ == "__main__":
+    n = 20000
+    rows = [
+        (
+            "legacy",
+            allocatedBytes(LegacyConnectionId, n),
+            dragCompletion(
+                lambda i: legacyMakeComplete(
+                    LegacyConnectionId(1, 0, sNode.InvalidNodeId, 0), i, 0
+                )
+            ),
+            existsLookup(LegacyConnectionId, legacyExists, n),
+        ),
+        (
+            "slots",
+            allocatedBytes(sNode.ConnectionId, n),
+            dragCompletion(
+                lambda i: sNode.makeCompleteConnectionId(
+                    sNode.makeIncompleteConnectionId(1, sNode.PortType.Out, 0), i, 0
+                )
+            ),
+            existsLookup(sNode.ConnectionId, lambda c, p: p in c, n),
+        ),
+    ]
+    report(
+        f"ConnectionId memory, drag completion and lookup among {n} ids",
+        ["variant", "bytes / id", "complete [us]", "exists [us]"],
+        rows,
+    )
@@ -0,0 +1,105 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Dense grid graphs with a ConnectionGraphicsObject per edge and with the
+connection layer: time and memory to build the graph and its scene, a full
+repaint, a pick on an edge and a node move. Each case runs in a fresh interpreter, so
+that the resident memory of one does not hide the next.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_connection_layer
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.bench_batch_scene import buildGrid, makeRegistry
+from benchmarks.bench_port_descriptors import paint
+from benchmarks.common import report
+
+
+def residentMegabytes():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def run(nEdges, layer):
+    app = QtWidgets.QApplication()
+    memory = residentMegabytes()
+    model = sNode.DataFlowGraphModel(makeRegistry())
+    scene = sNode.DataFlowGraphicsScene(model)
+    scene.connectionLayerEnabled = layer
+
+    start = time.perf_counter()
+    with model.batch():
+        buildGrid(model, nEdges // 2, columns=200)
+    build = time.perf_counter() - start
+    QtCore.QCoreApplication.processEvents()
+    memory = residentMegabytes() - memory
+
+    image = QtGui.QImage(1024, 768, QtGui.QImage.Format.Format_ARGB32)
+    paint(scene, image)
+    start = time.perf_counter()
+    paint(scene, image)
+    frame = time.perf_counter() - start
+
+    connectionId = next(iter(model.allConnectionIds(0)))
+    cgo = scene.connectionGraphicsObject(connectionId)
+    if cgo is not None:
+        point = cgo.path().pointAtPercent(0.5)
+    else:
+        point = (
+            scene.connectionLayer._connections[connectionId].path().pointAtPercent(0.5)
+        )
+    start = time.perf_counter()
+    for _ in range(20):
+        scene.items(point)
+    pick = (time.perf_counter() - start) / 20 * 1e3
+
+    node = scene.nodeGraphicsObject(0)
+    start = time.perf_counter()
+    for _ in range(20):
+        node.setPos(node.pos() + QtCore.QPointF(1.0, 0.0))
+    move = (time.perf_counter() - start) / 20 * 1e3
+
+    print(build, memory, frame, pick, move)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]), sys.argv[2] == "layer")
+        sys.exit()
+
+    rows = []
+    for nEdges in [10000, 50000]:
+        for layer in ["items", "layer"]:
+            result = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_connection_layer"]
+                + [str(nEdges), layer],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            rows.append((nEdges, layer, *map(float, result.stdout.split())))
+
+    report(
+        "dense graphs",
+        [
+            "edges",
+            "connections",
+            "build [s]",
+            "memory [MB]",
+            "frame [s]",
+            "pick [ms]",
+            "move [ms]",
+        ],
+        rows,
+    )
@@ -0,0 +1,96 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Connection geometry on a bundle of edges fanning out of one port: the first
+and the following shape queries, the bounding rect and the paint of a
+connection, a hover query over the bundle, and a move of the node all of
+them start from.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_connection_path
+"""
+
+import time
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.common import makeRegistry, report
+
+
+def buildBundle(model, nEdges):
+    source = model.addNode("PassThrough")
+    for i in range(nEdges):
+        sink = model.addNode("PassThrough")
+        model.setNodeData(sink, sNode.NodeRole.Position, QtCore.QPointF(600, 60 * i))
+        model.addConnection(sNode.ConnectionId(source, 0, sink, 0))
+    return source
+
+
+def timeEach(action, items, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            action(item)
+    return (time.perf_counter() - start) / (repeat * len(items)) * 1e6
+
+
+if __name__ == "__main__":
+    from SpatialNode.connection_painter import ConnectionPainter
+
+    app = QtWidgets.QApplication()
+
+    rows = []
+    for nEdges in [100, 500]:
+        model = sNode.DataFlowGraphModel(makeRegistry())
+        scene = sNode.DataFlowGraphicsScene(model)
+        source = buildBundle(model, nEdges)
+        QtCore.QCoreApplication.processEvents()
+        connections = [
+            scene.connectionGraphicsObject(connectionId)
+            for connectionId in model.allConnectionIds(source)
+        ]
+
+        firstShape = timeEach(lambda item: item.shape(), connections, repeat=1)
+        shape = timeEach(lambda item: item.shape(), connections)
+        bounds = timeEach(lambda item: item.boundingRect(), connections)
+
+        image = QtGui.QImage(256, 256, QtGui.QImage.Format.Format_ARGB32)
+        painter = QtGui.QPainter(image)
+        paint = timeEach(
+            lambda item: ConnectionPainter.paint(painter, item), connections
+        )
+        painter.end()
+
+        # just right of the port all the edges leave from
+        point = connections[0].mapToScene(connections[0].outSlot()) + QtCore.QPointF(
+            20.0, 0.0
+        )
+        hover = timeEach(lambda point: scene.items(point), [point]) / 1e3
+
+        node = scene.nodeGraphicsObject(source)
+        move = (
+            timeEach(
+                lambda node: node.setPos(node.pos() + QtCore.QPointF(1.0, 0.0)), [node]
+            )
+            / 1e3
+        )
+
+        rows.append((nEdges, firstShape, shape, bounds, paint, hover, move))
+
+    report(
+        "connection bundle",
+        [
+            "edges",
+            "first shape [us]",
+            "shape [us]",
+            "bounds [us]",
+            "paint [us]",
+            "hover [ms]",
+            "move [ms]",
+        ],
+        rows,
+    )
@@ -0,0 +1,71 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Scaling of port connection lookups in `DataFlowGraphModel`.
+
+"scan" reproduces the former implementation that walked the whole
+`_connectivity` set per query, "index" is the adjacency index.
+
+    python -m benchmarks.bench_connectivity_index
+"""
+
+import SpatialNode as sNode
+from benchmarks.common import makeRandomGraph, measure, report, PassThroughModel
+
+
+def scanConnections(model, nodeId, portType, portIndex):
+    result = set()
+    for cid in model._connectivity:
+        if (
+            sNode.getNodeId(portType, cid) == nodeId
+            and sNode.getPortIndex(portType, cid) == portIndex
+        ):
+            result.add(cid)
+    return result
+
+
+def samplePorts(model, nQueries):
+    nodeIds = sorted(model.allNodeIds())
+    ports = []
+    for i in range(nQueries):
+        portType = sNode.PortType.In if i % 2 else sNode.PortType.Out
+        ports.append((nodeIds[i % len(nodeIds)], portType, i % PassThroughModel.nIn))
+    return ports
+
+
+def queryPorts(ports, lookup):
+    for nodeId, portType, portIndex in ports:
+        lookup(nodeId, portType, portIndex)
+
+
+if __name__ == "__main__":
+    rows = []
+    nQueries = 200
+    for nNodes, nEdges in [(100, 1000), (250, 2500), (1000, 10000), (2000, 20000)]:
+        model = makeRandomGraph(nNodes, nEdges)
+        ports = samplePorts(model, nQueries)
+
+        scan = measure(
+            lambda: queryPorts(ports, lambda n, t, i: scanConnections(model, n, t, i)),
+            repeat=1,
+        )
+        index = measure(lambda: queryPorts(ports, model.connections))
+
+        rows.append(
+            (
+                nEdges,
+                scan / nQueries * 1e6,
+                index / nQueries * 1e6,
+                scan / index,
+            )
+        )
+
+    report(
+        "connections() per query",
+        ["edges", "scan [us]", "index [us]", "speedup"],
+        rows,
+    )
@@ -0,0 +1,118 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+The same lattice graph run headless on `CoreGraphModel` with `CoreNodeDelegate`
+nodes, and on `DataFlowGraphModel` with `NodeDelegateModel` nodes: building
+the graph, then pushing updates from a source through it.
+
+    python -m benchmarks.bench_core_graph_model
+"""
+
+import time
+
+import SpatialNode as sNode
+from benchmarks.bench_propagation import CountingModel
+from benchmarks.common import ValueData, report
+
+
+class CoreCountingModel(sNode.CoreNodeDelegate):
+    nIn = 2
+    nOut = 2
+    computes = 0
+
+    def __init__(self):
+        super().__init__()
+        self._inputs = {}
+        self._result = ValueData(0.0)
+
+    def caption(self):
+        return "Counting"
+
+    def nPorts(self, portType):
+        return self.nIn if portType == sNode.PortType.In else self.nOut
+
+    def dataType(self, portType, portIndex):
+        return ValueData().type()
+
+    def portConnectionPolicy(self, portType, portIndex):
+        return sNode.ConnectionPolicy.Many
+
+    def outData(self, port):
+        return self._result
+
+    def setInData(self, nodeData, portIndex):
+        self.setInDataMany({portIndex: nodeData})
+
+    def setInDataMany(self, inputs):
+        CoreCountingModel.computes += 1
+        self._inputs.update(inputs)
+        total = sum(data.value() for data in self._inputs.values() if data)
+        self._result = ValueData(total)
+        for port in range(self.nOut):
+            self.dataUpdated.emit(port)
+
+
+def build(modelClass, delegateClass, depth, width):
+    registry = sNode.NodeDelegateModelRegistry()
+    registry.registerModel(delegateClass, "Counting")
+    model = modelClass(registry)
+    model.setPropagationScheduler(sNode.PropagationScheduler())
+
+    layers = [[model.addNode("Counting") for _ in range(width)]]
+    for _ in range(depth):
+        layer = [model.addNode("Counting") for _ in range(width)]
+        for i, nodeId in enumerate(layer):
+            model.addConnection(sNode.ConnectionId(layers[-1][i], 0, nodeId, 0))
+            model.addConnection(
+                sNode.ConnectionId(layers[-1][(i + 1) % width], 1, nodeId, 1)
+            )
+        layers.append(layer)
+    return model, layers[0][0]
+
+
+def run(modelClass, delegateClass, depth, width, updates=10):
+    start = time.perf_counter()
+    model, source = build(modelClass, delegateClass, depth, width)
+    buildTime = time.perf_counter() - start
+
+    delegate = model.delegateModel(source)
+    start = time.perf_counter()
+    for step in range(updates):
+        delegate.setInData(ValueData(float(step)), 0)
+    return buildTime, (time.perf_counter() - start) / updates
+
+
+if __name__ == "__main__":
+    rows = []
+    for depth, width in [(10, 10), (20, 50), (40, 100)]:
+        qtBuild, qtUpdate = run(sNode.DataFlowGraphModel, CountingModel, depth, width)
+        coreBuild, coreUpdate = run(
+            sNode.CoreGraphModel, CoreCountingModel, depth, width
+        )
+        rows.append(
+            (
+                (depth + 1) * width,
+                qtBuild,
+                coreBuild,
+                qtUpdate,
+                coreUpdate,
+                qtUpdate / coreUpdate,
+            )
+        )
+
+    report(
+        "lattice with a propagation scheduler, Qt model vs core model",
+        [
+            "nodes",
+            "Qt build [s]",
+            "core build [s]",
+            "Qt update [s]",
+            "core update [s]",
+            "speedup",
+        ],
+        rows,
+    )
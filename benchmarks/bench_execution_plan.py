@@ -0,0 +1,90 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Parameter sweep over the calculator example: a number source feeding a chain
+of additions ending in a display. Per-evaluation latency of
+`setNumber()` propagating through the model, eagerly and with a
+`PropagationScheduler`, against a compiled `ExecutionPlan`.
+
+    python -m benchmarks.bench_execution_plan
+"""
+
+import time
+
+import SpatialNode as sNode
+from benchmarks.common import report
+from examples.calculator.addition_model import AdditionModel
+from examples.calculator.decimal_data import DecimalData
+from examples.calculator.number_display_data_model import NumberDisplayDataModel
+from examples.calculator.number_source_data_model import NumberSourceDataModel
+
+
+def buildChain(length):
+    registry = sNode.NodeDelegateModelRegistry()
+    for creator in [NumberSourceDataModel, AdditionModel, NumberDisplayDataModel]:
+        registry.registerModel(creator, creator.__name__)
+    model = sNode.DataFlowGraphModel(registry)
+
+    source = model.addNode("NumberSourceDataModel")
+    previous = source
+    for _ in range(length):
+        add = model.addNode("AdditionModel")
+        model.addConnection(sNode.ConnectionId(previous, 0, add, 0))
+        model.addConnection(sNode.ConnectionId(source, 0, add, 1))
+        previous = add
+    display = model.addNode("NumberDisplayDataModel")
+    model.addConnection(sNode.ConnectionId(previous, 0, display, 0))
+    return model, source, display
+
+
+def sweepSignals(model, source, display, values, scheduler=None):
+    model.setPropagationScheduler(scheduler)
+    delegate = model.delegateModel(source)
+    results = []
+    start = time.perf_counter()
+    for x in values:
+        delegate.setNumber(x)
+        results.append(model.delegateModel(display).number())
+    return (time.perf_counter() - start) / len(values), results
+
+
+def sweepPlan(model, source, display, values):
+    plan = model.compile(outputs=[display], inputs=[(source, 0)])
+    results = []
+    start = time.perf_counter()
+    for x in values:
+        plan.run({(source, 0): DecimalData(x)})
+        results.append(model.delegateModel(display).number())
+    return (time.perf_counter() - start) / len(values), results
+
+
+if __name__ == "__main__":
+    values = [float(i) for i in range(2000)]
+    rows = []
+    for length in [1, 10, 50]:
+        signals, expected = sweepSignals(*buildChain(length), values)
+        scheduled, results = sweepSignals(
+            *buildChain(length), values, sNode.PropagationScheduler()
+        )
+        assert results == expected
+        plan, results = sweepPlan(*buildChain(length), values)
+        assert results == expected
+        rows.append(
+            (
+                length,
+                signals * 1e6,
+                scheduled * 1e6,
+                plan * 1e6,
+                scheduled / plan,
+            )
+        )
+
+    report(
+        "per evaluation, 2000 values",
+        ["additions", "eager [us]", "scheduled [us]", "plan [us]", "vs scheduled"],
+        rows,
+    )
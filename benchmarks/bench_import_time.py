@@ -0,0 +1,68 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Cold-start cost of typical entry points, each measured in a fresh interpreter
+run with `python -X importtime`: wall time of `import SpatialNode` plus the
+first use of the named attributes, modules loaded, and the module with the
+largest self time.
+
+    python -m benchmarks.bench_import_time
+"""
+
+import subprocess
+import sys
+
+from benchmarks.common import report
+
+SCENARIOS = [
+    ("package only", []),
+    ("core model", ["CoreGraphModel", "fromJson"]),
+    ("data flow model", ["DataFlowGraphModel", "fromJson"]),
+    ("scene and view", ["DataFlowGraphicsScene", "GraphicsView"]),
+]
+
+CHILD = """
+import sys, time
+before = len(sys.modules)
+start = time.perf_counter()
+import SpatialNode
+for name in sys.argv[1:]:
+    getattr(SpatialNode, name)
+print((time.perf_counter() - start) * 1e3, len(sys.modules) - before)
+"""
+
+
+def importTime(attributes):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD, *attributes],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    milliseconds, modules = result.stdout.split()
+
+    heaviest = max(
+        (
+            (int(line.split("|")[0].split(":")[1]), line.split("|")[2].strip())
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and "cumulative" not in line
+        ),
+    )
+    return float(milliseconds), int(modules), heaviest[1]
+
+
+if __name__ == "__main__":
+    rows = []
+    for title, attributes in SCENARIOS:
+        runs = [importTime(attributes) for _ in range(5)]
+        rows.append((title, *min(runs)))
+
+    report(
+        "cold start, best of 5",
+        ["entry point", "imports [ms]", "modules", "heaviest"],
+        rows,
+    )
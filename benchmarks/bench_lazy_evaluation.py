@@ -0,0 +1,73 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+A source feeding many chains of which only a few are read, as in graphs whose
+branches mostly end in hidden nodes. Compares the eager push with lazy
+evaluation followed by `evaluate()` on the read chains.
+
+    python -m benchmarks.bench_lazy_evaluation
+"""
+
+import time
+
+import SpatialNode as sNode
+from benchmarks.bench_propagation import CountingModel
+from benchmarks.common import ValueData, report
+
+
+def buildBranches(branches, length, lazy):
+    registry = sNode.NodeDelegateModelRegistry()
+    registry.registerModel(CountingModel, "Counting")
+    model = sNode.DataFlowGraphModel(registry)
+    model.setLazyEvaluation(lazy)
+
+    source = model.addNode("Counting")
+    sinks = []
+    for _ in range(branches):
+        previous = source
+        for _ in range(length):
+            nodeId = model.addNode("Counting")
+            model.addConnection(sNode.ConnectionId(previous, 0, nodeId, 0))
+            previous = nodeId
+        sinks.append(previous)
+    return model, source, sinks
+
+
+def run(branches, length, read, lazy):
+    model, source, sinks = buildBranches(branches, length, lazy)
+    for sink in sinks:
+        model.evaluate(sink)
+
+    CountingModel.computes = 0
+    start = time.perf_counter()
+    for step in range(10):
+        model.delegateModel(source).setInData(ValueData(float(step)), 0)
+        for sink in sinks[:read]:
+            model.evaluate(sink)
+    return time.perf_counter() - start, CountingModel.computes
+
+
+if __name__ == "__main__":
+    rows = []
+    for branches, length, read in [(20, 10, 1), (100, 10, 5), (200, 20, 10)]:
+        eagerTime, eagerComputes = run(branches, length, read, lazy=False)
+        lazyTime, lazyComputes = run(branches, length, read, lazy=True)
+        rows.append(
+            (
+                f"{read}/{branches}x{length}",
+                eagerComputes,
+                lazyComputes,
+                eagerTime,
+                lazyTime,
+            )
+        )
+
+    report(
+        "10 source updates, reading `read` of `branches` chains",
+        ["read/graph", "eager", "lazy", "eager [s]", "lazy [s]"],
+        rows,
+    )
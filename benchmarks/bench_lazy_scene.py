@@ -0,0 +1,116 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Opening a binary archive scene of many short calculator chains (a source
+feeding two additions) eagerly with `loadBinary`, against memory-mapping it
+with `loadBinaryFile(lazy=True)`, then evaluating one chain. Each open runs
+in a fresh process for comparable peak memory (Linux only).
+
+    python -m benchmarks.bench_lazy_scene
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import report
+from SpatialNode.definitions import ConnectionId
+from SpatialNode.scene_binary_format import encodeScene
+
+CHILD = """
+import sys, time
+from benchmarks.bench_scene_loading import emptyModel, peakMemory
+
+method, fileName, probe = sys.argv[1], sys.argv[2], int(sys.argv[3])
+model = emptyModel()
+baseline = peakMemory()
+
+start = time.perf_counter()
+if method == "eager":
+    with open(fileName, "rb") as file:
+        model.loadBinary(file.read())
+else:
+    model.loadBinaryFile(fileName, lazy=True)
+opened = time.perf_counter() - start
+
+start = time.perf_counter()
+number = model.delegateModel(probe).outData(0).number()
+evaluated = time.perf_counter() - start
+print(opened, evaluated, peakMemory() - baseline, number)
+"""
+
+
+def writeArchive(nChains, fileName):
+    nodeIds, positions, connections, internalData = [], [], [], []
+    for chain in range(nChains):
+        source, first, second = 3 * chain, 3 * chain + 1, 3 * chain + 2
+        nodeIds += [source, first, second]
+        positions += [(0.0, chain * 100.0), (200.0, chain * 100.0), (400.0, 0.0)]
+        connections += [
+            ConnectionId(source, 0, first, 0),
+            ConnectionId(source, 0, first, 1),
+            ConnectionId(first, 0, second, 0),
+            ConnectionId(source, 0, second, 1),
+        ]
+        internalData += [
+            {"model-name": "NumberSourceDataModel", "number": str(chain)},
+            {"model-name": "AdditionModel"},
+            {"model-name": "AdditionModel"},
+        ]
+    with open(fileName, "wb") as file:
+        file.write(encodeScene(nodeIds, positions, connections, internalData))
+
+
+def run(method, fileName, probe):
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, method, fileName, str(probe)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return tuple(float(value) for value in output)
+
+
+if __name__ == "__main__":
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for nChains in [3_333, 33_333]:
+            fileName = os.path.join(directory, f"archive{nChains}.snbs")
+            writeArchive(nChains, fileName)
+            probe = 3 * (nChains // 2) + 2
+
+            lazy = run("lazy", fileName, probe)
+            # the eager load of the largest archive takes minutes
+            eager = run("eager", fileName, probe) if nChains < 10_000 else None
+            if eager is not None:
+                assert eager[3] == lazy[3]
+            rows.append(
+                (
+                    3 * nChains,
+                    os.path.getsize(fileName) / 2**20,
+                    eager[0] if eager else float("nan"),
+                    lazy[0],
+                    lazy[1] * 1e3,
+                    eager[2] if eager else float("nan"),
+                    lazy[2],
+                )
+            )
+
+    report(
+        "opening an archive of calculator chains, then evaluating one chain",
+        [
+            "nodes",
+            "file [MB]",
+            "eager open [s]",
+            "lazy open [s]",
+            "lazy evaluate [ms]",
+            "eager [MB]",
+            "lazy [MB]",
+        ],
+        rows,
+    )
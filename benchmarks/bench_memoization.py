@@ -0,0 +1,70 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+A connection toggled off and on, as by undo/redo of a disconnection, at the
+head of a chain of nodes doing some work. Compares plain delegates with
+memoizing ones.
+
+    python -m benchmarks.bench_memoization
+"""
+
+import time
+
+import SpatialNode as sNode
+from benchmarks.common import PassThroughModel, ValueData, report
+
+WORK = 20_000
+
+
+class WorkModel(PassThroughModel):
+    def setInData(self, nodeData, portIndex):
+        total = 0
+        for i in range(WORK):
+            total += i
+        super().setInData(nodeData, portIndex)
+
+
+class MemoWorkModel(WorkModel):
+    memoCacheSize = 8
+
+
+def run(modelType, length, toggles=20):
+    registry = sNode.NodeDelegateModelRegistry()
+    registry.registerModel(PassThroughModel, "Source")
+    registry.registerModel(modelType, "Work")
+    model = sNode.DataFlowGraphModel(registry)
+
+    source = model.addNode("Source")
+    model.delegateModel(source).setInData(ValueData(1.0), 0)
+    first = previous = model.addNode("Work")
+    for _ in range(length - 1):
+        nodeId = model.addNode("Work")
+        model.addConnection(sNode.ConnectionId(previous, 0, nodeId, 0))
+        previous = nodeId
+
+    head = sNode.ConnectionId(source, 0, first, 0)
+    model.addConnection(head)
+
+    start = time.perf_counter()
+    for _ in range(toggles):
+        model.deleteConnection(head)
+        model.addConnection(head)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = []
+    for length in [10, 30, 100]:
+        plain = run(WorkModel, length)
+        memo = run(MemoWorkModel, length)
+        rows.append((length, plain, memo, plain / memo))
+
+    report(
+        "20 disconnect/reconnect toggles at the head of a chain",
+        ["chain", "plain [s]", "memoized [s]", "speedup"],
+        rows,
+    )
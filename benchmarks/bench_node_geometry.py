@@ -0,0 +1,73 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Cost of the node geometry queries made by painting, hit tests and connection
+moves, and of a repaint of every node.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_node_geometry
+"""
+
+import time
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.bench_batch_scene import buildGrid, makeRegistry
+from benchmarks.bench_port_descriptors import paint
+from benchmarks.common import report
+
+
+def timeQuery(query, nodeIds, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for nodeId in nodeIds:
+            query(nodeId)
+    return (time.perf_counter() - start) / (repeat * len(nodeIds)) * 1e6
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication()
+
+    rows = []
+    for orientation in [
+        QtCore.Qt.Orientation.Horizontal,
+        QtCore.Qt.Orientation.Vertical,
+    ]:
+        model = sNode.DataFlowGraphModel(makeRegistry())
+        scene = sNode.DataFlowGraphicsScene(model)
+        scene.orientation = orientation
+        buildGrid(model, 400)
+        geometry = scene.nodeGeometry
+        nodeIds = sorted(model.allNodeIds())
+        point = QtCore.QPointF(0.0, 30.0)
+
+        queries = {
+            "portPosition": lambda n: geometry.portPosition(n, sNode.PortType.Out, 1),
+            "portTextPosition": lambda n: geometry.portTextPosition(
+                n, sNode.PortType.In, 1
+            ),
+            "captionPosition": geometry.captionPosition,
+            "widgetPosition": geometry.widgetPosition,
+            "checkPortHit": lambda n: geometry.checkPortHit(
+                n, sNode.PortType.In, point
+            ),
+        }
+        for name, query in queries.items():
+            rows.append((orientation.name, name, timeQuery(query, nodeIds)))
+
+        nodes = [
+            item for item in scene.items() if isinstance(item, sNode.NodeGraphicsObject)
+        ]
+        image = QtGui.QImage(1600, 1200, QtGui.QImage.Format.Format_ARGB32)
+        start = time.perf_counter()
+        for node in nodes:
+            node.update()
+        paint(scene, image)
+        frame = (time.perf_counter() - start) / len(nodes) * 1e6
+        rows.append((orientation.name, "repaint per node", frame))
+
+    report("node geometry, 400 nodes", ["orientation", "query", "time [us]"], rows)
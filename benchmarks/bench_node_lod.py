@@ -0,0 +1,67 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Time to paint every node of a 5000 node scene at the zoom levels of the
+detail tiers, with the tiers and with full detail at every zoom. The node
+painter is called directly, so that the item cache and the drop shadow do
+not hide its cost.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_node_lod
+"""
+
+import time
+
+from PySide6 import QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.bench_batch_scene import buildGrid, makeRegistry
+from benchmarks.common import report
+
+
+def paintNodes(nodePainter, nodes, scale):
+    image = QtGui.QImage(256, 256, QtGui.QImage.Format.Format_ARGB32)
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    painter.scale(scale, scale)
+
+    start = time.perf_counter()
+    for node in nodes:
+        nodePainter.paint(painter, node)
+    elapsed = time.perf_counter() - start
+
+    painter.end()
+    return elapsed
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication()
+
+    model = sNode.DataFlowGraphModel(makeRegistry())
+    scene = sNode.DataFlowGraphicsScene(model)
+    with model.batch():
+        buildGrid(model, 5000, columns=100)
+    nodes = [scene.nodeGraphicsObject(nodeId) for nodeId in model.allNodeIds()]
+    nodePainter = scene.nodePainter
+
+    rows = []
+    for scale, tier in [(0.3, "flat"), (0.5, "caption"), (1.0, "full")]:
+        tiered = paintNodes(nodePainter, nodes, scale)
+
+        captionLevelOfDetail = nodePainter.captionLevelOfDetail
+        fullLevelOfDetail = nodePainter.fullLevelOfDetail
+        nodePainter.captionLevelOfDetail = nodePainter.fullLevelOfDetail = 0.0
+        full = paintNodes(nodePainter, nodes, scale)
+        nodePainter.captionLevelOfDetail = captionLevelOfDetail
+        nodePainter.fullLevelOfDetail = fullLevelOfDetail
+
+        rows.append((scale, tier, full, tiered))
+
+    report(
+        "node painting, 5000 nodes",
+        ["zoom", "tier", "full detail [s]", "tiered [s]"],
+        rows,
+    )
@@ -0,0 +1,78 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Node styles built and frame time of a full repaint, with the default style
+and with a per-node style on every other node. Every node is invalidated
+before each frame, so that the node painter runs for all of them.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_node_style
+"""
+
+import time
+
+from PySide6 import QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.bench_batch_scene import buildGrid, makeRegistry
+from benchmarks.bench_port_descriptors import paint
+from benchmarks.common import report
+
+
+def countStyles():
+    init = sNode.NodeStyle.__init__
+    counter = [0]
+
+    def countingInit(self):
+        counter[0] += 1
+        init(self)
+
+    sNode.NodeStyle.__init__ = countingInit
+    return counter
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication()
+    counter = countStyles()
+
+    rows = []
+    for nNodes in [100, 400, 1000]:
+        for perNode in [False, True]:
+            model = sNode.DataFlowGraphModel(makeRegistry())
+            scene = sNode.DataFlowGraphicsScene(model)
+            buildGrid(model, nNodes)
+            if perNode:
+                style = sNode.NodeStyle()
+                style.fromJsonText('{"NodeStyle": {"FontColor": "red"}}')
+                for nodeId in sorted(model.allNodeIds())[::2]:
+                    model.delegateModel(nodeId).nodeStyle = style
+            nodes = [
+                item
+                for item in scene.items()
+                if isinstance(item, sNode.NodeGraphicsObject)
+            ]
+            image = QtGui.QImage(1600, 1200, QtGui.QImage.Format.Format_ARGB32)
+            paint(scene, image)
+
+            frames = 5
+            counter[0] = 0
+            start = time.perf_counter()
+            for _ in range(frames):
+                for item in nodes:
+                    item.update()
+                paint(scene, image)
+            frameTime = (time.perf_counter() - start) / frames
+
+            rows.append(
+                (
+                    nNodes,
+                    "per node" if perNode else "default",
+                    counter[0] / frames,
+                    frameTime,
+                )
+            )
+
+    report("full scene repaint", ["nodes", "style", "styles/frame", "frame [s]"], rows)
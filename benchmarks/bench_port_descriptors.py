@@ -0,0 +1,94 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Repainting a scene whose nodes are already laid out: delegate calls made per
+frame and frame time, the first frame filling the port descriptor cache.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_port_descriptors
+"""
+
+import time
+from typing import override
+
+from PySide6 import QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.bench_batch_scene import buildGrid
+from benchmarks.common import PassThroughModel, report
+
+
+class CountingPortsModel(PassThroughModel):
+    calls = 0
+
+    @override
+    def caption(self):
+        CountingPortsModel.calls += 1
+        return super().caption()
+
+    @override
+    def nPorts(self, portType):
+        CountingPortsModel.calls += 1
+        return super().nPorts(portType)
+
+    @override
+    def dataType(self, portType, portIndex):
+        CountingPortsModel.calls += 1
+        return super().dataType(portType, portIndex)
+
+    @override
+    def portCaption(self, portType, portIndex):
+        CountingPortsModel.calls += 1
+        return super().portCaption(portType, portIndex)
+
+
+def paint(scene, image):
+    painter = QtGui.QPainter(image)
+    scene.render(painter)
+    painter.end()
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication()
+
+    rows = []
+    for nNodes in [100, 400, 1000]:
+        registry = sNode.NodeDelegateModelRegistry()
+        registry.registerModel(CountingPortsModel, "PassThrough")
+        model = sNode.DataFlowGraphModel(registry)
+        scene = sNode.DataFlowGraphicsScene(model)
+        buildGrid(model, nNodes)
+        image = QtGui.QImage(1600, 1200, QtGui.QImage.Format.Format_ARGB32)
+
+        for nodeId in model.allNodeIds():
+            model.invalidatePortDescriptors(nodeId)
+        CountingPortsModel.calls = 0
+        start = time.perf_counter()
+        paint(scene, image)
+        firstTime = time.perf_counter() - start
+        firstCalls = CountingPortsModel.calls
+
+        frames = 5
+        CountingPortsModel.calls = 0
+        start = time.perf_counter()
+        for _ in range(frames):
+            paint(scene, image)
+        steadyTime = (time.perf_counter() - start) / frames
+        steadyCalls = CountingPortsModel.calls / frames
+
+        rows.append((nNodes, firstCalls, firstTime, steadyCalls, steadyTime))
+
+    report(
+        "full scene repaint",
+        [
+            "nodes",
+            "1st calls",
+            "1st frame [s]",
+            "calls/frame",
+            "frame [s]",
+        ],
+        rows,
+    )
@@ -0,0 +1,50 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Port hit test on nodes with many ports: the port grid against testing every
+port, for a point on the last port and a point on no port.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_port_hit
+"""
+
+import time
+
+from PySide6 import QtCore, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.common import PassThroughModel, report
+
+
+def timeHits(geometry, nodeId, points, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for point in points:
+            geometry.checkPortHit(nodeId, sNode.PortType.In, point)
+    return (time.perf_counter() - start) / (repeat * len(points)) * 1e6
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication()
+
+    rows = []
+    for nPorts in [2, 50, 500]:
+        modelClass = type("ManyPorts", (PassThroughModel,), {"nIn": nPorts})
+        registry = sNode.NodeDelegateModelRegistry()
+        registry.registerModel(modelClass, "ManyPorts")
+        model = sNode.DataFlowGraphModel(registry)
+        scene = sNode.DataFlowGraphicsScene(model)
+        nodeId = model.addNode("ManyPorts")
+        geometry = scene.nodeGeometry
+
+        last = geometry.portPosition(nodeId, sNode.PortType.In, nPorts - 1)
+        points = [last, QtCore.QPointF(60.0, 5.0)]
+        grid = timeHits(geometry, nodeId, points)
+        geometry.portGrid = lambda nodeId, portType: None
+        scan = timeHits(geometry, nodeId, points, repeat=max(1, 200 // nPorts))
+        rows.append((nPorts, scan, grid))
+
+    report("port hit test", ["ports", "scan [us]", "grid [us]"], rows)
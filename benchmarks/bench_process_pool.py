@@ -0,0 +1,83 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Synthetic wide DAG: one source feeding `width` independent chains of `depth`
+CPU-bound nodes. Compares the single-threaded push of `DataFlowGraphModel`
+with `ProcessPoolGraphExecutor`.
+
+    python -m benchmarks.bench_process_pool
+"""
+
+import os
+import time
+
+import SpatialNode as sNode
+from benchmarks.common import PassThroughModel, ValueData, report
+
+WORK = 200_000
+
+
+class BusyModel(PassThroughModel):
+    """Burns CPU in pure Python before forwarding its inputs."""
+
+    def setInData(self, nodeData, portIndex):
+        self._burn()
+        super().setInData(nodeData, portIndex)
+
+    def setInDataMany(self, inputs):
+        self._burn()
+        self._inputs.update(inputs)
+        super().setInData(inputs[min(inputs)], min(inputs))
+
+    @staticmethod
+    def _burn():
+        total = 0
+        for i in range(WORK):
+            total += i * i
+        return total
+
+
+def buildWideGraph(registry, width, depth):
+    model = sNode.DataFlowGraphModel(registry)
+    source = model.addNode("PassThroughModel")
+    for _ in range(width):
+        previous = source
+        for _ in range(depth):
+            nodeId = model.addNode("BusyModel")
+            model.addConnection(sNode.ConnectionId(previous, 0, nodeId, 0))
+            previous = nodeId
+    return model, source
+
+
+if __name__ == "__main__":
+    registry = sNode.NodeDelegateModelRegistry()
+    registry.registerModel(PassThroughModel, "PassThroughModel")
+    registry.registerModel(BusyModel, "BusyModel")
+
+    rows = []
+    with sNode.ProcessPoolGraphExecutor(registry) as executor:
+        # start the workers outside of the measurements
+        executor.run(buildWideGraph(registry, 1, 1)[0])
+
+        for width, depth in [(4, 2), (16, 2), (64, 2)]:
+            model, source = buildWideGraph(registry, width, depth)
+
+            start = time.perf_counter()
+            model.delegateModel(source).setInData(ValueData(1.0), 0)
+            push = time.perf_counter() - start
+
+            start = time.perf_counter()
+            executor.run(model)
+            pool = time.perf_counter() - start
+
+            rows.append((f"{width}x{depth}", push, pool, push / pool))
+
+    report(
+        f"wide DAG evaluation on {os.cpu_count()} cores",
+        ["width x depth", "push [s]", "processes [s]", "speedup"],
+        rows,
+    )
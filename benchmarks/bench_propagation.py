@@ -0,0 +1,85 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+One source update pushed through a lattice of diamonds: every node of a layer
+reads two neighbours of the previous layer. Compares the depth-first
+propagation of `DataFlowGraphModel` with `PropagationScheduler`.
+
+    python -m benchmarks.bench_propagation
+"""
+
+import time
+
+import SpatialNode as sNode
+from benchmarks.common import PassThroughModel, ValueData, report
+
+
+class CountingModel(PassThroughModel):
+    computes = 0
+
+    def setInData(self, nodeData, portIndex):
+        self.setInDataMany({portIndex: nodeData})
+
+    def setInDataMany(self, inputs):
+        CountingModel.computes += 1
+        self._inputs.update(inputs)
+        total = sum(data.value() for data in self._inputs.values() if data)
+        self._result = ValueData(total)
+        for port in range(self.nOut):
+            self.dataUpdated.emit(port)
+
+
+def buildLattice(depth, width):
+    registry = sNode.NodeDelegateModelRegistry()
+    registry.registerModel(CountingModel, "Counting")
+    model = sNode.DataFlowGraphModel(registry)
+
+    layers = [[model.addNode("Counting") for _ in range(width)]]
+    for _ in range(depth):
+        layer = [model.addNode("Counting") for _ in range(width)]
+        for i, nodeId in enumerate(layer):
+            model.addConnection(sNode.ConnectionId(layers[-1][i], 0, nodeId, 0))
+            model.addConnection(
+                sNode.ConnectionId(layers[-1][(i + 1) % width], 1, nodeId, 1)
+            )
+        layers.append(layer)
+    return model, layers[0][0]
+
+
+def run(depth, width, scheduler):
+    model, source = buildLattice(depth, width)
+    model.setPropagationScheduler(scheduler)
+    delegate = model.delegateModel(source)
+
+    CountingModel.computes = 0
+    start = time.perf_counter()
+    delegate.setInData(ValueData(1.0), 0)
+    return time.perf_counter() - start, CountingModel.computes - 1
+
+
+if __name__ == "__main__":
+    rows = []
+    for depth, width in [(4, 8), (6, 8), (8, 8), (12, 64)]:
+        eagerTime, eagerComputes = run(depth, width, None)
+        scheduler = sNode.PropagationScheduler()
+        scheduledTime, scheduledComputes = run(depth, width, scheduler)
+        rows.append(
+            (
+                f"{depth}x{width}",
+                eagerComputes,
+                scheduledComputes,
+                scheduler.savedComputes,
+                eagerTime,
+                scheduledTime,
+            )
+        )
+
+    report(
+        "one update through a diamond lattice (depth x width)",
+        ["lattice", "eager", "scheduled", "saved", "eager [s]", "scheduled [s]"],
+        rows,
+    )
@@ -0,0 +1,96 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Scene queries without an item index and with the BSP tree index: picking the
+node under the cursor, the colliding items of a hovered node, a rubber band
+selection, and moving a node. Pending item changes are processed before the
+queries, as the event loop of an application would.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_scene_index
+"""
+
+import random
+import time
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import SpatialNode as sNode
+from benchmarks.bench_batch_scene import buildGrid
+from benchmarks.common import makeRegistry, report
+
+
+def timeEach(action, arguments):
+    start = time.perf_counter()
+    for argument in arguments:
+        action(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e3
+
+
+def selectRect(scene, rect):
+    path = QtGui.QPainterPath()
+    path.addRect(rect)
+    scene.setSelectionArea(path)
+
+
+def moveNode(node):
+    node.setPos(node.pos() + QtCore.QPointF(1.0, 0.0))
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication()
+    random.seed(1)
+
+    rows = []
+    for nNodes in [1000, 10000, 50000]:
+        for threshold, name in [(None, "NoIndex"), (0, "BspTreeIndex")]:
+            model = sNode.DataFlowGraphModel(makeRegistry())
+            scene = sNode.DataFlowGraphicsScene(model)
+            scene.itemIndexThreshold = threshold
+            with model.batch():
+                buildGrid(model, nNodes, columns=200)
+            QtCore.QCoreApplication.processEvents()
+
+            bounds = scene.itemsBoundingRect()
+            points = [
+                QtCore.QPointF(
+                    random.uniform(bounds.left(), bounds.right()),
+                    random.uniform(bounds.top(), bounds.bottom()),
+                )
+                for _ in range(10)
+            ]
+            rects = [QtCore.QRectF(point, QtCore.QSizeF(800, 600)) for point in points]
+            nodes = random.sample(
+                [scene.nodeGraphicsObject(nodeId) for nodeId in model.allNodeIds()], 10
+            )
+
+            # the index is built on the first query
+            start = time.perf_counter()
+            scene.items(points[0])
+            build = time.perf_counter() - start
+
+            pick = timeEach(
+                lambda point: sNode.locateNodeAt(point, scene, QtGui.QTransform()),
+                points,
+            )
+            hover = timeEach(lambda node: node.collidingItems(), nodes[:3])
+            select = timeEach(lambda rect: selectRect(scene, rect), rects[:3])
+            move = timeEach(moveNode, nodes)
+            rows.append((nNodes, name, build, pick, hover, select, move))
+
+    report(
+        "scene queries",
+        [
+            "nodes",
+            "index",
+            "index [s]",
+            "pick [ms]",
+            "hover [ms]",
+            "select [ms]",
+            "move [ms]",
+        ],
+        rows,
+    )
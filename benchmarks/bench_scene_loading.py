@@ -0,0 +1,117 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Loading calculator scene files: `readAll()` into a `QJsonDocument` followed by
+`DataFlowGraphModel.load`, against `DataFlowGraphModel.loadStream`. Every
+load runs in a fresh process so that peak RSS is comparable (Linux only).
+
+    python -m benchmarks.bench_scene_loading
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import report
+
+CHILD = """
+import sys, time
+from PySide6 import QtCore
+from benchmarks.bench_scene_loading import emptyModel, peakMemory
+
+method, fileName = sys.argv[1:]
+model = emptyModel()
+baseline = peakMemory()
+
+start = time.perf_counter()
+if method == "document":
+    file = QtCore.QFile(fileName)
+    file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+    model.load(QtCore.QJsonDocument.fromJson(file.readAll()).object())
+else:
+    with open(fileName, "rb") as file:
+        model.loadStream(file)
+elapsed = time.perf_counter() - start
+
+print(elapsed, peakMemory() - baseline, len(list(model.allNodeIds())))
+"""
+
+
+def peakMemory():
+    # in MB; unlike `ru_maxrss`, not inherited from the parent process
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def emptyModel():
+    import SpatialNode as sNode
+    from examples.calculator.addition_model import AdditionModel
+    from examples.calculator.number_display_data_model import NumberDisplayDataModel
+    from examples.calculator.number_source_data_model import NumberSourceDataModel
+
+    registry = sNode.NodeDelegateModelRegistry()
+    for creator in [NumberSourceDataModel, AdditionModel, NumberDisplayDataModel]:
+        registry.registerModel(creator, creator.__name__)
+    return sNode.DataFlowGraphModel(registry)
+
+
+def writeScene(length, fileName):
+    from PySide6 import QtCore
+
+    from benchmarks.bench_execution_plan import buildChain
+
+    model, _, _ = buildChain(length)
+    with open(fileName, "wb") as file:
+        file.write(QtCore.QJsonDocument(model.save()).toJson().data())
+
+
+def load(method, fileName):
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, method, fileName],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), float(output[1]), int(output[2])
+
+
+if __name__ == "__main__":
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for length in [1_000, 5_000, 20_000]:
+            fileName = os.path.join(directory, f"scene{length}.json")
+            writeScene(length, fileName)
+            document, documentMemory, nodes = load("document", fileName)
+            stream, streamMemory, streamNodes = load("stream", fileName)
+            assert nodes == streamNodes
+            rows.append(
+                (
+                    nodes,
+                    os.path.getsize(fileName) / 2**20,
+                    document,
+                    stream,
+                    documentMemory,
+                    streamMemory,
+                )
+            )
+
+    report(
+        "loading a chain of additions",
+        [
+            "nodes",
+            "file [MB]",
+            "document [s]",
+            "stream [s]",
+            "document [MB]",
+            "stream [MB]",
+        ],
+        rows,
+    )
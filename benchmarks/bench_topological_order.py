@@ -0,0 +1,87 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+"""
+Keeping a topological order while edges are inserted into a large graph:
+`TopologicalOrder` against a full Kahn sort after every insertion.
+
+    python -m benchmarks.bench_topological_order
+"""
+
+import random
+import time
+from collections import deque
+
+import SpatialNode as sNode
+from benchmarks.common import report
+
+
+def kahn(nodes, successors):
+    inDegree = dict.fromkeys(nodes, 0)
+    for targets in successors.values():
+        for target in targets:
+            inDegree[target] += 1
+    ready = deque(n for n in nodes if inDegree[n] == 0)
+    order = []
+    while ready:
+        nodeId = ready.popleft()
+        order.append(nodeId)
+        for target in successors.get(nodeId, ()):
+            inDegree[target] -= 1
+            if inDegree[target] == 0:
+                ready.append(target)
+    return order
+
+
+def build(nNodes, nEdges, seed=0):
+    rng = random.Random(seed)
+    order = sNode.TopologicalOrder()
+    successors = {}
+    for nodeId in range(nNodes):
+        order.addNode(nodeId)
+
+    # a random DAG, edges inserted in random order and direction
+    ranks = list(range(nNodes))
+    rng.shuffle(ranks)
+    edges = []
+    while len(edges) < nEdges:
+        a, b = rng.sample(range(nNodes), 2)
+        if ranks[a] > ranks[b]:
+            a, b = b, a
+        edges.append((a, b))
+    return rng, order, successors, edges
+
+
+if __name__ == "__main__":
+    rows = []
+    for nNodes in [5_000, 20_000, 50_000]:
+        rng, order, successors, edges = build(nNodes, nNodes)
+
+        start = time.perf_counter()
+        for a, b in edges:
+            order.addEdge(a, b)
+            successors.setdefault(a, []).append(b)
+        incremental = (time.perf_counter() - start) / len(edges)
+
+        sample = 20
+        start = time.perf_counter()
+        for _ in range(sample):
+            kahn(range(nNodes), successors)
+        full = (time.perf_counter() - start) / sample
+
+        queries = [tuple(rng.sample(range(nNodes), 2)) for _ in range(1000)]
+        start = time.perf_counter()
+        for a, b in queries:
+            order.wouldCreateCycle(a, b)
+        cycleCheck = (time.perf_counter() - start) / len(queries)
+
+        rows.append((nNodes, full * 1e3, incremental * 1e3, cycleCheck * 1e3))
+
+    report(
+        "per inserted edge, graphs with as many edges as nodes",
+        ["nodes", "re-sort [ms]", "incremental [ms]", "cycle check [ms]"],
+        rows,
+    )
@@ -0,0 +1,123 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import random
+import time
+from typing import override
+
+import SpatialNode as sNode
+
+
+class ValueData(sNode.NodeData):
+    def __init__(self, value=0.0):
+        super().__init__()
+        self._value = value
+
+    def type(self):
+        return sNode.NodeDataType("value", "Value")
+
+    def value(self):
+        return self._value
+
+
+class PassThroughModel(sNode.NodeDelegateModel):
+    """Sums its inputs and forwards the result on every output port."""
+
+    nIn = 2
+    nOut = 2
+
+    def __init__(self):
+        super().__init__()
+        self._inputs = {}
+        self._result = ValueData(0.0)
+
+    @override
+    def caption(self):
+        return "PassThrough"
+
+    @override
+    def nPorts(self, portType):
+        return self.nIn if portType == sNode.PortType.In else self.nOut
+
+    @override
+    def dataType(self, portType, portIndex):
+        return ValueData().type()
+
+    @override
+    def portConnectionPolicy(self, portType, portIndex):
+        return sNode.ConnectionPolicy.Many
+
+    @override
+    def outData(self, port):
+        return self._result
+
+    @override
+    def setInData(self, nodeData, portIndex):
+        self._inputs[portIndex] = nodeData
+        total = 0.0
+        for data in self._inputs.values():
+            if data is not None:
+                total += data.value()
+        self._result = ValueData(total)
+        for port in range(self.nOut):
+            self.dataUpdated.emit(port)
+
+    @override
+    def embeddedWidget(self):
+        return None
+
+
+def makeRegistry():
+    registry = sNode.NodeDelegateModelRegistry()
+    registry.registerModel(PassThroughModel, "PassThrough")
+    return registry
+
+
+def makeRandomGraph(nNodes, nEdges, seed=0):
+    """
+    Random DAG: every edge goes from a lower to a higher node id. Edges are
+    added by ascending source id so that no connection triggers a cascade.
+    """
+    rng = random.Random(seed)
+    model = sNode.DataFlowGraphModel(makeRegistry())
+    nodeIds = [model.addNode("PassThrough") for _ in range(nNodes)]
+
+    edges = set()
+    while len(edges) < nEdges:
+        a, b = sorted(rng.sample(range(nNodes), 2))
+        edges.add(
+            (
+                nodeIds[a],
+                rng.randrange(PassThroughModel.nOut),
+                nodeIds[b],
+                rng.randrange(PassThroughModel.nIn),
+            )
+        )
+    for edge in sorted(edges):
+        model.addConnection(sNode.ConnectionId(*edge))
+    return model
+
+
+def measure(fn, repeat=5):
+    """Best wall-clock time of `repeat` runs of `fn`, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(title, header, rows):
+    print(title)
+    print("  ".join(f"{h:>14}" for h in header))
+    for row in rows:
+        print(
+            "  ".join(
+                f"{v:>14.6g}" if isinstance(v, float) else f"{v:>14}" for v in row
+            )
+        )
+    print()
@@ -34,3 +34,7 @@ class AdditionModel(MathOperationDataModel):
             self._result = None
 
         self.dataUpdated.emit(outPortIndex)
+
+    @override
+    def computeArrays(self, n1, n2):
+        return n1 + n2
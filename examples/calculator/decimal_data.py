@@ -4,6 +4,8 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
+import math
+
 import SpatialNode as sNode
 
 
@@ -25,3 +27,16 @@ class DecimalData(sNode.NodeData):
 
     def numberAsText(self) -> str:
         return str(self._number)
+
+    def batchValue(self):
+        return self._number
+
+    @classmethod
+    def fromBatchValue(cls, value):
+        if math.isnan(value):
+            return None
+        return cls(float(value))
+
+    @classmethod
+    def emptyBatchValue(cls):
+        return math.nan
@@ -8,7 +8,7 @@ from typing import override
 
 import SpatialNode as sNode
 from examples.calculator.decimal_data import DecimalData
-from examples.calculator.math_operation_data_model import MathOperationDataModel
+from examples.calculator.math_operation_data_model import MathOperationDataModel, numpy
 
 
 class DivisionModel(MathOperationDataModel):
@@ -54,3 +54,7 @@ class DivisionModel(MathOperationDataModel):
             self._result = None
 
         self.dataUpdated.emit(outPortIndex)
+
+    @override
+    def computeArrays(self, n1, n2):
+        return numpy.where(n2 == 0.0, numpy.nan, n1 / n2)
@@ -7,6 +7,11 @@
 from abc import abstractmethod
 from typing import override
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import SpatialNode as sNode
 from examples.calculator.decimal_data import DecimalData
 
@@ -47,6 +52,35 @@ class MathOperationDataModel(sNode.NodeDelegateModel):
 
         self.compute()
 
+    @override
+    def setInDataMany(self, inputs):
+        if not all(inputs.values()):
+            self.dataInvalidated.emit(0)
+
+        self._number1 = inputs.get(0, self._number1)
+        self._number2 = inputs.get(1, self._number2)
+
+        self.compute()
+
+    @override
+    def computeBatch(self, inputs):
+        # rows without data are NaN, which every operation propagates
+        if numpy is None or len(inputs) != 2:
+            return NotImplemented
+        if any(column.dataClass is not DecimalData for column in inputs.values()):
+            return NotImplemented
+
+        n1 = numpy.asarray(inputs[0].values, dtype=float)
+        n2 = numpy.asarray(inputs[1].values, dtype=float)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            result = self.computeArrays(n1, n2)
+        if result is NotImplemented:
+            return NotImplemented
+        return {0: sNode.BatchColumn(result, DecimalData)}
+
+    def computeArrays(self, n1, n2):
+        return NotImplemented
+
     @override
     def embeddedWidget(self):
         return None
@@ -35,3 +35,7 @@ class MultiplicationModel(MathOperationDataModel):
             self._result = None
 
         self.dataUpdated.emit(outPortIndex)
+
+    @override
+    def computeArrays(self, n1, n2):
+        return n1 * n2
@@ -48,3 +48,7 @@ class SubtractionModel(MathOperationDataModel):
             self._result = None
 
         self.dataUpdated.emit(outPortIndex)
+
+    @override
+    def computeArrays(self, n1, n2):
+        return n1 - n2
@@ -0,0 +1,83 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import threading
+
+from PySide6 import QtCore, QtWidgets
+
+from SpatialNode.async_node_delegate_model import AsyncNodeDelegateModel
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import ConnectionId, NodeRole
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+from tests.test_propagation_scheduler import _Add, _Number, _Source
+
+
+class _Double(AsyncNodeDelegateModel):
+    gate = threading.Event()
+    threads = []
+
+    def nPorts(self, portType):
+        return 1
+
+    def dataType(self, portType, portIndex):
+        return _Number().type()
+
+    def compute(self, inputs):
+        _Double.gate.wait(5)
+        _Double.threads.append(threading.current_thread())
+        return {0: _Number(inputs[0].value * 2)}
+
+    def embeddedWidget(self):
+        return None
+
+
+def _settle(pool):
+    pool.waitForDone()
+    QtCore.QCoreApplication.processEvents()
+
+
+def test_async_compute():
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "Source")
+    registry.registerModel(_Double, "Double")
+    registry.registerModel(_Add, "Add")
+    model = DataFlowGraphModel(registry)
+
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(1)
+
+    source = model.addNode("Source")
+    double = model.addNode("Double")
+    sink = model.addNode("Add")
+    delegate = model.delegateModel(double)
+    delegate.setThreadPool(pool)
+
+    _Double.gate.set()
+    model.addConnection(ConnectionId(source, 0, double, 0))
+    model.addConnection(ConnectionId(double, 0, sink, 0))
+    _settle(pool)
+    model.delegateModel(sink).seen.clear()
+
+    # the first request blocks the only worker, the second one is dropped
+    # from the queue and only the third one runs
+    _Double.gate.clear()
+    _Double.threads.clear()
+    for value in (2, 3, 4):
+        model.delegateModel(source).emitValue(value)
+    assert model.nodeData(double, NodeRole.Computing)
+    assert model.delegateModel(sink).seen == []
+
+    _Double.gate.set()
+    _settle(pool)
+
+    assert not model.nodeData(double, NodeRole.Computing)
+    assert len(_Double.threads) == 2
+    assert threading.main_thread() not in _Double.threads
+    assert delegate.outData(0).value == 8
+    assert model.delegateModel(sink).seen == [(8, None)]
@@ -4,7 +4,11 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
-from SpatialNode.connection_id_utils import makeIncompleteConnectionIdFromComplete
+from SpatialNode.connection_id_utils import (
+    makeCompleteConnectionId,
+    makeIncompleteConnectionId,
+    makeIncompleteConnectionIdFromComplete,
+)
 from SpatialNode.definitions import (
     ConnectionId,
     PortType,
@@ -20,3 +24,10 @@ def test_make_incomplete_connection_id_from_complete():
     assert connect.outPortIndex == 2
     assert connect.inNodeId == InvalidNodeId
     assert connect.inPortIndex == InvalidPortIndex
+
+
+def test_make_complete_connection_id():
+    incomplete = makeIncompleteConnectionId(1, PortType.Out, 2)
+    connection_id = makeCompleteConnectionId(incomplete, 3, 4)
+    assert connection_id == ConnectionId(1, 2, 3, 4)
+    assert incomplete.inNodeId == InvalidNodeId
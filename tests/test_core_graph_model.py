@@ -0,0 +1,117 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.core_graph_model import CoreGraphModel
+from SpatialNode.core_node_delegate import CoreNodeDelegate
+from SpatialNode.definitions import ConnectionId, NodeRole, PortType
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+from tests.test_propagation_scheduler import _Number
+
+
+class _CoreSource(CoreNodeDelegate):
+    def __init__(self):
+        super().__init__()
+        self.value = _Number(1)
+
+    def nPorts(self, portType):
+        return 0 if portType == PortType.In else 1
+
+    def dataType(self, portType, portIndex):
+        return _Number().type()
+
+    def setInData(self, nodeData, portIndex): ...
+
+    def outData(self, port):
+        return self.value
+
+    def emitValue(self, value):
+        self.value = _Number(value)
+        self.dataUpdated.emit(0)
+
+
+class _CoreAdd(CoreNodeDelegate):
+    def __init__(self):
+        super().__init__()
+        self.inputs = {}
+
+    def nPorts(self, portType):
+        return 2 if portType == PortType.In else 1
+
+    def dataType(self, portType, portIndex):
+        return _Number().type()
+
+    def setInData(self, nodeData, portIndex):
+        self.inputs[portIndex] = nodeData
+        self.dataUpdated.emit(0)
+
+    def outData(self, port):
+        return _Number(sum(d.value for d in self.inputs.values() if d is not None))
+
+
+def _makeCoreModel():
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_CoreSource, "_CoreSource")
+    registry.registerModel(_CoreAdd, "_CoreAdd")
+    return CoreGraphModel(registry)
+
+
+def test_propagation():
+    model = _makeCoreModel()
+    source = model.addNode("_CoreSource")
+    add = model.addNode("_CoreAdd")
+    sink = model.addNode("_CoreAdd")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+    model.addConnection(ConnectionId(add, 0, sink, 0))
+
+    model.delegateModel(source).emitValue(3)
+    assert model.outData(sink).value == 6
+    assert model.topologicalOrder() == [source, add, sink]
+    assert not model.connectionPossible(ConnectionId(sink, 0, source, 0))
+
+    model.deleteConnection(ConnectionId(source, 0, add, 1))
+    assert model.outData(sink).value == 3
+
+
+def test_save_load():
+    model = _makeCoreModel()
+    source = model.addNode("_CoreSource")
+    add = model.addNode("_CoreAdd")
+    model.setNodeData(add, NodeRole.Position, (10, 20))
+    model.addConnection(ConnectionId(source, 0, add, 0))
+
+    restored = _makeCoreModel()
+    restored.load(model.save())
+    assert restored.allNodeIds() == {source, add}
+    assert restored.nodeData(add, NodeRole.Position) == (10.0, 20.0)
+    assert restored.connectionExists(ConnectionId(source, 0, add, 0))
+    assert restored.outData(add).value == 1
+
+
+def test_adapter_scene():
+    from PySide6 import QtCore, QtWidgets
+
+    from SpatialNode.basic_graphics_scene import BasicGraphicsScene
+    from SpatialNode.core_graph_model_adapter import CoreGraphModelAdapter
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    core = _makeCoreModel()
+    source = core.addNode("_CoreSource")
+    adapter = CoreGraphModelAdapter(core)
+    scene = BasicGraphicsScene(adapter)
+    assert scene.nodeGraphicsObject(source) is not None
+
+    add = adapter.addNode("_CoreAdd")
+    adapter.setNodeData(add, NodeRole.Position, QtCore.QPointF(200, 0))
+    adapter.addConnection(ConnectionId(source, 0, add, 0))
+    assert scene.nodeGraphicsObject(add).pos() == QtCore.QPointF(200, 0)
+    assert scene.connectionGraphicsObject(ConnectionId(source, 0, add, 0))
+    assert core.nodeData(add, NodeRole.Position) == (200.0, 0.0)
+
+    core.deleteNode(source)
+    assert scene.nodeGraphicsObject(source) is None
@@ -1,4 +1,10 @@
+import pytest
+from PySide6 import QtCore
+
 from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import ConnectionId, NodeRole, PortType
+from SpatialNode.node_data import NodeData, NodeDataType
+from SpatialNode.node_delegate_model import NodeDelegateModel
 from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
 
 
@@ -12,3 +18,386 @@ def test_data_model_registry():
     registry = NodeDelegateModelRegistry()
     model = DataFlowGraphModel(registry)
     assert True
+
+
+class _Data(NodeData):
+    def __init__(self, value=0):
+        self.value = value
+
+    def type(self):
+        return NodeDataType("int", "Int")
+
+
+class _Node(NodeDelegateModel):
+    def __init__(self):
+        super().__init__()
+        self.inputs = {}
+
+    def nPorts(self, portType):
+        return 2
+
+    def dataType(self, portType, portIndex):
+        return _Data().type()
+
+    def setInData(self, nodeData, portIndex):
+        self.inputs[portIndex] = nodeData
+
+    def outData(self, port):
+        return _Data(port)
+
+    def embeddedWidget(self):
+        return None
+
+
+def _makeModel(nNodes):
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Node, "Node")
+    model = DataFlowGraphModel(registry)
+    return model, [model.addNode("Node") for _ in range(nNodes)]
+
+
+def test_connection_index():
+    model, (a, b, c) = _makeModel(3)
+    ab = ConnectionId(a, 0, b, 1)
+    ac = ConnectionId(a, 0, c, 0)
+    bc = ConnectionId(b, 1, c, 1)
+    for cid in [ab, ac, bc]:
+        model.addConnection(cid)
+
+    assert model.connections(a, PortType.Out, 0) == {ab, ac}
+    assert model.connections(a, PortType.Out, 1) == set()
+    assert model.connections(b, PortType.In, 1) == {ab}
+    assert model.connections(c, PortType.In, 1) == {bc}
+    assert model.allConnectionIds(b) == {ab, bc}
+
+    model.deleteConnection(ac)
+    assert model.connections(a, PortType.Out, 0) == {ab}
+    assert model.allConnectionIds(c) == {bc}
+
+    model.deleteNode(b)
+    assert model.allConnectionIds(a) == set()
+    assert model.allConnectionIds(c) == set()
+    assert model._portConnections == {}
+    assert model._nodeConnections == {}
+
+
+def test_connection_lookup_by_value():
+    model, (a, b) = _makeModel(2)
+    model.addConnection(ConnectionId(a, 0, b, 0))
+    model.addConnection(ConnectionId(a, 0, b, 0))
+
+    assert model.connectionExists(ConnectionId(a, 0, b, 0))
+    assert len(model.connections(b, PortType.In, 0)) == 1
+    assert model.deleteConnection(ConnectionId(a, 0, b, 0))
+    assert not model.connectionExists(ConnectionId(a, 0, b, 0))
+
+
+def test_batch_coalesces_notifications():
+    model, (a,) = _makeModel(1)
+    emitted = []
+    model.nodeCreated.connect(lambda nodeId: emitted.append(("created", nodeId)))
+    model.connectionCreated.connect(lambda cid: emitted.append(("connected", cid)))
+    model.graphChanged.connect(lambda changes: emitted.append(("batch", changes)))
+
+    with model.batch():
+        b = model.addNode("Node")
+        c = model.addNode("Node")
+        model.addConnection(ConnectionId(a, 0, b, 0))
+        model.addConnection(ConnectionId(b, 0, c, 0))
+        model.setNodeData(a, NodeRole.Position, QtCore.QPointF(1, 2))
+        model.setNodeData(b, NodeRole.Position, QtCore.QPointF(3, 4))
+        model.deleteNode(c)
+
+    assert len(emitted) == 1
+    changes = emitted[0][1]
+    assert changes.nodesAdded == {b}
+    assert changes.nodesRemoved == set()
+    assert changes.nodesMoved == {a}
+    assert changes.connectionsAdded == {ConnectionId(a, 0, b, 0)}
+    assert changes.connectionsRemoved == set()
+
+    model.addNode("Node")
+    assert emitted[-1][0] == "created"
+
+
+def test_lazy_evaluation():
+    from tests.test_propagation_scheduler import _Add, _Source
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "Source")
+    registry.registerModel(_Add, "Add")
+    model = DataFlowGraphModel(registry)
+    model.setLazyEvaluation(True)
+
+    source = model.addNode("Source")
+    add = model.addNode("Add")
+    sink = model.addNode("Add")
+    hidden = model.addNode("Add")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+    model.addConnection(ConnectionId(add, 0, sink, 0))
+    model.addConnection(ConnectionId(source, 0, hidden, 1))
+    assert model.dirtyInPorts(add) == {0, 1}
+    assert model.isDirty(sink)
+
+    assert model.evaluate(sink).value == 2
+    assert model.delegateModel(add).seen == [(1, 1)]
+    assert model.delegateModel(sink).seen == [(2, None)]
+    assert model.delegateModel(hidden).seen == []
+    assert not model.isDirty(add)
+
+    model.delegateModel(source).emitValue(5)
+    assert model.isDirty(sink)
+    assert model.delegateModel(add).seen == [(1, 1)]
+
+    assert model.evaluate(add).value == 10
+    assert model.isDirty(sink)
+    model.deleteConnection(ConnectionId(add, 0, sink, 0))
+    assert model.evaluate(sink).value == 0
+
+    model.setLazyEvaluation(False)
+    assert model.delegateModel(hidden).seen == [(None, 5)]
+
+
+def test_topological_order():
+    model, (a, b, c) = _makeModel(3)
+    model.addConnection(ConnectionId(c, 0, b, 0))
+    model.addConnection(ConnectionId(b, 0, a, 0))
+
+    assert model.topologicalOrder() == [c, b, a]
+    assert model.wouldCreateCycle(ConnectionId(a, 1, c, 1))
+    assert not model.connectionPossible(ConnectionId(a, 1, c, 1))
+    assert model.connectionPossible(ConnectionId(c, 1, a, 1))
+
+    model.deleteNode(b)
+    assert not model.wouldCreateCycle(ConnectionId(a, 1, c, 1))
+
+
+class _CountingNode(_Node):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.inPorts = 1
+
+    def nPorts(self, portType):
+        self.calls += 1
+        return self.inPorts if portType == PortType.In else 1
+
+    def portCaption(self, portType, portIndex):
+        self.calls += 1
+        return "in{}".format(portIndex) if portType == PortType.In else None
+
+
+def test_port_descriptors_cache():
+    from SpatialNode.definitions import PortRole
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_CountingNode, "Counting")
+    model = DataFlowGraphModel(registry)
+    nodeId = model.addNode("Counting")
+    delegate = model.delegateModel(nodeId)
+
+    model.nodeData(nodeId, NodeRole.InPortCount)
+    delegate.calls = 0
+    for _ in range(3):
+        assert model.nodeData(nodeId, NodeRole.InPortCount) == 1
+        assert model.portData(nodeId, PortType.In, 0, PortRole.Caption) == "in0"
+        assert model.portData(nodeId, PortType.Out, 0, PortRole.Caption) is None
+    assert delegate.calls == 0
+
+    delegate.portsAboutToBeInserted.emit(PortType.In, 1, 1)
+    delegate.inPorts = 2
+    delegate.portsInserted.emit()
+    assert model.nodeData(nodeId, NodeRole.InPortCount) == 2
+    assert model.portData(nodeId, PortType.In, 1, PortRole.Caption) == "in1"
+
+    delegate.inPorts = 1
+    model.notifyNodeUpdated(nodeId)
+    assert model.nodeData(nodeId, NodeRole.InPortCount) == 1
+
+
+def test_node_style():
+    from SpatialNode.node_style import NodeStyle
+    from SpatialNode.style_collection import StyleCollection
+
+    model, (a, b) = _makeModel(2)
+    default = StyleCollection.nodeStyle()
+    assert model.nodeStyle(a) is default
+
+    # equal styles resolve to one shared object, until the collection changes
+    styleJson = model.nodeData(a, NodeRole.Style)
+    resolved = StyleCollection.resolveNodeStyle(styleJson)
+    assert StyleCollection.resolveNodeStyle(styleJson) is resolved
+    assert resolved.FontColor == default.FontColor
+
+    # shared styles are frozen, copies are not and own their colors
+    with pytest.raises(AttributeError):
+        default.Opacity = 0.5
+    with pytest.raises(AttributeError):
+        resolved.Opacity = 0.5
+    edited = default.copy()
+    edited.FontColor.setRed(255 - default.FontColor.red())
+    assert edited.FontColor != default.FontColor
+    assert NodeStyle().FontColor is not NodeStyle().FontColor
+
+    version = StyleCollection.nodeStyleVersion()
+    custom = NodeStyle()
+    custom.fromJsonText('{"NodeStyle": {"FontColor": "red"}}')
+    updated = []
+    model.nodeUpdated.connect(updated.append)
+    model.delegateModel(b).nodeStyle = custom
+    assert updated == [b]
+    assert model.nodeStyle(b) is custom
+    assert model.nodeStyle(a) is default
+
+    # a delegate's own style is a copy of the default, edited in place
+    model.delegateModel(a).nodeStyle.Opacity = 0.5
+    assert model.nodeStyle(a).Opacity == 0.5
+    assert default.Opacity != 0.5
+
+    c = model.addNode("Node")
+    StyleCollection.setNodeStyle(custom)
+    try:
+        assert StyleCollection.nodeStyleVersion() == version + 1
+        assert StyleCollection.resolveNodeStyle(styleJson) is not resolved
+        assert model.nodeStyle(c).FontColor == custom.FontColor
+        assert model.nodeStyle(c).isFrozen() and not custom.isFrozen()
+    finally:
+        StyleCollection.setNodeStyle(default)
+
+
+def test_resolved_node_style_cache():
+    from SpatialNode.abstract_graph_model import AbstractGraphModel
+    from SpatialNode.style_collection import StyleCollection
+
+    # the resolution of models which only answer NodeRole.Style
+    model, (a,) = _makeModel(1)
+    styleReads = []
+    nodeData = model.nodeData
+    model.nodeData = lambda nodeId, role: styleReads.append(role) or nodeData(
+        nodeId, role
+    )
+
+    style = AbstractGraphModel.nodeStyle(model, a)
+    assert AbstractGraphModel.nodeStyle(model, a) is style
+    assert len(styleReads) == 1
+
+    model.notifyNodeUpdated(a)
+    AbstractGraphModel.nodeStyle(model, a)
+    assert len(styleReads) == 2
+
+    with model.batch():
+        model.notifyNodeUpdated(a)
+        AbstractGraphModel.nodeStyle(model, a)
+    assert len(styleReads) == 3
+
+    StyleCollection.setNodeStyle(StyleCollection.nodeStyle())
+    AbstractGraphModel.nodeStyle(model, a)
+    assert len(styleReads) == 4
+
+
+def test_load_stream():
+    import io
+
+    from tests.test_propagation_scheduler import _Add, _Source
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "_Source")
+    registry.registerModel(_Add, "_Add")
+
+    model = DataFlowGraphModel(registry)
+    source = model.addNode("_Source")
+    add = model.addNode("_Add")
+    sink = model.addNode("_Add")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+    model.addConnection(ConnectionId(add, 0, sink, 0))
+    sceneFile = io.BytesIO(QtCore.QJsonDocument(model.save()).toJson().data())
+
+    loaded = DataFlowGraphModel(registry)
+    progress = []
+    changes = []
+    loaded.graphChanged.connect(changes.append)
+    loaded.loadStream(sceneFile, chunkSize=2, progress=progress.append)
+
+    assert set(loaded.allNodeIds()) == {source, add, sink}
+    assert loaded.save() == model.save()
+    # one chunk per two nodes, then the connections
+    assert len(changes) == 3
+    assert progress[-1] == len(sceneFile.getvalue())
+    # inputs are delivered once per node, after all the connections exist
+    assert loaded.delegateModel(add).seen == [(1, 1)]
+    assert loaded.delegateModel(sink).seen == [(2, None)]
+
+
+def test_binary_scene():
+    import json
+
+    from SpatialNode.scene_binary_format import (
+        sceneBinaryToJson,
+        sceneJsonToBinary,
+    )
+    from tests.test_propagation_scheduler import _Add, _Source
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "_Source")
+    registry.registerModel(_Add, "_Add")
+
+    model = DataFlowGraphModel(registry)
+    source = model.addNode("_Source")
+    add = model.addNode("_Add")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+    model.setNodeData(add, NodeRole.Position, QtCore.QPointF(10.5, -3))
+
+    data = model.saveBinary()
+    loaded = DataFlowGraphModel(registry)
+    loaded.loadBinary(memoryview(data))
+    assert loaded.save() == model.save()
+    assert loaded.delegateModel(add).seen == [(1, 1)]
+
+    # the converter goes through the JSON of a scene file both ways
+    sceneJson = json.loads(QtCore.QJsonDocument(model.save()).toJson().data())
+    assert sceneJsonToBinary(sceneJson) == data
+    assert sceneBinaryToJson(data)["nodes"] == sorted(
+        sceneJson["nodes"], key=lambda node: node["id"]
+    )
+
+
+def test_lazy_binary_scene(tmp_path):
+    from tests.test_propagation_scheduler import _Add, _Source
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "_Source")
+    registry.registerModel(_Add, "_Add")
+
+    model = DataFlowGraphModel(registry)
+    source = model.addNode("_Source")
+    add = model.addNode("_Add")
+    sink = model.addNode("_Add")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+    model.addConnection(ConnectionId(add, 0, sink, 0))
+    sceneFile = tmp_path / "scene.snbs"
+    sceneFile.write_bytes(model.saveBinary())
+
+    loaded = DataFlowGraphModel(registry)
+    loaded.loadBinaryFile(str(sceneFile))
+    assert not any(loaded.isMaterialized(nodeId) for nodeId in (source, add, sink))
+
+    # describing, moving and saving nodes leaves them as records
+    assert loaded.nodeData(add, NodeRole.InPortCount) == 2
+    assert loaded.nodeData(add, NodeRole.Widget) is None
+    loaded.setNodeData(add, NodeRole.Position, QtCore.QPointF(4, 2))
+    assert loaded.nodeData(source, NodeRole.Position) == QtCore.QPointF()
+    assert loaded.save()["nodes"].size() == 3
+    assert not any(loaded.isMaterialized(nodeId) for nodeId in (source, add, sink))
+
+    # new data stops at nodes which are not materialized
+    loaded.delegateModel(source).emitValue(5)
+    assert not loaded.isMaterialized(add)
+
+    # evaluating a node materializes it with its inputs
+    assert loaded.delegateModel(sink).seen == [(10, None)]
+    assert loaded.delegateModel(add).seen == [(5, 5)]
+    assert loaded.nodeData(add, NodeRole.Position) == QtCore.QPointF(4, 2)
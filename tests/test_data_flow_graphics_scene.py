@@ -1,14 +1,422 @@
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from SpatialNode.data_flow_graph_model import DataFlowGraphModel
 from SpatialNode.data_flow_graphics_scene import DataFlowGraphicsScene
+from SpatialNode.definitions import ConnectionId, NodeRole, PortType
 from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
 
 
 def test_create():
-    QtWidgets.QApplication()
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
 
     registry = NodeDelegateModelRegistry()
     model = DataFlowGraphModel(registry)
     scene = DataFlowGraphicsScene(model)
     assert True
+
+
+def test_batch_applies_change_set():
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a,) = _makeModel(1)
+    scene = DataFlowGraphicsScene(model)
+
+    with model.batch():
+        b = model.addNode("Node")
+        model.setNodeData(b, NodeRole.Position, QtCore.QPointF(100, 50))
+        model.addConnection(ConnectionId(a, 0, b, 0))
+        assert scene.nodeGraphicsObject(b) is None
+
+    assert scene.nodeGraphicsObject(b).pos() == QtCore.QPointF(100, 50)
+    assert scene.connectionGraphicsObject(ConnectionId(a, 0, b, 0)) is not None
+
+    with model.batch():
+        model.deleteNode(a)
+
+    assert scene.nodeGraphicsObject(a) is None
+    assert scene.connectionGraphicsObject(ConnectionId(a, 0, b, 0)) is None
+
+
+def test_node_layout_cache():
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a,) = _makeModel(1)
+    scene = DataFlowGraphicsScene(model)
+    geometry = scene.nodeGeometry
+
+    layout = geometry.layout(a)
+    assert geometry.layout(a) is layout
+    assert (
+        geometry.portPosition(a, PortType.Out, 1)
+        is layout.portPositions[PortType.Out][1]
+    )
+    assert layout.size == model.nodeData(a, NodeRole.Size)
+
+    model.notifyNodeUpdated(a)
+    assert geometry.layout(a) is not layout
+
+    scene.orientation = QtCore.Qt.Orientation.Vertical
+    assert scene.nodeGeometry.portPosition(a, PortType.In, 1).y() == 0.0
+
+
+def test_port_hit():
+    from SpatialNode.abstract_node_geometry import PortGrid
+    from SpatialNode.definitions import InvalidPortIndex
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a,) = _makeModel(1)
+    scene = DataFlowGraphicsScene(model)
+    for orientation in QtCore.Qt.Orientation:
+        scene.orientation = orientation
+        geometry = scene.nodeGeometry
+        for portType in (PortType.In, PortType.Out):
+            for portIndex in range(2):
+                anchor = geometry.portPosition(a, portType, portIndex)
+                hit = geometry.checkPortHit(a, portType, anchor + QtCore.QPointF(1, 1))
+                assert hit == portIndex
+        far = QtCore.QPointF(-100.0, -100.0)
+        assert geometry.checkPortHit(a, PortType.In, far) == InvalidPortIndex
+
+    grid = PortGrid(0.0, 10.0, 0.0, 20.0, 1000)
+    assert grid.portAt(QtCore.QPointF(2.0, 10.0 + 20.0 * 731 - 3.0), 5.0) == 731
+    assert grid.portAt(QtCore.QPointF(2.0, 20.0), 5.0) == InvalidPortIndex
+    assert grid.portAt(QtCore.QPointF(0.0, 10.0 + 20.0 * 1000), 5.0) == InvalidPortIndex
+    assert PortGrid(0.0, 0.0, 0.0, 0.0, 0).portAt(QtCore.QPointF(), 5.0) == (
+        InvalidPortIndex
+    )
+
+
+def test_item_index_threshold():
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    ItemIndexMethod = QtWidgets.QGraphicsScene.ItemIndexMethod
+    model, (a, b, c) = _makeModel(3)
+    scene = DataFlowGraphicsScene(model)
+    assert scene.itemIndexMethod() == ItemIndexMethod.NoIndex
+
+    scene.itemIndexThreshold = 4
+    assert scene.itemIndexMethod() == ItemIndexMethod.NoIndex
+    model.addConnection(ConnectionId(a, 0, b, 0))
+    assert scene.itemIndexMethod() == ItemIndexMethod.BspTreeIndex
+    assert (
+        scene.itemAt(
+            scene.nodeGraphicsObject(c).sceneBoundingRect().center(), QtGui.QTransform()
+        )
+        is not None
+    )
+
+    # kept once built
+    model.deleteNode(c)
+    model.deleteNode(b)
+    assert scene.itemIndexMethod() == ItemIndexMethod.BspTreeIndex
+
+    scene.itemIndexThreshold = None
+    assert scene.itemIndexMethod() == ItemIndexMethod.BspTreeIndex
+
+    model, nodes = _makeModel(4)
+    scene = DataFlowGraphicsScene(model)
+    scene.itemIndexThreshold = None
+    model.addConnection(ConnectionId(nodes[0], 0, nodes[1], 0))
+    assert scene.itemIndexMethod() == ItemIndexMethod.NoIndex
+
+
+def test_connection_path_cache():
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a, b) = _makeModel(2)
+    model.setNodeData(b, NodeRole.Position, QtCore.QPointF(300, 0))
+    scene = DataFlowGraphicsScene(model)
+    connectionId = ConnectionId(a, 0, b, 0)
+    model.addConnection(connectionId)
+    connection = scene.connectionGraphicsObject(connectionId)
+
+    path, shape = connection.path(), connection.shape()
+    assert connection.path() is path and connection.shape() is shape
+    scene.nodeGraphicsObject(a).setPos(QtCore.QPointF(0, 0))
+    assert connection.path() is path
+
+    scene.nodeGraphicsObject(b).setPos(QtCore.QPointF(300, 100))
+    assert connection.path() is not path
+    assert connection.path().currentPosition() == connection.inSlot()
+    assert connection.boundingRect().contains(connection.inSlot())
+
+
+def test_half_cubic_paths():
+    from SpatialNode.connection_painter import halfCubicPaths
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a, b) = _makeModel(2)
+    model.setNodeData(b, NodeRole.Position, QtCore.QPointF(-300, 200))
+    scene = DataFlowGraphicsScene(model)
+    connectionId = ConnectionId(a, 0, b, 1)
+    model.addConnection(connectionId)
+    connection = scene.connectionGraphicsObject(connectionId)
+
+    first, second, middle = halfCubicPaths(connection)
+    assert first.pointAtPercent(0.0) == connection.outSlot()
+    assert second.currentPosition() == connection.inSlot()
+    assert first.currentPosition() == middle
+    halfway = connection.path().pointAtPercent(0.5)
+    assert abs(halfway.x() - middle.x()) < 0.5 and abs(halfway.y() - middle.y()) < 0.5
+
+
+def test_connection_layer():
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a, b) = _makeModel(2)
+    model.setNodeData(b, NodeRole.Position, QtCore.QPointF(300, 100))
+    scene = DataFlowGraphicsScene(model)
+    scene.connectionLayerEnabled = True
+    connectionId = ConnectionId(a, 0, b, 0)
+    model.addConnection(connectionId)
+
+    layer = scene.connectionLayer
+    assert scene.connectionGraphicsObject(connectionId) is None
+    assert layer.hasConnection(connectionId)
+    middle = layer._connections[connectionId].path().pointAtPercent(0.5)
+    assert scene.itemAt(middle, QtGui.QTransform()) is layer
+    assert scene.itemAt(middle + QtCore.QPointF(0, 40), QtGui.QTransform()) is None
+
+    connection = scene.promoteConnection(connectionId)
+    assert scene.connectionGraphicsObject(connectionId) is connection
+    assert not layer.hasConnection(connectionId)
+    connection.setSelected(True)
+    QtCore.QCoreApplication.processEvents()
+    assert scene.connectionGraphicsObject(connectionId) is connection
+    connection.setSelected(False)
+    QtCore.QCoreApplication.processEvents()
+    assert scene.connectionGraphicsObject(connectionId) is None
+
+    scene.nodeGraphicsObject(b).setPos(QtCore.QPointF(300, 300))
+    inSlot = layer._connections[connectionId].endPoint(PortType.In)
+    assert layer.connectionAt(inSlot) == connectionId
+
+    model.deleteConnection(connectionId)
+    assert not layer.hasConnection(connectionId)
+    assert layer.connectionAt(inSlot) is None
+
+
+def test_layer_connection_types():
+    from SpatialNode.node_data import NodeDataType
+    from SpatialNode.style_collection import StyleCollection
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a, b) = _makeModel(2)
+    scene = DataFlowGraphicsScene(model)
+    scene.connectionLayerEnabled = True
+    connectionId = ConnectionId(a, 0, b, 0)
+    model.addConnection(connectionId)
+    layer = scene.connectionLayer
+    tile = layer._cell(layer._rects[connectionId].center())
+
+    connectionStyle = StyleCollection.connectionStyle()
+    dataDefined = connectionStyle.copy()
+    dataDefined.UseDataDefinedColors = True
+    StyleCollection.setConnectionStyle(dataDefined)
+    try:
+        assert layer._batch(tile).middles == []
+
+        # the In port changes its data type, the node stays in place
+        delegate = model.delegateModel(b)
+        delegate.dataType = lambda portType, portIndex: NodeDataType("text", "Text")
+        model.notifyNodeUpdated(b)
+        assert len(layer._batch(tile).middles) == 1
+    finally:
+        StyleCollection.setConnectionStyle(connectionStyle)
+
+
+def test_copy_layer_connections():
+    from SpatialNode.undo_commands import CopyCommand, PasteCommand
+    from tests.test_data_flow_graph_model import _Node
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    # saved nodes name their class
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Node, "_Node")
+    model = DataFlowGraphModel(registry)
+    a, b, c = [model.addNode("_Node") for _ in range(3)]
+    scene = DataFlowGraphicsScene(model)
+    scene.connectionLayerEnabled = True
+    ab = ConnectionId(a, 0, b, 0)
+    model.addConnection(ab)
+    model.addConnection(ConnectionId(b, 1, c, 1))
+    assert scene.connectionGraphicsObject(ab) is None
+
+    scene.nodeGraphicsObject(a).setSelected(True)
+    scene.nodeGraphicsObject(b).setSelected(True)
+    CopyCommand(scene)
+    PasteCommand(scene, QtCore.QPointF(0, 0)).redo()
+
+    pasted = set(model.allNodeIds()) - {a, b, c}
+    assert len(pasted) == 2
+    (connection,) = {cid for nodeId in pasted for cid in model.allConnectionIds(nodeId)}
+    assert {connection.outNodeId, connection.inNodeId} == pasted
+
+
+def test_node_level_of_detail():
+    from tests.test_data_flow_graph_model import _makeModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    model, (a,) = _makeModel(1)
+    scene = DataFlowGraphicsScene(model)
+    nodePainter = scene.nodePainter
+    drawn = []
+    for name in ("drawFlatNodeRect", "drawNodeCaption", "drawEntryLabels"):
+        setattr(nodePainter, name, lambda painter, ngo, name=name: drawn.append(name))
+
+    image = QtGui.QImage(64, 64, QtGui.QImage.Format.Format_ARGB32)
+    for scale, expected in [
+        (0.3, ["drawFlatNodeRect"]),
+        (0.5, ["drawFlatNodeRect", "drawNodeCaption"]),
+        (1.0, ["drawNodeCaption", "drawEntryLabels"]),
+    ]:
+        drawn.clear()
+        painter = QtGui.QPainter(image)
+        painter.scale(scale, scale)
+        nodePainter.paint(painter, scene.nodeGraphicsObject(a))
+        painter.end()
+        assert drawn == expected
+
+
+def test_widget_level_of_detail():
+    from examples.calculator.number_source_data_model import NumberSourceDataModel
+    from SpatialNode.graphics_view import GraphicsView
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    def proxyWidget(nodeId):
+        (proxy,) = [
+            item
+            for item in scene.nodeGraphicsObject(nodeId).childItems()
+            if isinstance(item, QtWidgets.QGraphicsProxyWidget)
+        ]
+        return proxy
+
+    registry = NodeDelegateModelRegistry()
+    NumberSourceDataModel.register(registry)
+    model = DataFlowGraphModel(registry)
+    scene = DataFlowGraphicsScene(model)
+    view = GraphicsView(scene)
+    a = model.addNode("NumberSourceDataModel")
+    assert proxyWidget(a).isVisible()
+
+    view.setupScale(0.4)
+    assert not scene.widgetsVisible()
+    assert not proxyWidget(a).isVisible()
+    b = model.addNode("NumberSourceDataModel")
+    assert not proxyWidget(b).isVisible()
+
+    # painting leaves the visibility to the view
+    image = QtGui.QImage(64, 64, QtGui.QImage.Format.Format_ARGB32)
+    painter = QtGui.QPainter(image)
+    scene.nodePainter.paint(painter, scene.nodeGraphicsObject(a))
+    painter.end()
+    assert not proxyWidget(a).isVisible()
+
+    view.setupScale(1.0)
+    assert proxyWidget(a).isVisible() and proxyWidget(b).isVisible()
+
+
+def test_lazy_scene_pulls_visible_nodes():
+    from tests.test_propagation_scheduler import _Add, _Source
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "Source")
+    registry.registerModel(_Add, "Add")
+    model = DataFlowGraphModel(registry)
+    model.setLazyEvaluation(True)
+    scene = DataFlowGraphicsScene(model)
+
+    source = model.addNode("Source")
+    shown = model.addNode("Add")
+    hidden = model.addNode("Add")
+    scene.nodeGraphicsObject(hidden).setVisible(False)
+    model.addConnection(ConnectionId(source, 0, shown, 0))
+    model.addConnection(ConnectionId(source, 0, hidden, 0))
+
+    QtCore.QCoreApplication.processEvents()
+    assert not model.isDirty(shown)
+    assert model.isDirty(hidden)
+
+    scene.nodeGraphicsObject(hidden).setVisible(True)
+    QtCore.QCoreApplication.processEvents()
+    assert not model.isDirty(hidden)
+
+
+def test_lazy_nodes_in_scene(tmp_path):
+    from examples.calculator.addition_model import AdditionModel
+    from examples.calculator.number_source_data_model import NumberSourceDataModel
+
+    if QtWidgets.QApplication.instance() is None:
+        QtWidgets.QApplication()
+
+    registry = NodeDelegateModelRegistry()
+    for modelClass in [NumberSourceDataModel, AdditionModel]:
+        modelClass.register(registry)
+    model = DataFlowGraphModel(registry)
+    source = last = model.addNode("NumberSourceDataModel")
+    for _ in range(5):
+        add = model.addNode("AdditionModel")
+        model.addConnection(ConnectionId(last, 0, add, 0))
+        model.addConnection(ConnectionId(source, 0, add, 1))
+        last = add
+    sceneFile = tmp_path / "scene.snbs"
+    sceneFile.write_bytes(model.saveBinary())
+    eagerSize = DataFlowGraphicsScene(model).nodeGeometry.size(source)
+
+    loaded = DataFlowGraphModel(registry)
+    loaded.loadBinaryFile(str(sceneFile))
+    scene = DataFlowGraphicsScene(loaded)
+    # laid out from the prototype's widget, without evaluating anything
+    assert not any(loaded.isMaterialized(nodeId) for nodeId in loaded.allNodeIds())
+    assert scene.nodeGeometry.size(source) == eagerSize
+    node = scene.nodeGraphicsObject(source)
+    assert not any(
+        isinstance(item, QtWidgets.QGraphicsProxyWidget) for item in node.childItems()
+    )
+
+    loaded.materializeNode(last)
+    assert all(loaded.isMaterialized(nodeId) for nodeId in loaded.allNodeIds())
+    assert any(
+        isinstance(item, QtWidgets.QGraphicsProxyWidget) for item in node.childItems()
+    )
+
+    # materialized nodes, with or without a widget, are not embedded again
+    embedded = []
+    for nodeId in (source, last):
+        scene.nodeGraphicsObject(nodeId)._embedQWidget = lambda: embedded.append(1)
+        loaded.notifyNodeUpdated(nodeId)
+    assert embedded == []
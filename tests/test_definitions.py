@@ -4,9 +4,36 @@
 #  personal capacity and am not conveying any rights to any intellectual
 #  property of any third parties.
 
-from SpatialNode.definitions import ConnectionId
+import copy
+import pickle
+
+import pytest
+
+from SpatialNode.definitions import ConnectionId, invertConnection
 
 
 def test_connection_id():
     connection_id = ConnectionId(1, 2, 3, 4)
     assert connection_id.outNodeId == 1
+
+
+def test_connection_id_value_semantics():
+    a = ConnectionId(1, 2, 3, 4)
+    b = ConnectionId(1, 2, 3, 4)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a != ConnectionId(1, 2, 3, 5)
+    assert len({a, b}) == 1
+    assert {a: "x"}[b] == "x"
+
+
+def test_connection_id_immutable():
+    connection_id = ConnectionId(1, 2, 3, 4)
+    with pytest.raises(AttributeError):
+        connection_id.outNodeId = 5
+    assert copy.deepcopy(connection_id) is connection_id
+    assert pickle.loads(pickle.dumps(connection_id)) == connection_id
+
+
+def test_invert_connection():
+    assert invertConnection(ConnectionId(1, 2, 3, 4)) == ConnectionId(3, 4, 1, 2)
@@ -0,0 +1,152 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import pytest
+
+from SpatialNode.definitions import ConnectionId
+from tests.test_propagation_scheduler import _Number, _makeDiamond
+
+
+def test_run_plan():
+    model, source, add, sink = _makeDiamond(None)
+    plan = model.compile(outputs=[sink], inputs=[(source, 0)])
+    assert len(plan.steps()) == 2
+
+    result = plan.run({(source, 0): _Number(4)})
+    assert result[(sink, 0)].value == 8
+    # delivered once per node, nothing propagated through the model
+    assert model.delegateModel(add).seen == [(4, 4)]
+    assert model.delegateModel(sink).seen == [(8, None)]
+
+    # missing inputs keep the data currently on the port
+    assert plan.run()[(sink, 0)].value == 2
+
+
+def test_plan_invalidated_by_topology():
+    model, source, add, sink = _makeDiamond(None)
+    plan = model.compile(outputs=[sink])
+    assert plan.run()[(sink, 0)].value == 2
+
+    model.deleteConnection(ConnectionId(source, 0, add, 1))
+    assert not plan.isValid()
+    with pytest.raises(RuntimeError):
+        plan.run()
+
+    assert model.compile(outputs=[sink]).run()[(sink, 0)].value == 1
+
+
+def test_plan_rejects_async_delegates():
+    from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+    from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+    from tests.test_async_node_delegate_model import _Double
+    from tests.test_propagation_scheduler import _Source
+
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "Source")
+    registry.registerModel(_Double, "Double")
+    model = DataFlowGraphModel(registry)
+    source = model.addNode("Source")
+    double = model.addNode("Double")
+    model.addConnection(ConnectionId(source, 0, double, 0))
+
+    with pytest.raises(ValueError):
+        model.compile(outputs=[double])
+    assert len(model.compile(outputs=[source]).steps()) == 1
+
+
+def test_core_model_plan():
+    from tests.test_core_graph_model import _makeCoreModel
+
+    model = _makeCoreModel()
+    source = model.addNode("_CoreSource")
+    add = model.addNode("_CoreAdd")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+
+    plan = model.compile(outputs=[add], inputs=[(source, 0)])
+    assert plan.run({(source, 0): _Number(5)})[(add, 0)].value == 10
+
+
+def test_run_batch_row_fallback():
+    model, source, add, sink = _makeDiamond(None)
+    plan = model.compile(outputs=[sink], inputs=[(source, 0)])
+
+    result = plan.runBatch({(source, 0): [_Number(1), _Number(2), _Number(3)]})
+    assert [row.value for row in result[(sink, 0)].rows()] == [2, 4, 6]
+
+    with pytest.raises(ValueError):
+        plan.runBatch({(source, 0): [_Number(1)], (add, 0): []})
+
+
+def test_run_batch_vectorized():
+    from SpatialNode.batch_column import BatchColumn
+    from tests.test_core_graph_model import _CoreAdd, _makeCoreModel
+
+    class _BatchAdd(_CoreAdd):
+        batchCalls = 0
+
+        def computeBatch(self, inputs):
+            _BatchAdd.batchCalls += 1
+            pairs = zip(inputs[0].values, inputs[1].values)
+            values = [_Number(a.value + b.value) for a, b in pairs]
+            return {0: BatchColumn(values, _Number)}
+
+    model = _makeCoreModel()
+    model.dataModelRegistry.registerModel(_BatchAdd, "_BatchAdd")
+    source = model.addNode("_CoreSource")
+    add = model.addNode("_BatchAdd")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+
+    plan = model.compile(outputs=[add], inputs=[(source, 0)])
+    rows = [_Number(value) for value in range(100)]
+    column = plan.runBatch({(source, 0): rows})[(add, 0)]
+    assert [row.value for row in column.rows()] == list(range(0, 200, 2))
+    assert _BatchAdd.batchCalls == 1
+
+
+def test_calculator_batch():
+    numpy = pytest.importorskip("numpy")
+    from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+    from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+    from examples.calculator.addition_model import AdditionModel
+    from examples.calculator.decimal_data import DecimalData
+    from examples.calculator.division_model import DivisionModel
+    from examples.calculator.number_source_data_model import NumberSourceDataModel
+
+    registry = NodeDelegateModelRegistry()
+    for modelClass in [NumberSourceDataModel, AdditionModel, DivisionModel]:
+        modelClass.register(registry)
+    model = DataFlowGraphModel(registry)
+    a = model.addNode("NumberSourceDataModel")
+    b = model.addNode("NumberSourceDataModel")
+    add = model.addNode("AdditionModel")
+    div = model.addNode("DivisionModel")
+    model.addConnection(ConnectionId(a, 0, add, 0))
+    model.addConnection(ConnectionId(b, 0, add, 1))
+    model.addConnection(ConnectionId(add, 0, div, 0))
+    model.addConnection(ConnectionId(b, 0, div, 1))
+
+    plan = model.compile(outputs=[add, div], inputs=[(a, 0), (b, 0)])
+    xs = [1.0, 2.5, -3.0, 7.0]
+    ys = [2.0, 0.0, 4.0, -7.0]
+    result = plan.runBatch(
+        {
+            (a, 0): [DecimalData(x) for x in xs],
+            (b, 0): [DecimalData(y) for y in ys],
+        }
+    )
+    assert isinstance(result[(div, 0)].values, numpy.ndarray)
+
+    def numbers(rows):
+        return [None if row is None else row.number() for row in rows]
+
+    for port in [(add, 0), (div, 0)]:
+        expected = [
+            plan.run({(a, 0): DecimalData(x), (b, 0): DecimalData(y)})[port]
+            for x, y in zip(xs, ys)
+        ]
+        assert numbers(result[port].rows()) == numbers(expected)
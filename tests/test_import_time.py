@@ -0,0 +1,41 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import os
+import subprocess
+import sys
+
+
+def _runFresh(code):
+    """stdout of `code` run in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return result.stdout
+
+
+def test_import_without_qt():
+    code = (
+        "import sys, SpatialNode as s\n"
+        "s.CoreGraphModel, s.PropagationScheduler, s.fromJson\n"
+        "print(sorted(m for m in sys.modules if m.startswith('PySide6')))\n"
+    )
+    out = _runFresh(code)
+    assert out.strip() == "[]"
+
+
+def test_models_without_widgets():
+    code = (
+        "import sys, SpatialNode as s\n"
+        "s.DataFlowGraphModel, s.NodeDelegateModel\n"
+        "print('PySide6.QtWidgets' in sys.modules)\n"
+    )
+    out = _runFresh(code)
+    assert out.strip() == "False"
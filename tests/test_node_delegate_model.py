@@ -0,0 +1,67 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import ConnectionId
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+from tests.test_propagation_scheduler import _Add, _Number, _Source
+
+
+class _MemoAdd(_Add):
+    memoCacheSize = 2
+    computes = 0
+
+    def compute(self):
+        _MemoAdd.computes += 1
+        super().compute()
+
+
+def test_fingerprint():
+    assert _Number(1).fingerprint() == _Number(1).fingerprint()
+    assert _Number(1).fingerprint() != _Number(2).fingerprint()
+    assert _Number([1]).fingerprint() is None
+
+
+def test_memoized_compute():
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "Source")
+    registry.registerModel(_MemoAdd, "Add")
+    model = DataFlowGraphModel(registry)
+
+    source = model.addNode("Source")
+    add = model.addNode("Add")
+    sink = model.addNode("Add")
+    model.addConnection(ConnectionId(add, 0, sink, 0))
+    a0 = ConnectionId(source, 0, add, 0)
+    a1 = ConnectionId(source, 0, add, 1)
+    model.addConnection(a0)
+    model.addConnection(a1)
+
+    delegate = model.delegateModel(add)
+    assert (delegate.memoHits, delegate.memoMisses) == (0, 2)
+
+    # the first disconnection is a new combination, the reconnection is not
+    _MemoAdd.computes = 0
+    model.deleteConnection(a1)
+    model.addConnection(a1)
+    assert _MemoAdd.computes == 1
+    assert (delegate.memoHits, delegate.memoMisses) == (1, 3)
+    assert delegate.inputs[1].value == 1
+    assert model.delegateModel(sink).seen[-2:] == [(1, None), (2, None)]
+
+    # toggling again is served from the cache
+    model.deleteConnection(a1)
+    model.addConnection(a1)
+    assert _MemoAdd.computes == 1
+    assert (delegate.memoHits, delegate.memoMisses) == (3, 3)
+
+    # a third combination evicts the least recently used one
+    model.deleteConnection(a0)
+    model.addConnection(a0)
+    assert _MemoAdd.computes == 2
+    model.deleteConnection(a1)
+    assert _MemoAdd.computes == 3
+    assert (delegate.memoHits, delegate.memoMisses) == (4, 5)
@@ -0,0 +1,54 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import ConnectionId
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+from SpatialNode.process_pool_graph_executor import ProcessPoolGraphExecutor
+from tests.test_propagation_scheduler import _Add, _Source
+
+
+def test_run_in_processes():
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "_Source")
+    registry.registerModel(_Add, "_Add")
+    model = DataFlowGraphModel(registry)
+
+    source = model.addNode("_Source")
+    left = model.addNode("_Add")
+    right = model.addNode("_Add")
+    sink = model.addNode("_Add")
+    model.addConnection(ConnectionId(source, 0, left, 0))
+    model.addConnection(ConnectionId(source, 0, right, 0))
+    model.addConnection(ConnectionId(source, 0, right, 1))
+    model.addConnection(ConnectionId(left, 0, sink, 0))
+    model.addConnection(ConnectionId(right, 0, sink, 1))
+    model.delegateModel(sink).seen.clear()
+
+    with ProcessPoolGraphExecutor(registry, maxWorkers=2) as executor:
+        results = executor.run(model, applyToSinks=True)
+
+    assert results[left][0].value == 1
+    assert results[right][0].value == 2
+    assert results[sink][0].value == 3
+    assert model.delegateModel(sink).seen == [(1, 2)]
+
+
+def test_rerun_after_disconnect():
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "_Source")
+    registry.registerModel(_Add, "_Add")
+    model = DataFlowGraphModel(registry)
+
+    source = model.addNode("_Source")
+    add = model.addNode("_Add")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+
+    with ProcessPoolGraphExecutor(registry, maxWorkers=1) as executor:
+        assert executor.run(model)[add][0].value == 2
+        model.deleteConnection(ConnectionId(source, 0, add, 1))
+        assert executor.run(model)[add][0].value == 1
@@ -0,0 +1,136 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+from SpatialNode.data_flow_graph_model import DataFlowGraphModel
+from SpatialNode.definitions import ConnectionId, PortType
+from SpatialNode.node_data import NodeData, NodeDataType
+from SpatialNode.node_delegate_model import NodeDelegateModel
+from SpatialNode.node_delegate_model_registry import NodeDelegateModelRegistry
+from SpatialNode.propagation_scheduler import PropagationScheduler
+
+
+class _Number(NodeData):
+    def __init__(self, value=0):
+        self.value = value
+
+    def type(self):
+        return NodeDataType("number", "Number")
+
+
+class _Source(NodeDelegateModel):
+    def __init__(self):
+        super().__init__()
+        self.value = _Number(1)
+
+    def nPorts(self, portType):
+        return 0 if portType == PortType.In else 1
+
+    def dataType(self, portType, portIndex):
+        return _Number().type()
+
+    def setInData(self, nodeData, portIndex): ...
+
+    def outData(self, port):
+        return self.value
+
+    def embeddedWidget(self):
+        return None
+
+    def emitValue(self, value):
+        self.value = _Number(value)
+        self.dataUpdated.emit(0)
+
+
+class _Add(NodeDelegateModel):
+    def __init__(self):
+        super().__init__()
+        self.inputs = {}
+        self.seen = []
+
+    def nPorts(self, portType):
+        return 2 if portType == PortType.In else 1
+
+    def dataType(self, portType, portIndex):
+        return _Number().type()
+
+    def portConnectionPolicy(self, portType, portIndex):
+        from SpatialNode.definitions import ConnectionPolicy
+
+        return ConnectionPolicy.Many
+
+    def setInData(self, nodeData, portIndex):
+        self.inputs[portIndex] = nodeData
+        self.compute()
+
+    def setInDataMany(self, inputs):
+        self.inputs.update(inputs)
+        self.compute()
+
+    def compute(self):
+        self.seen.append(
+            tuple(d.value if d else None for d in map(self.inputs.get, (0, 1)))
+        )
+        self.dataUpdated.emit(0)
+
+    def outData(self, port):
+        values = [d.value for d in self.inputs.values() if d]
+        return _Number(sum(values))
+
+    def embeddedWidget(self):
+        return None
+
+
+def _makeDiamond(scheduler):
+    registry = NodeDelegateModelRegistry()
+    registry.registerModel(_Source, "Source")
+    registry.registerModel(_Add, "Add")
+    model = DataFlowGraphModel(registry)
+
+    source = model.addNode("Source")
+    add = model.addNode("Add")
+    sink = model.addNode("Add")
+    model.addConnection(ConnectionId(source, 0, add, 0))
+    model.addConnection(ConnectionId(source, 0, add, 1))
+    model.addConnection(ConnectionId(add, 0, sink, 0))
+
+    model.setPropagationScheduler(scheduler)
+    for nodeId in (add, sink):
+        model.delegateModel(nodeId).seen.clear()
+    return model, source, add, sink
+
+
+def test_eager_propagation_glitches():
+    model, source, add, sink = _makeDiamond(None)
+
+    model.delegateModel(source).emitValue(5)
+
+    assert model.delegateModel(add).seen == [(5, 1), (5, 5)]
+    assert len(model.delegateModel(sink).seen) == 2
+
+
+def test_scheduled_propagation_is_glitch_free():
+    scheduler = PropagationScheduler()
+    model, source, add, sink = _makeDiamond(scheduler)
+
+    model.delegateModel(source).emitValue(5)
+
+    assert model.delegateModel(add).seen == [(5, 5)]
+    assert model.delegateModel(sink).seen == [(10, None)]
+    assert scheduler.waves == 1
+    assert scheduler.computes == 2
+    assert scheduler.savedComputes == 1
+
+
+def test_topological_order():
+    model, source, add, sink = _makeDiamond(None)
+    extra = model.addNode("Add")
+    model.addConnection(ConnectionId(source, 0, extra, 0))
+    model.addConnection(ConnectionId(extra, 0, sink, 1))
+
+    order = PropagationScheduler.topologicalOrder(model, [source])
+    assert order.index(source) == 0
+    assert order.index(sink) == 3
+    assert PropagationScheduler.topologicalOrder(model, [add]) == [add, sink]
@@ -0,0 +1,35 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import io
+import json
+
+import pytest
+
+from SpatialNode.scene_stream_reader import SceneStreamReader
+
+
+def test_items_across_buffer_boundaries():
+    scene = {
+        "connections": [{"inNodeId": i, "outPortIndex": 12345} for i in range(20)],
+        "nodes": [{"id": i, "caption": 'é"]', "x": -1.5e3} for i in range(10)],
+        "empty": [],
+        "version": 3,
+    }
+    data = json.dumps(scene, indent=4).encode()
+
+    for bufferSize in [1, 3, 16, 1 << 20]:
+        reader = SceneStreamReader(io.BytesIO(data), bufferSize)
+        items = list(reader.items())
+        assert [v for k, v in items if k == "nodes"] == scene["nodes"]
+        assert [v for k, v in items if k == "connections"] == scene["connections"]
+        assert ("version", 3) in items
+        assert reader.bytesRead() == len(data)
+
+
+def test_malformed():
+    with pytest.raises(ValueError):
+        list(SceneStreamReader(io.BytesIO(b'{"nodes": [1 2]}')).items())
@@ -0,0 +1,68 @@
+#  Copyright (c) 2024 Feng Yang
+#
+#  I am making my contributions/submissions to this project solely in my
+#  personal capacity and am not conveying any rights to any intellectual
+#  property of any third parties.
+
+import random
+
+from SpatialNode.topological_order import TopologicalOrder
+
+
+def _assertTopological(order, edges):
+    position = {nodeId: i for i, nodeId in enumerate(order.order())}
+    for a, b in edges:
+        assert position[a] < position[b]
+
+
+def test_reorders_on_insertion():
+    order = TopologicalOrder()
+    for nodeId in range(4):
+        order.addNode(nodeId)
+
+    assert order.addEdge(3, 2)
+    assert order.addEdge(2, 0)
+    _assertTopological(order, [(3, 2), (2, 0)])
+    assert order.wouldCreateCycle(0, 3)
+    assert not order.wouldCreateCycle(3, 0)
+    assert order.wouldCreateCycle(1, 1)
+
+
+def test_feedback_edges():
+    order = TopologicalOrder()
+    for nodeId in range(3):
+        order.addNode(nodeId)
+    order.addEdge(0, 1)
+    order.addEdge(1, 2)
+
+    assert not order.addEdge(2, 0)
+    assert order.hasCycles()
+    _assertTopological(order, [(0, 1), (1, 2)])
+
+    order.removeEdge(0, 1)
+    assert not order.hasCycles()
+    _assertTopological(order, [(1, 2), (2, 0)])
+
+    order.removeNode(2)
+    assert order.order() == [0, 1] or order.order() == [1, 0]
+
+
+def test_random_insertions():
+    rng = random.Random(1)
+    order = TopologicalOrder()
+    for nodeId in range(60):
+        order.addNode(nodeId)
+
+    edges = []
+    for _ in range(400):
+        a, b = rng.sample(range(60), 2)
+        if order.wouldCreateCycle(a, b):
+            assert not order.addEdge(a, b)
+            order.removeEdge(a, b)
+        else:
+            assert order.addEdge(a, b)
+            edges.append((a, b))
+        if edges and rng.random() < 0.2:
+            order.removeEdge(*edges.pop(rng.randrange(len(edges))))
+        _assertTopological(order, edges)
+    assert not order.hasCycles()